@@ -0,0 +1,80 @@
+"""Benchmark concurrent GETs over HTTP/2, HTTP/1.1 (httpx) and a pooled requests session.
+
+Sends the same number of GET requests to one URL through each transport, ``--concurrency`` at a time
+from a thread pool, as the monitor's workers do. Unlike the other benchmarks this one needs network
+access; point it at a host you are allowed to load, e.g. a newsletter's archive API.
+
+Usage:
+    python benchmarks/http2_transport.py URL [--requests 200] [--concurrency 16]
+"""
+
+import argparse
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Any, Callable
+
+import requests
+
+from sloan_brain_substack.client.transport import Http2Session
+from sloan_brain_substack.client.utils import create_pooled_session
+
+
+def _transports(concurrency: int) -> dict[str, Callable[[], Any]]:
+    """Get a factory for each transport compared, sized for the given concurrency."""
+    return {
+        "httpx h2": lambda: Http2Session(max_connections=concurrency, http2=True),
+        "httpx h1.1": lambda: Http2Session(max_connections=concurrency, http2=False),
+        "requests": lambda: create_pooled_session(concurrency),
+    }
+
+
+def _get(session: Any, url: str) -> str:
+    """Make one GET request; return the HTTP version it was served over, or the error's name."""
+    try:
+        response = session.get(url, timeout=30)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        return type(e).__name__
+    version = getattr(response, "http_version", None)
+    if version is None:
+        # requests exposes the version as urllib3's integer, e.g. 11
+        raw = getattr(response.raw, "version", None)
+        version = f"HTTP/{raw // 10}.{raw % 10}" if raw else "HTTP/1.1"
+    return version
+
+
+def run(url: str, count: int, concurrency: int) -> dict[str, float]:
+    """Run the benchmark for each transport and print its throughput and latency."""
+    print(f"{count} GETs of {url}, {concurrency} at a time")
+    print(f"{'transport':<12}{'req/s':>10}{'ms/req':>10}  served over")
+    results = {}
+    for name, factory in _transports(concurrency).items():
+        try:
+            session = factory()
+        except ImportError as e:
+            print(f"{name:<12}{'-':>10}{'-':>10}  skipped ({e})")
+            continue
+
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                start = time.perf_counter()
+                outcomes = Counter(executor.map(_get, repeat(session, count), repeat(url, count)))
+                elapsed = time.perf_counter() - start
+        finally:
+            session.close()
+
+        results[name] = count / elapsed
+        served = ", ".join(f"{outcome} x{n}" for outcome, n in outcomes.most_common())
+        print(f"{name:<12}{count / elapsed:>10.1f}{elapsed / count * concurrency * 1000:>10.1f}  {served}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("url", help="URL to GET, e.g. https://example.substack.com/api/v1/archive?limit=12")
+    parser.add_argument("--requests", type=int, default=200, help="GET requests sent per transport")
+    parser.add_argument("--concurrency", type=int, default=16, help="Requests in flight at a time")
+    args = parser.parse_args()
+    run(args.url, args.requests, args.concurrency)
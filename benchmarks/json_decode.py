@@ -0,0 +1,92 @@
+"""Benchmark decoding archive pages with json and orjson, with and without field projection.
+
+Builds synthetic archive pages shaped like the archive API's (each post carrying its ``body_html``)
+and reports decode time and the memory the decoded page keeps alive. No network access is needed.
+
+Usage:
+    python benchmarks/json_decode.py [--pages 50] [--posts-per-page 12] [--body-kb 40]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Iterable
+
+from sloan_brain_substack.client import utils
+from sloan_brain_substack.client.post import SUMMARY_FIELDS
+
+
+def _archive_page(page: int, posts_per_page: int, body_kb: int) -> bytes:
+    """Build one archive page as the raw JSON payload the API returns."""
+    body = "<p>" + "Lorem ipsum dolor sit amet. " * (body_kb * 1024 // 28) + "</p>"
+    items = []
+    for i in range(page * posts_per_page, (page + 1) * posts_per_page):
+        items.append({
+            "id": 100000 + i,
+            "canonical_url": f"https://example.substack.com/p/post-{i}",
+            "title": f"Post number {i}",
+            "subtitle": f"Subtitle of post {i}",
+            "description": f"Description of post {i}",
+            "audience": "everyone",
+            "post_date": "2024-01-01T00:00:00.000Z",
+            "updated_at": "2024-01-02T00:00:00.000Z",
+            "publication_id": 42,
+            "wordcount": 1200,
+            "truncated_body_text": f"Body text of post {i} " * 20,
+            "body_html": body,
+            "publishedBylines": [{"id": 7, "name": "Author", "handle": "author", "bio": "Bio " * 20}],
+            "postTags": [{"id": "t", "name": "Tag", "slug": "tag"}],
+        })
+    return json.dumps(items).encode("utf-8")
+
+
+def _decode(payloads: list[bytes], fields: Iterable[str] | None) -> tuple[float, int]:
+    """Decode every page and keep the results; return the elapsed seconds and the bytes they retain."""
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        kept = [utils.decode_json(payload, fields) for payload in payloads]
+        elapsed = time.perf_counter() - start
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return elapsed, retained
+
+
+def run(pages: int, posts_per_page: int, body_kb: int) -> dict[str, tuple[float, int]]:
+    """Run the benchmark for each available parser, with and without projection, and print the results."""
+    payloads = [_archive_page(page, posts_per_page, body_kb) for page in range(pages)]
+    payload_mb = sum(len(payload) for payload in payloads) / 1e6
+    print(f"{pages} pages of {posts_per_page} posts, {payload_mb:.1f} MB of JSON")
+    print(f"{'parser':<8}{'fields':<10}{'ms/page':>10}{'MB/s':>10}{'kept MB':>10}")
+
+    parsers = {"json": None, "orjson": utils.orjson} if utils.orjson is not None else {"json": None}
+    installed = utils.orjson
+    results = {}
+    try:
+        for name, module in parsers.items():
+            utils.orjson = module
+            for label, fields in (("all", None), ("summary", SUMMARY_FIELDS)):
+                elapsed, retained = _decode(payloads, fields)
+                results[f"{name}/{label}"] = (elapsed, retained)
+                print(
+                    f"{name:<8}{label:<10}{elapsed / pages * 1000:>10.2f}"
+                    f"{payload_mb / elapsed:>10.0f}{retained / 1e6:>10.1f}"
+                )
+    finally:
+        utils.orjson = installed
+
+    if installed is None:
+        print("orjson is not installed; pip install 'sloan-brain-substack[fast-json]' to compare")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=50, help="Archive pages decoded")
+    parser.add_argument("--posts-per-page", type=int, default=12, help="Posts per archive page")
+    parser.add_argument("--body-kb", type=int, default=40, help="Size of each post's body_html in KB")
+    args = parser.parse_args()
+    run(args.pages, args.posts_per_page, args.body_kb)
@@ -0,0 +1,80 @@
+"""Benchmark SQLite write and read throughput with and without the tuned engine profile.
+
+Simulates monitor checks: each check commits a small batch of posts in its own transaction, which is
+where synchronous=FULL and the rollback journal hurt most. No network access is needed.
+
+Usage:
+    python benchmarks/sqlite_profiles.py [--checks 500] [--posts-per-check 10] [--reads 2000]
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import insert, select
+
+from sloan_brain_substack.models import DatabaseManager, Newsletter, Post
+
+
+def _write_checks(db_manager: DatabaseManager, checks: int, posts_per_check: int) -> float:
+    """Commit one transaction of posts per simulated check; return the elapsed seconds."""
+    published = datetime(2024, 1, 1)
+    start = time.perf_counter()
+    for check in range(checks):
+        with db_manager.get_session() as session:
+            newsletter_id = session.execute(
+                insert(Newsletter).values(url=f"https://n{check}.substack.com", name=f"N{check}")
+            ).inserted_primary_key[0]
+            session.execute(
+                insert(Post),
+                [
+                    {
+                        "url": f"https://n{check}.substack.com/p/{i}",
+                        "title": f"Post {i}",
+                        "published_date": published + timedelta(days=i),
+                        "newsletter_id": newsletter_id,
+                    }
+                    for i in range(posts_per_check)
+                ],
+            )
+            session.commit()
+    return time.perf_counter() - start
+
+
+def _read_posts(db_manager: DatabaseManager, reads: int, checks: int) -> float:
+    """Load the posts of one newsletter per query, as a check's state load does; return the elapsed seconds."""
+    start = time.perf_counter()
+    with db_manager.get_session() as session:
+        for i in range(reads):
+            session.execute(select(Post.id, Post.url, Post.audience).where(Post.newsletter_id == i % checks + 1)).all()
+    return time.perf_counter() - start
+
+
+def run(checks: int, posts_per_check: int, reads: int) -> None:
+    """Run the benchmark for the default and tuned profiles and print the throughput of each."""
+    print(f"{'profile':<10}{'posts/s':>12}{'commits/s':>12}{'reads/s':>12}")
+    for tune in (False, True):
+        with tempfile.TemporaryDirectory() as directory:
+            db_manager = DatabaseManager(f"sqlite:///{Path(directory) / 'bench.db'}", tune=tune)
+            db_manager.create_tables()
+            write_seconds = _write_checks(db_manager, checks, posts_per_check)
+            read_seconds = _read_posts(db_manager, reads, checks)
+            db_manager.close()
+
+        print(
+            f"{'tuned' if tune else 'default':<10}"
+            f"{checks * posts_per_check / write_seconds:>12.0f}"
+            f"{checks / write_seconds:>12.0f}"
+            f"{reads / read_seconds:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--checks", type=int, default=500, help="Simulated checks, one transaction each")
+    parser.add_argument("--posts-per-check", type=int, default=10, help="Posts inserted per check")
+    parser.add_argument("--reads", type=int, default=2000, help="Per-newsletter post queries")
+    args = parser.parse_args()
+    run(args.checks, args.posts_per_check, args.reads)
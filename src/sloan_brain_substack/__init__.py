@@ -1,17 +1,68 @@
 """Sloan Brain Substack: A library for monitoring Substack newsletters with database persistence."""
 
-from .client import Auth, Newsletter, Post, User, Category
-from .models import DatabaseManager
-from .monitor import SubstackMonitor, MonitoringResult
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .archive import ContentArchive
+    from .async_monitor import AsyncSubstackMonitor
+    from .client import Auth, Category, Newsletter, Post, PostSummary, User
+    from .harvester import SubscriptionHarvester
+    from .models import AsyncDatabaseManager, DatabaseManager
+    from .monitor import MonitoringResult, SubstackMonitor
+    from .outbox import ChangeEvent, OutboxConsumer
 
 __version__ = "0.1.0"
+
+# Public names are imported on first access, so jobs that only use the client don't pay for
+# SQLAlchemy's declarative setup (and the monitor's imports) at startup
+_LAZY_IMPORTS = {
+    "Auth": ".client",
+    "Newsletter": ".client",
+    "Post": ".client",
+    "PostSummary": ".client",
+    "User": ".client",
+    "Category": ".client",
+    "DatabaseManager": ".models",
+    "AsyncDatabaseManager": ".models",
+    "SubstackMonitor": ".monitor",
+    "AsyncSubstackMonitor": ".async_monitor",
+    "MonitoringResult": ".monitor",
+    "OutboxConsumer": ".outbox",
+    "ChangeEvent": ".outbox",
+    "SubscriptionHarvester": ".harvester",
+    "ContentArchive": ".archive",
+}
+
 __all__ = [
     "Auth", 
     "Newsletter", 
     "Post", 
+    "PostSummary",
     "User", 
     "Category",
     "DatabaseManager",
+    "AsyncDatabaseManager",
     "SubstackMonitor", 
-    "MonitoringResult"
-] 
\ No newline at end of file
+    "AsyncSubstackMonitor",
+    "MonitoringResult",
+    "OutboxConsumer",
+    "ChangeEvent",
+    "SubscriptionHarvester",
+    "ContentArchive",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including lazily imported names."""
+    return sorted(set(globals()) | set(__all__))
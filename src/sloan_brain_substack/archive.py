@@ -0,0 +1,206 @@
+"""Cold storage of old post content in compressed archive files."""
+
+import gzip
+import json
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
+
+from sqlalchemy import select, update
+
+from .models import DatabaseManager, _add_months, _month_start
+from .models import Post as PostModel
+
+# Number of archive files whose url -> member index is kept in memory for read-back
+DEFAULT_OPEN_ARCHIVES = 4
+
+# Number of decoded gzip members (one archived batch each) kept in memory for read-back
+CACHED_MEMBERS = 8
+
+# Bytes of compressed archive read at a time
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class ContentArchive:
+    """Moves the content of old posts out of the database into gzipped JSON-lines files, one per month.
+
+    Archived posts keep their row (title, dates, hashes, ...) with ``content`` set to NULL and
+    ``content_archive`` naming the file that holds it; ``get_content`` reads either transparently.
+
+    Each archived batch is a separate gzip member of its month's file. Reading a post back only
+    decodes the member that holds it, found through an index of url -> member offset that is built
+    on the first read of a file (by decoding its members one at a time) and kept up to date by
+    later appends.
+    """
+
+    def __init__(self, directory: str, open_archives: int = DEFAULT_OPEN_ARCHIVES) -> None:
+        """Initialize the archive.
+
+        Args:
+            directory: Directory where archive files are stored
+            open_archives: Number of archive files whose index is kept in memory for read-back
+        """
+        self.directory = directory
+        self.open_archives = open_archives
+        self._indexes: OrderedDict[str, Dict[str, int]] = OrderedDict()  # file -> url -> member offset
+        self._members: OrderedDict[Tuple[str, int], Dict[str, str]] = OrderedDict()  # Decoded members
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def archive_older_than(self, db_manager: DatabaseManager, months: int = 12, batch_size: int = 500) -> int:
+        """Move the content of posts published more than ``months`` whole months ago into the archive.
+
+        Each batch is appended to the archive files before its rows are cleared, so an interrupted
+        run leaves at worst duplicate archive records, never lost content. Run it again to resume.
+
+        Args:
+            db_manager: Database manager instance
+            months: Age in months after which post content is archived
+            batch_size: Number of posts moved per transaction
+
+        Returns:
+            Number of posts whose content was archived
+        """
+        cutoff = _add_months(_month_start(datetime.utcnow()), -months)
+        archived = 0
+
+        while True:
+            with db_manager.get_session() as session:
+                rows = session.execute(
+                    select(PostModel.id, PostModel.url, PostModel.published_date, PostModel.content)
+                    .where(PostModel.published_date < cutoff)
+                    .where(PostModel.content.is_not(None))
+                    .order_by(PostModel.id)
+                    .limit(batch_size)
+                ).all()
+                if not rows:
+                    return archived
+
+                by_file: Dict[str, list] = {}
+                for row in rows:
+                    by_file.setdefault(self._file_name(row.published_date), []).append(row)
+
+                for file_name, file_rows in by_file.items():
+                    self._append(file_name, {row.url: row.content for row in file_rows})
+                    session.execute(
+                        update(PostModel)
+                        .where(PostModel.id.in_([row.id for row in file_rows]))
+                        .values(content=None, content_archive=file_name)
+                    )
+                session.commit()
+                archived += len(rows)
+
+    def get_content(self, post: PostModel) -> Optional[str]:
+        """Get a post's content, from the database row or from its archive file.
+
+        Args:
+            post: Post model instance
+
+        Returns:
+            The post content, or None if it has none
+        """
+        if post.content is not None or not post.content_archive:
+            return post.content
+        return self._read(post.content_archive, post.url)
+
+    def _file_name(self, published_date: datetime) -> str:
+        """Get the name of the archive file for posts published in a month."""
+        return f"posts-{published_date:%Y-%m}.jsonl.gz"
+
+    def _append(self, file_name: str, contents: Dict[str, str]) -> None:
+        """Append content records to an archive file as a new gzip member, and sync it to disk."""
+        path = os.path.join(self.directory, file_name)
+        with self._lock:
+            with open(path, "ab") as f:
+                offset = f.tell()
+                with gzip.GzipFile(fileobj=f, mode="wb") as gz:
+                    for url, content in contents.items():
+                        gz.write(json.dumps({"url": url, "content": content}).encode("utf-8") + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+            # A loaded index points the appended posts at the new member, which supersedes older records
+            index = self._indexes.get(file_name)
+            if index is not None:
+                index.update(dict.fromkeys(contents, offset))
+
+    def _read(self, file_name: str, url: str) -> Optional[str]:
+        """Read a post's content from its archive file, decoding only the member that holds it."""
+        with self._lock:
+            index = self._index(file_name)
+            if index is None or url not in index:
+                return None
+
+            key = (file_name, index[url])
+            contents = self._members.get(key)
+            if contents is not None:
+                self._members.move_to_end(key)
+            else:
+                with open(os.path.join(self.directory, file_name), "rb") as f:
+                    contents = _parse_records(_decode_member(f, key[1])[0])
+                self._members[key] = contents
+                while len(self._members) > CACHED_MEMBERS:
+                    self._members.popitem(last=False)
+            return contents.get(url)
+
+    def _index(self, file_name: str) -> Optional[Dict[str, int]]:
+        """Get the url -> member offset index of an archive file, building it on first use."""
+        index = self._indexes.get(file_name)
+        if index is not None:
+            self._indexes.move_to_end(file_name)
+            return index
+
+        index = {}
+        try:
+            with open(os.path.join(self.directory, file_name), "rb") as f:
+                for offset, data in _members(f):
+                    # Later members win, so a re-archived post reads back its latest content
+                    index.update(dict.fromkeys(_parse_records(data), offset))
+        except FileNotFoundError:
+            print(f"Archive file {file_name} not found in {self.directory}")
+            return None
+
+        self._indexes[file_name] = index
+        while len(self._indexes) > self.open_archives:
+            self._indexes.popitem(last=False)
+        return index
+
+
+def _decode_member(f: BinaryIO, offset: int) -> Tuple[bytes, int]:
+    """Decode the gzip member starting at ``offset``; return its data and its compressed length."""
+    f.seek(offset)
+    decoder = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    parts = []
+    read = 0
+    while not decoder.eof:
+        chunk = f.read(READ_CHUNK_SIZE)
+        if not chunk:
+            # A member cut short by an interrupted append; keep what was written before it
+            break
+        read += len(chunk)
+        parts.append(decoder.decompress(chunk))
+    return b"".join(parts), read - len(decoder.unused_data)
+
+
+def _members(f: BinaryIO) -> Iterator[Tuple[int, bytes]]:
+    """Yield the offset and data of each gzip member of an archive file, one at a time."""
+    size = os.fstat(f.fileno()).st_size
+    offset = 0
+    while offset < size:
+        data, length = _decode_member(f, offset)
+        yield offset, data
+        if length <= 0:
+            return
+        offset += length
+
+
+def _parse_records(data: bytes) -> Dict[str, str]:
+    """Parse the JSON-lines records of a member into a url -> content mapping, later records winning."""
+    contents = {}
+    # Every record ends with a newline; whatever follows the last one is a record cut short
+    for line in data.split(b"\n")[:-1]:
+        record = json.loads(line)
+        contents[record["url"]] = record["content"]
+    return contents
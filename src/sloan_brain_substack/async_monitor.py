@@ -0,0 +1,226 @@
+"""Asyncio newsletter monitoring service with database persistence."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Union
+
+from .client import Category
+from .models import AsyncDatabaseManager
+from .models import Newsletter as NewsletterModel
+from .monitor import MonitoringResult, _BaseMonitor, _monotonic_deadline, _normalize_url, _profiled
+
+
+class AsyncSubstackMonitor(_BaseMonitor):
+    """Monitors Substack newsletters and stores data in database without blocking the event loop.
+
+    Mirrors SubstackMonitor. Database work runs on an AsyncSession (via ``run_sync``, so the ORM logic is
+    shared with the sync monitor) and Substack requests run in worker threads, so fetches and writes for
+    different newsletters overlap on one loop.
+    """
+
+    db_manager: AsyncDatabaseManager
+
+    async def add_newsletter(self, url: str, name: Optional[str] = None) -> NewsletterModel:
+        """Add a newsletter to monitor.
+
+        Args:
+            url: Newsletter URL (stored normalized: with a scheme and without a trailing slash)
+            name: Optional custom name (will fetch from newsletter if not provided)
+
+        Returns:
+            Newsletter model instance
+        """
+        url = _normalize_url(url)
+        async with self.db_manager.get_session() as session:
+            existing = await session.run_sync(self._find_newsletter, url)
+            if existing:
+                return existing
+
+        # Fetch newsletter info (name, description, author) outside of the session
+        info = {"name": name} if name else await asyncio.to_thread(self._publication_info, url)
+
+        async with self.db_manager.get_session() as session:
+            return await session.run_sync(self._insert_newsletter, url, info)
+
+    async def add_newsletters(
+        self, source: Union[Iterable[str], Category], batch_size: int = 500, max_workers: int = 8
+    ) -> List[str]:
+        """Add many newsletters to monitor at once.
+
+        Args:
+            source: Newsletter URLs, or a Category whose newsletters should all be monitored
+            batch_size: Number of newsletters inserted per transaction
+            max_workers: Maximum number of concurrent metadata lookups
+
+        Returns:
+            URLs of the newsletters that were added
+        """
+        candidates = await asyncio.to_thread(self._candidate_newsletters, source)
+
+        async with self.db_manager.get_session() as session:
+            rows, unresolved = await session.run_sync(self._split_new_newsletters, candidates)
+
+        rows.extend(await asyncio.to_thread(self._resolve_publications, unresolved, max_workers))
+
+        async with self.db_manager.get_session() as session:
+            await session.run_sync(self._insert_newsletters, rows, batch_size)
+
+        return [row["url"] for row in rows]
+
+    async def check_newsletter_updates(self, newsletter_url: str) -> MonitoringResult:
+        """Check a specific newsletter for new posts and changes to known posts.
+
+        Args:
+            newsletter_url: URL of the newsletter to check
+
+        Returns:
+            MonitoringResult with information about new and changed posts found
+        """
+        return await self._check_newsletter(newsletter_url)
+
+    async def _check_newsletter(self, newsletter_url: str, inline: bool = False) -> MonitoringResult:
+        """Run ``check_newsletter_updates``, fetching on the event loop's thread if ``inline``."""
+        start = time.perf_counter()
+        async with self.db_manager.get_session() as session:
+            state = await session.run_sync(self._load_check_state, newsletter_url)
+        db_seconds = time.perf_counter() - start
+
+        if inline:
+            fetched = self._fetch_updates(state)
+        else:
+            fetched = await asyncio.to_thread(self._fetch_updates, state)
+
+        start = time.perf_counter()
+        async with self.db_manager.get_session() as session:
+            result = await session.run_sync(self._apply_updates, state, fetched)
+        result.timings["db"] = db_seconds + time.perf_counter() - start
+        return result
+
+    async def check_all_newsletters(
+        self,
+        max_concurrency: int = 8,
+        deadline: Union[datetime, timedelta, None] = None,
+        priority: str = "stalest",
+        profile: Optional[str] = None,
+    ) -> List[MonitoringResult]:
+        """Check all newsletters in the database for updates, several at a time and most urgent first.
+
+        Newsletters whose recent checks failed are skipped until their backoff expires.
+
+        Once the deadline passes no new checks are started and the checks still running are cancelled
+        (their transactions are rolled back); these newsletters are returned as skipped with
+        ``skip_reason`` "deadline" or "cancelled".
+
+        Unless the monitor was created with ``record_runs=False``, the run is stored in the
+        monitor_runs table.
+
+        If posts is partitioned (PostgreSQL), the partitions of the current and coming months are
+        created before the run starts.
+
+        Args:
+            max_concurrency: Maximum number of newsletters checked at the same time
+            deadline: Optional time at which the run stops, as a UTC datetime or a timedelta from now
+            priority: "stalest" (oldest successful check first) or "active" (most recent new post first)
+            profile: Optional profiler to run over the whole run and store with it, "cprofile" or
+                "tracemalloc"; with "cprofile" the fetches run on the event loop's thread instead of
+                worker threads, so that the profile covers them (the loop blocks while each one runs)
+
+        Returns:
+            List of MonitoringResult objects: backoff skips, then the due newsletters in priority order
+
+        Raises:
+            ValueError: If priority or profile is not a known value
+        """
+        started_at = datetime.utcnow()
+        await self._maintain_post_partitions()
+        with _profiled(profile) as run_profile:
+            results = await self._check_all(max_concurrency, deadline, priority, inline=profile == "cprofile")
+        if self.record_runs:
+            try:
+                async with self.db_manager.get_session() as session:
+                    await session.run_sync(self._store_run, self._build_run(started_at, results, run_profile))
+            except Exception as e:
+                # Losing the run record must not lose the run's results
+                print(f"Error recording monitor run: {e}")
+        return results
+
+    async def _maintain_post_partitions(self) -> None:
+        """Create the current and coming months' posts partitions before a run, if posts is partitioned."""
+        try:
+            if self._posts_partitioned is None:
+                self._posts_partitioned = await self.db_manager.posts_partitioned()
+            if self._posts_partitioned:
+                await self.db_manager.ensure_post_partitions()
+        except Exception as e:
+            # Posts still land in posts_default; the next run retries
+            print(f"Error maintaining posts partitions: {e}")
+
+    async def _check_all(
+        self, max_concurrency: int, deadline: Union[datetime, timedelta, None], priority: str, inline: bool = False
+    ) -> List[MonitoringResult]:
+        """Run the checks of ``check_all_newsletters``, fetching on the event loop's thread if ``inline``."""
+        async with self.db_manager.get_session() as session:
+            due, results = await session.run_sync(self._plan_checks, priority)
+
+        stop_at = _monotonic_deadline(deadline)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        started = set()
+
+        async def _check(url: str, name: str) -> MonitoringResult:
+            # The semaphore wakes waiters in order, so checks start in priority order
+            async with semaphore:
+                if stop_at is not None and time.monotonic() >= stop_at:
+                    return self._deadline_result(url, name)
+                started.add(url)
+                try:
+                    return await self._check_newsletter(url, inline)
+                except Exception as e:
+                    return self._failed_result(url, name, e)
+
+        tasks = [asyncio.ensure_future(_check(url, name)) for url, name in due]
+        if not tasks:
+            return results
+
+        timeout = None if stop_at is None else max(stop_at - time.monotonic(), 0)
+        await asyncio.wait(tasks, timeout=timeout)
+
+        for task, (url, name) in zip(tasks, due, strict=True):
+            if task.done():
+                results.append(task.result())
+            else:
+                task.cancel()
+                results.append(self._deadline_result(url, name, "cancelled" if url in started else "deadline"))
+        # Let cancelled checks unwind and release their sessions before returning
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return results
+
+    async def get_newsletter_stats(self, newsletter_url: str) -> dict:
+        """Get statistics for a newsletter.
+
+        Args:
+            newsletter_url: URL of the newsletter
+
+        Returns:
+            Dictionary with newsletter statistics
+        """
+        async with self.db_manager.get_session() as session:
+            return await session.run_sync(self._newsletter_stats, newsletter_url)
+
+    async def get_all_stats(self) -> List[dict]:
+        """Get statistics for every monitored newsletter with a single query.
+
+        Returns:
+            List of dictionaries with newsletter statistics
+        """
+        async with self.db_manager.get_session() as session:
+            return await session.run_sync(self._all_stats)
+
+    async def rebuild_stats(self) -> int:
+        """Recompute all newsletters' post counters from the posts table.
+
+        Returns:
+            Number of newsletters whose counters were corrected
+        """
+        async with self.db_manager.get_session() as session:
+            return await session.run_sync(self._rebuild_stats)
@@ -1,9 +1,81 @@
 """Substack API client functionality."""
 
-from .auth import Auth
-from .category import Category
-from .newsletter import Newsletter
-from .post import Post
-from .user import User, resolve_handle_redirect
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["Auth", "Newsletter", "Post", "User", "Category", "resolve_handle_redirect"]
+if TYPE_CHECKING:
+    from .auth import Auth
+    from .category import Category
+    from .handle_cache import HandleCache
+    from .newsletter import Newsletter
+    from .podcast import DownloadResult, PodcastDownloader, PodcastEpisode
+    from .post import Post, PostSummary
+    from .registry import IdentityMap, disable_identity_map, enable_identity_map
+    from .search import SearchResults, iter_search, search_newsletters
+    from .text_cache import TextCache, set_text_cache
+    from .transport import Http2Session
+    from .user import User, resolve_handle_redirect, resolve_users
+
+# Public names are imported from their modules on first access
+_LAZY_IMPORTS = {
+    "Auth": ".auth",
+    "Newsletter": ".newsletter",
+    "Post": ".post",
+    "PostSummary": ".post",
+    "User": ".user",
+    "Category": ".category",
+    "HandleCache": ".handle_cache",
+    "IdentityMap": ".registry",
+    "enable_identity_map": ".registry",
+    "disable_identity_map": ".registry",
+    "resolve_handle_redirect": ".user",
+    "resolve_users": ".user",
+    "SearchResults": ".search",
+    "iter_search": ".search",
+    "search_newsletters": ".search",
+    "TextCache": ".text_cache",
+    "set_text_cache": ".text_cache",
+    "Http2Session": ".transport",
+    "PodcastEpisode": ".podcast",
+    "PodcastDownloader": ".podcast",
+    "DownloadResult": ".podcast",
+}
+
+__all__ = [
+    "Auth",
+    "Newsletter",
+    "Post",
+    "PostSummary",
+    "User",
+    "Category",
+    "HandleCache",
+    "IdentityMap",
+    "enable_identity_map",
+    "disable_identity_map",
+    "resolve_handle_redirect",
+    "resolve_users",
+    "SearchResults",
+    "iter_search",
+    "search_newsletters",
+    "TextCache",
+    "set_text_cache",
+    "Http2Session",
+    "PodcastEpisode",
+    "PodcastDownloader",
+    "DownloadResult",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including lazily imported names."""
+    return sorted(set(globals()) | set(__all__))
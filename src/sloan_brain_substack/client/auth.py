@@ -1,55 +1,89 @@
 import json
 import os
-from typing import Any
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
 
 from .constants import DEFAULT_HEADERS
 
 
 class Auth:
-    """Handles authentication for Substack API requests."""
+    """Handles authentication for Substack API requests.
 
-    def __init__(
-        self,
-        cookies_path: str,
-    ) -> None:
+    Requests are made on a pool of sessions cloned from the loaded cookie jar, so ``get`` and ``post``
+    can be called from many threads at once; each call checks a session out for its duration. The
+    cookies file is reloaded whenever it changes on disk; if the new version can't be read (e.g. it is
+    being rewritten), the last good cookies are kept and the file is retried once it changes again.
+    """
+
+    def __init__(self, cookies_path: str, pool_size: int = 8, pool_timeout: float = None) -> None:
         """Start a session with Substack.
 
         Args:
             cookies_path: Path to retrieve session cookies from
+            pool_size: Maximum number of sessions, i.e. of concurrent requests and of connections per host
+            pool_timeout: Seconds to wait for a free session before raising TimeoutError; None waits forever
 
         """
         self.cookies_path = cookies_path
+        self.pool_size = pool_size
+        self.pool_timeout = pool_timeout
+
+        # Template session: holds the headers and the current cookie jar every pooled session is cloned from
         self.session = requests.Session()
-        self.authenticated = False
+        self._authenticated = False
 
         # Set default headers
         self.session.headers.update(DEFAULT_HEADERS)
         self.session.headers.update({"Content-Type": "application/json"})
 
+        self._lock = threading.Lock()
+        self._idle: queue.LifoQueue[requests.Session] = queue.LifoQueue()
+        self._generations: dict[requests.Session, int] = {}  # Cookie generation each pooled session holds
+        self._generation = 0
+        self._cookies_stamp: tuple[int, int] | None = None  # (mtime_ns, size) of the last file version read
+
         # Try to load existing cookies
         if os.path.exists(self.cookies_path):
-            self.load_cookies()
-            self.authenticated = True
+            self._authenticated = self.load_cookies()
         else:
             print(f"Cookies file not found at {self.cookies_path}. Please log in.")
-            self.authenticated = False
             self.session.cookies.clear()
 
+    @property
+    def authenticated(self) -> bool:
+        """Whether cookies are loaded, picking up a cookies file that was created or changed since."""
+        self._reload_if_changed()
+        return self._authenticated
+
+    @authenticated.setter
+    def authenticated(self, value: bool) -> None:
+        """Set whether cookies are loaded."""
+        self._authenticated = value
+
     def load_cookies(self) -> bool:
-        """Load cookies from file.
+        """Load cookies from file, replacing the cookies of every pooled session.
+
+        If the file can't be read the current cookies are kept, and this version of the file is not
+        retried by the automatic reload.
 
         Returns:
             True if cookies loaded successfully
 
         """
+        stamp = self._file_stamp()
         try:
             with open(self.cookies_path, "r") as f:
                 cookies = json.load(f)
 
+            jar = RequestsCookieJar()
             for cookie in cookies:
-                self.session.cookies.set(
+                jar.set(
                     cookie["name"],
                     cookie["value"],
                     domain=cookie.get("domain"),
@@ -57,12 +91,81 @@ class Auth:
                     secure=cookie.get("secure", False),
                 )
 
+            with self._lock:
+                self.session.cookies = jar
+                self._cookies_stamp = stamp
+                # Pooled sessions pick up the new jar at their next checkout
+                self._generation += 1
+
             return True
 
         except Exception as e:
             print(f"Failed to load cookies: {str(e)}")
+            with self._lock:
+                self._cookies_stamp = stamp
             return False
 
+    def _file_stamp(self) -> tuple[int, int] | None:
+        """Get the modification time and size of the cookies file, or None if it can't be read."""
+        try:
+            stat = os.stat(self.cookies_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _reload_if_changed(self) -> None:
+        """Reload the cookies if the file was created or modified since it was last read."""
+        stamp = self._file_stamp()
+        if stamp is not None and stamp != self._cookies_stamp and self.load_cookies():
+            self._authenticated = True
+
+    def _new_session(self) -> requests.Session:
+        """Clone the template session; one connection per host, since a session serves one request at a time."""
+        session = requests.Session()
+        session.headers.update(self.session.headers)
+        adapter = HTTPAdapter(pool_maxsize=1)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @contextmanager
+    def checkout(self) -> Iterator[requests.Session]:
+        """Check a session out of the pool for exclusive use by the calling thread.
+
+        Yields:
+            requests.Session: An authenticated session, returned to the pool on exit
+
+        Raises:
+            TimeoutError: If no session became free within pool_timeout
+
+        """
+        self._reload_if_changed()
+
+        with self._lock:
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                session = None
+                if len(self._generations) < self.pool_size:
+                    session = self._new_session()
+                    self._generations[session] = -1
+
+        if session is None:
+            try:
+                session = self._idle.get(timeout=self.pool_timeout)
+            except queue.Empty:
+                raise TimeoutError(f"No Substack session free after {self.pool_timeout}s") from None
+
+        with self._lock:
+            if self._generations[session] != self._generation:
+                session.cookies = self.session.cookies.copy()
+                self._generations[session] = self._generation
+
+        try:
+            yield session
+        finally:
+            self._idle.put(session)
+
     def get(self, url: str, **kwargs: Any) -> requests.Response:
         """Make a GET request. Optionally pass additional arguments to requests.get.
 
@@ -74,7 +177,8 @@ class Auth:
             requests.Response: Response object
 
         """
-        return self.session.get(url, **kwargs)
+        with self.checkout() as session:
+            return session.get(url, **kwargs)
 
     def post(self, url: str, **kwargs: Any) -> requests.Response:
         """Make a POST request. Optionally pass additional arguments to requests.post.
@@ -87,4 +191,5 @@ class Auth:
             requests.Response: Response object
 
         """
-        return self.session.post(url, **kwargs)
+        with self.checkout() as session:
+            return session.post(url, **kwargs)
@@ -1,34 +1,41 @@
-from typing import Any
+from typing import Any, Iterator
 
 import requests
 
 from .constants import DEFAULT_HEADERS, DEFAULT_TIMEOUT, SUBSTACK_API_BASE
+from .metrics import count_request
 from .newsletter import Newsletter
+from .utils import decode_json, project
 
 
-def list_all_categories() -> list[tuple[str, int]]:
+def list_all_categories(session: Any = None) -> list[tuple[str, int]]:
     """List all categories.
 
+    Args:
+        session: Optional session to make the request with, e.g. an Http2Session
+
     Returns:
         list[tuple[str, int]]: List of tuples containing (category_name, category_id)
 
     """
     endpoint_cat = f"{SUBSTACK_API_BASE}/categories"
-    r = requests.get(endpoint_cat, headers=DEFAULT_HEADERS, timeout=DEFAULT_TIMEOUT)
+    count_request()
+    r = (session or requests).get(endpoint_cat, headers=DEFAULT_HEADERS, timeout=DEFAULT_TIMEOUT)
     r.raise_for_status()
-    categories = [(i["name"], i["id"]) for i in r.json()]
+    categories = [(i["name"], i["id"]) for i in decode_json(r.content, fields=("name", "id"))]
     return categories
 
 
 class Category:
     """Top-level newsletter category."""
 
-    def __init__(self, name: str = None, id: int = None) -> None:
+    def __init__(self, name: str = None, id: int = None, session: Any = None) -> None:
         """Create a Category object.
 
         Args:
             name: The name of the category
             id: The ID of the category
+            session: Optional session shared by all requests of the category, e.g. an Http2Session
 
         Raises:
             ValueError: If neither name nor id is provided, or if the provided
@@ -39,6 +46,7 @@ class Category:
 
         self.name = name
         self.id = id
+        self.session = session
         self._newsletters_data = None
 
         # Retrieve missing components
@@ -57,7 +65,7 @@ class Category:
 
     def _get_id_from_name(self) -> None:
         """Lookup category ID based on name."""
-        categories = list_all_categories()
+        categories = list_all_categories(self.session)
         for name, id in categories:
             if name == self.name:
                 self.id = id
@@ -66,7 +74,7 @@ class Category:
 
     def _get_name_from_id(self) -> None:
         """Lookup category name based on ID."""
-        categories = list_all_categories()
+        categories = list_all_categories(self.session)
         for name, id in categories:
             if id == self.id:
                 self.name = name
@@ -86,26 +94,42 @@ class Category:
         if self._newsletters_data is not None and not force_refresh:
             return self._newsletters_data
 
+        all_newsletters = []
+        for newsletters in self.iter_newsletter_pages():
+            all_newsletters.extend(newsletters)
+
+        self._newsletters_data = all_newsletters
+        return all_newsletters
+
+    def iter_newsletter_pages(self, fields: tuple[str, ...] = None) -> Iterator[list[dict[str, Any]]]:
+        """Iterate over the pages of the category listing, fetching each page lazily.
+
+        Unlike the cached accessors, this always hits the API and lets callers stop paging early.
+
+        Args:
+            fields: Optional keys to keep from each publication, dropping the rest as each page is decoded
+
+        Yields:
+            list[dict[str, Any]]: Publication metadata dictionaries on one page
+
+        """
         endpoint = f"{SUBSTACK_API_BASE}/category/public/{self.id}/all?page="
 
-        all_newsletters = []
         page_num = 0
         more = True
         # endpoint doesn't return more than 21 pages [DAVID]
         while more and page_num <= 20:
             full_url = endpoint + str(page_num)
-            r = requests.get(full_url, headers=DEFAULT_HEADERS, timeout=DEFAULT_TIMEOUT)
+            count_request()
+            r = (self.session or requests).get(full_url, headers=DEFAULT_HEADERS, timeout=DEFAULT_TIMEOUT)
             r.raise_for_status()
 
-            resp = r.json()
-            newsletters = resp["publications"]
-            all_newsletters.extend(newsletters)
+            resp = decode_json(r.content)
+            publications = resp["publications"]
+            yield publications if fields is None else project(publications, fields)
             page_num += 1
             more = resp["more"]
 
-        self._newsletters_data = all_newsletters
-        return all_newsletters
-
     def get_newsletter_urls(self) -> list[str]:
         """Get only the URLs of newsletters in this category.
 
@@ -125,7 +149,7 @@ class Category:
 
         """
         urls = self.get_newsletter_urls()
-        return [Newsletter(url) for url in urls]
+        return [Newsletter(url, session=self.session) for url in urls]
 
     def get_newsletter_metadata(self) -> list[dict[str, Any]]:
         """Get full metadata for all newsletters in this category.
@@ -0,0 +1,188 @@
+"""Persistent cache of renamed and deleted Substack handles."""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# How long a resolved handle is trusted before it is checked again (in seconds)
+DEFAULT_HANDLE_TTL = 7 * 24 * 60 * 60
+
+RENAMED = "renamed"
+DELETED = "deleted"
+
+
+class HandleCache:
+    """Stores old->new handle mappings and known-deleted handles in a JSON file.
+
+    Resolving a renamed handle means downloading the full HTML profile page, so results are kept
+    across processes and only re-checked once they are older than the TTL. New entries are held in
+    memory until ``save`` is called (or the ``with`` block exits), which merges them with the file.
+    """
+
+    def __init__(self, path: str, ttl: float = DEFAULT_HANDLE_TTL) -> None:
+        """Create a HandleCache object.
+
+        Args:
+            path: Path of the JSON file the cache is persisted to
+            ttl: Number of seconds an entry stays valid
+
+        """
+        self.path = path
+        self.ttl = ttl
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # Keeps concurrent saves from writing stale snapshots last
+        self._dirty = False  # Whether entries were set since the last save
+
+        if os.path.exists(self.path):
+            self.load()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the cache."""
+        return f"HandleCache(path={self.path}, entries={len(self._entries)})"
+
+    def __enter__(self) -> "HandleCache":
+        """Enter the cache context."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Save the cache on exit."""
+        self.save()
+
+    def load(self) -> bool:
+        """Load entries from file.
+
+        Returns:
+            True if entries loaded successfully
+
+        """
+        try:
+            with open(self.path, "r") as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load handle cache from {self.path}: {e}")
+            return False
+
+        with self._lock:
+            self._entries = entries
+        return True
+
+    def save(self) -> None:
+        """Write the entries set since the last save to file atomically.
+
+        Entries other processes saved in the meantime are kept: for each handle, the most recently
+        checked entry wins. Does nothing if no entry was set.
+        """
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                entries = dict(self._entries)
+                self._dirty = False
+
+            try:
+                with open(self.path, "r") as f:
+                    on_disk = json.load(f)
+            except FileNotFoundError:
+                on_disk = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Overwriting unreadable handle cache at {self.path}: {e}")
+                on_disk = {}
+
+            for handle, entry in on_disk.items():
+                if handle not in entries or entry["checked_at"] > entries[handle]["checked_at"]:
+                    entries[handle] = entry
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".handle_cache.")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                os.unlink(tmp_path)
+                with self._lock:
+                    self._dirty = True
+                raise
+
+            with self._lock:
+                # Keep entries set while the file was being written
+                for handle, entry in entries.items():
+                    current = self._entries.get(handle)
+                    if current is None or entry["checked_at"] > current["checked_at"]:
+                        self._entries[handle] = entry
+
+    def get(self, handle: str) -> dict[str, Any] | None:
+        """Get the cached entry for a handle, if present and not expired.
+
+        Args:
+            handle: The handle to look up
+
+        Returns:
+            dict[str, Any] | None: Entry with "status" ("renamed" or "deleted"), "new_handle" and "checked_at"
+
+        """
+        with self._lock:
+            entry = self._entries.get(handle)
+        if entry is None or time.time() - entry["checked_at"] > self.ttl:
+            return None
+        return entry
+
+    def get_renamed(self, handle: str) -> str | None:
+        """Get the new handle for a renamed handle.
+
+        Args:
+            handle: The original handle
+
+        Returns:
+            str | None: The new handle, or None if the handle is not known to be renamed
+
+        """
+        entry = self.get(handle)
+        if entry and entry["status"] == RENAMED:
+            return entry["new_handle"]
+        return None
+
+    def is_deleted(self, handle: str) -> bool:
+        """Check whether a handle is known to be deleted.
+
+        Args:
+            handle: The handle to check
+
+        Returns:
+            bool: True if the handle was recently found to be deleted
+
+        """
+        entry = self.get(handle)
+        return bool(entry and entry["status"] == DELETED)
+
+    def set_renamed(self, old_handle: str, new_handle: str) -> None:
+        """Record that a handle has been renamed; call ``save`` to persist it.
+
+        Args:
+            old_handle: The original handle
+            new_handle: The handle it now redirects to
+
+        """
+        self._set(old_handle, RENAMED, new_handle)
+
+    def set_deleted(self, handle: str) -> None:
+        """Record that a handle no longer exists; call ``save`` to persist it.
+
+        Args:
+            handle: The deleted handle
+
+        """
+        self._set(handle, DELETED, None)
+
+    def _set(self, handle: str, status: str, new_handle: str | None) -> None:
+        """Store an entry in memory until the next save."""
+        with self._lock:
+            self._entries[handle] = {"status": status, "new_handle": new_handle, "checked_at": time.time()}
+            self._dirty = True
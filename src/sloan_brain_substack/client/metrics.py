@@ -0,0 +1,55 @@
+"""Per-thread counters of the client's work, used to attribute requests and parse time to a caller."""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Iterator
+
+
+@dataclass
+class ClientCounters:
+    """Work done by the client in one thread."""
+
+    requests: int = 0  # HTTP requests made
+    parse_seconds: float = 0.0  # Time spent decoding JSON and parsing HTML
+
+    def since(self, earlier: "ClientCounters") -> "ClientCounters":
+        """Get the work done since an earlier snapshot of the same thread's counters."""
+        return ClientCounters(self.requests - earlier.requests, self.parse_seconds - earlier.parse_seconds)
+
+
+_local = threading.local()
+
+
+def _counters() -> ClientCounters:
+    """Get the calling thread's live counters."""
+    counters = getattr(_local, "counters", None)
+    if counters is None:
+        counters = _local.counters = ClientCounters()
+    return counters
+
+
+def snapshot() -> ClientCounters:
+    """Get a copy of the calling thread's counters.
+
+    Returns:
+        ClientCounters: Counters to pass to ``ClientCounters.since`` after the measured work
+
+    """
+    return replace(_counters())
+
+
+def count_request() -> None:
+    """Count an HTTP request made by the calling thread."""
+    _counters().requests += 1
+
+
+@contextmanager
+def timed_parse() -> Iterator[None]:
+    """Add the time spent in the block to the calling thread's parse time."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _counters().parse_seconds += time.perf_counter() - start
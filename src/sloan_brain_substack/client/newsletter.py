@@ -1,27 +1,47 @@
+import xml.etree.ElementTree as ET
 from time import sleep
-from typing import Any
+from typing import Any, Callable
 
 import requests
 
 from .auth import Auth
 from .constants import DEFAULT_HEADERS, SUBSTACK_DOMAIN
-from .post import Post
+from .handle_cache import HandleCache
+from .metrics import count_request, timed_parse
+from .podcast import EPISODE_FIELDS, PodcastEpisode
+from .post import SUMMARY_FIELDS, Post, PostSummary
+from .registry import Registered
 from .user import User
+from .utils import decode_json
 
+# XML namespaces used in Substack RSS feeds
+FEED_NAMESPACES = {
+    "itunes": "http://www.itunes.com/dtds/podcast-1.0.dtd",
+    "dc": "http://purl.org/dc/elements/1.1/",
+}
 
-class Newsletter:
+
+class Newsletter(metaclass=Registered):
     """Newsletter class for interacting with Substack newsletters."""
 
-    def __init__(self, url: str, auth: Auth = None) -> None:
+    def __init__(self, url: str, auth: Auth = None, session: Any = None) -> None:
         """Create a Newsletter object.
 
         Args:
             url: The URL of the Substack newsletter
             auth: Authentication handler for accessing paywalled content
+            session: Optional session for unauthenticated requests, e.g. a pooled requests.Session or
+                an Http2Session
 
         """
         self.url = url
         self.auth = auth
+        self.session = session
+
+    @classmethod
+    def _identity_key(cls, url: str, auth: Auth = None, session: Any = None) -> tuple[str, Auth, Any]:
+        """Return the identity of a newsletter in the identity map."""
+        return (url.rstrip("/"), auth, session)
 
     def __str__(self) -> str:
         """Return a string representation of the newsletter."""
@@ -42,28 +62,38 @@ class Newsletter:
             requests.Response: The response object from the request
 
         """
+        headers = kwargs.pop("headers", None)
+        count_request()
         if self.auth and self.auth.authenticated:
-            return self.auth.get(endpoint, **kwargs)
+            return self.auth.get(endpoint, headers=headers, **kwargs)
         else:
-            return requests.get(endpoint, headers=DEFAULT_HEADERS, **kwargs)
+            return (self.session or requests).get(endpoint, headers={**DEFAULT_HEADERS, **(headers or {})}, **kwargs)
 
     def _fetch_paginated_posts(
-        self, params: dict[str, str], limit: int = None, page_size: int = 15
-    ) -> list[dict[str, Any]]:
+        self,
+        params: dict[str, str],
+        limit: int = None,
+        page_size: int = 15,
+        item_factory: Callable[[dict[str, Any]], Any] = None,
+        fields: tuple[str, ...] = None,
+    ) -> list[Any]:
         """Helper method to fetch paginated posts with different query parameters.
 
         Args:
             params: Dictionary of query parameters to include in the API request
             limit: Maximum number of posts to return
             page_size: Number of posts to retrieve per page request
+            item_factory: Optional callable applied to each item as its page arrives, so the
+                raw page can be released before the next one is fetched
+            fields: Optional keys to keep from each post, dropping the rest as each page is decoded
 
         Returns:
-            list[dict[str, Any]]: List of post data dictionaries
+            list[Any]: List of post data dictionaries, or of item_factory results
 
         """
         results = []
         offset = 0
-        batch_size = page_size  # The API default limit per request
+        batch_size = min(page_size, limit) if limit else page_size  # The API default limit per request
         more_items = True
 
         while more_items:
@@ -79,11 +109,14 @@ class Newsletter:
             response = self._make_request(endpoint, timeout=30)
             response.raise_for_status()
 
-            items = response.json()
+            items = decode_json(response.content, fields)
             if not items:
                 break
 
-            results.extend(items)
+            if item_factory is not None:
+                results.extend(item_factory(item) for item in items)
+            else:
+                results.extend(items)
 
             # Update offset for next batch
             offset += batch_size
@@ -98,55 +131,171 @@ class Newsletter:
                 more_items = False
 
             # Be nice to the API
-            sleep(0.5)
+            if more_items:
+                sleep(0.5)
 
-        # Instead of creating Post objects directly, return the URLs
+        # Without an item_factory, return the raw dicts
         # The caller will create Post objects as needed
         return results
 
-    def get_posts(self, sorting: str = "new", limit: int = None) -> list[Post]:
+    def probe_feed(self, etag: str = None, last_modified: str = None) -> dict[str, Any] | None:
+        """Cheaply check the newsletter's RSS feed for changes with a conditional GET.
+
+        Args:
+            etag: ETag returned by the previous probe, if any
+            last_modified: Last-Modified header returned by the previous probe, if any
+
+        Returns:
+            dict[str, Any] | None: Probe result with "modified" (False on a 304), "etag", "last_modified"
+            and "latest_url" (link of the newest feed item, if the feed was downloaded and parsed),
+            or None if the newsletter does not serve a feed
+
+        """
+        headers = {"Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8"}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response = self._make_request(f"{self.url}/feed", headers=headers, timeout=30)
+        if response.status_code in (404, 410):
+            return None
+        if response.status_code == 304:
+            return {"modified": False, "etag": etag, "last_modified": last_modified, "latest_url": None}
+        response.raise_for_status()
+
+        latest_url = None
+        try:
+            with timed_parse():
+                link = ET.fromstring(response.content).find("./channel/item/link")
+            if link is not None and link.text:
+                latest_url = link.text.strip()
+        except ET.ParseError:
+            pass
+
+        return {
+            "modified": True,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "latest_url": latest_url,
+        }
+
+    def get_publication_info(self) -> dict[str, str | None]:
+        """Get the publication's name, description and author from its RSS feed.
+
+        Returns:
+            dict[str, str | None]: Dictionary with "name", "description" and "author" (None when missing)
+
+        """
+        response = self._make_request(f"{self.url}/feed", headers={"Accept": "application/rss+xml"}, timeout=30)
+        response.raise_for_status()
+
+        channel = ET.fromstring(response.content).find("./channel")
+        if channel is None:
+            return {"name": None, "description": None, "author": None}
+
+        def _text(path: str) -> str | None:
+            element = channel.find(path, FEED_NAMESPACES)
+            return element.text.strip() if element is not None and element.text else None
+
+        return {
+            "name": _text("title"),
+            "description": _text("description"),
+            "author": _text("itunes:author") or _text("item/dc:creator") or _text("copyright"),
+        }
+
+    def _archive_posts(
+        self, params: dict[str, str], limit: int = None, summaries: bool = False
+    ) -> list[Post] | list[PostSummary]:
+        """Fetch archive posts as Post objects or compact PostSummary records.
+
+        Args:
+            params: Dictionary of query parameters to include in the API request
+            limit: Maximum number of posts to return
+            summaries: If True, return PostSummary records instead of Post objects
+
+        Returns:
+            list[Post] | list[PostSummary]: The archive posts
+
+        """
+        if summaries:
+            return self._fetch_paginated_posts(
+                params, limit, item_factory=PostSummary.from_archive, fields=SUMMARY_FIELDS
+            )
+        return self._fetch_paginated_posts(
+            params,
+            limit,
+            item_factory=lambda item: Post(item["canonical_url"], auth=self.auth),
+            fields=("canonical_url",),
+        )
+
+    def get_posts(
+        self, sorting: str = "new", limit: int = None, summaries: bool = False
+    ) -> list[Post] | list[PostSummary]:
         """Get posts from the newsletter with specified sorting.
 
         Args:
             sorting: Sorting order for the posts ("new", "top", "pinned", or "community")
             limit: Maximum number of posts to return
+            summaries: If True, return compact PostSummary records instead of Post objects
 
         Returns:
-            list[Post]: List of Post objects
+            list[Post] | list[PostSummary]: List of Post objects (or PostSummary records if summaries is True)
 
         """
         params = {"sort": sorting}
-        post_data = self._fetch_paginated_posts(params, limit)
-        return [Post(item["canonical_url"], auth=self.auth) for item in post_data]
+        return self._archive_posts(params, limit, summaries=summaries)
 
-    def search_posts(self, query: str, limit: int = None) -> list[Post]:
+    def search_posts(
+        self, query: str, limit: int = None, summaries: bool = False, sorting: str = "new"
+    ) -> list[Post] | list[PostSummary]:
         """Search posts in the newsletter with the given query.
 
+        Use ``search_newsletters`` to search many newsletters at once.
+
         Args:
             query: Search query string
             limit: Maximum number of posts to return
+            summaries: If True, return compact PostSummary records instead of Post objects
+            sorting: Sorting order for the results ("new" or "top")
 
         Returns:
-            list[Post]: List of Post objects matching the search query
+            list[Post] | list[PostSummary]: Posts matching the search query (PostSummary records if summaries is True)
 
         """
-        params = {"sort": "new", "search": query}
-        post_data = self._fetch_paginated_posts(params, limit)
-        return [Post(item["canonical_url"], auth=self.auth) for item in post_data]
+        params = {"sort": sorting, "search": query}
+        return self._archive_posts(params, limit, summaries=summaries)
 
-    def get_podcasts(self, limit: int = None) -> list[Post]:
+    def get_podcasts(self, limit: int = None, summaries: bool = False) -> list[Post] | list[PostSummary]:
         """Get podcast posts from the newsletter.
 
         Args:
             limit: Maximum number of podcast posts to return
+            summaries: If True, return compact PostSummary records instead of Post objects
+
+        Returns:
+            list[Post] | list[PostSummary]: Podcast posts (PostSummary records if summaries is True)
+
+        """
+        params = {"sort": "new", "type": "podcast"}
+        return self._archive_posts(params, limit, summaries=summaries)
+
+    def get_podcast_episodes(self, limit: int = None) -> list[PodcastEpisode]:
+        """Get podcast episodes with their audio URLs and durations, straight from the archive.
+
+        Use ``PodcastDownloader`` to download the audio.
+
+        Args:
+            limit: Maximum number of episodes to return
 
         Returns:
-            list[Post]: List of Post objects representing podcast posts
+            list[PodcastEpisode]: The episodes, newest first
 
         """
         params = {"sort": "new", "type": "podcast"}
-        post_data = self._fetch_paginated_posts(params, limit)
-        return [Post(item["canonical_url"], auth=self.auth) for item in post_data]
+        return self._fetch_paginated_posts(
+            params, limit, item_factory=PodcastEpisode.from_archive, fields=EPISODE_FIELDS
+        )
 
     def get_recommendations(self) -> list["Newsletter"]:
         """Get recommended publications for this newsletter.
@@ -155,19 +304,19 @@ class Newsletter:
             list[Newsletter]: List of recommended Newsletter objects
 
         """
-        # First get any post to extract the publication ID
-        posts = self.get_posts(limit=1)
+        # First get any post to extract the publication ID (the archive summary has it, no need for the full post)
+        posts = self.get_posts(limit=1, summaries=True)
         if not posts:
             return []
 
-        publication_id = posts[0].get_metadata()["publication_id"]
+        publication_id = posts[0].publication_id or posts[0].to_post(auth=self.auth).get_metadata()["publication_id"]
 
         # Now get the recommendations
         endpoint = f"{self.url}/api/v1/recommendations/from/{publication_id}"
         response = self._make_request(endpoint, timeout=30)
         response.raise_for_status()
 
-        recommendations = response.json()
+        recommendations = decode_json(response.content, fields=("recommendedPublication",))
         if not recommendations:
             return []
 
@@ -179,13 +328,18 @@ class Newsletter:
             else:
                 recommended_newsletter_urls.append(f"{recpub['subdomain']}.{SUBSTACK_DOMAIN}")
 
-        result = [Newsletter(url, auth=self.auth) for url in recommended_newsletter_urls]
+        result = [Newsletter(url, auth=self.auth, session=self.session) for url in recommended_newsletter_urls]
 
         return result
 
-    def get_authors(self) -> list[User]:
+    def get_authors(self, handle_cache: HandleCache = None) -> list[User]:
         """Get authors of the newsletter.
 
+        Use ``resolve_users`` on the handles to fetch many author profiles concurrently.
+
+        Args:
+            handle_cache: Optional persistent cache of renamed and deleted handles passed to each User
+
         Returns:
             list[User]: List of User objects representing the authors
 
@@ -193,5 +347,5 @@ class Newsletter:
         endpoint = f"{self.url}/api/v1/publication/users/ranked?public=true"
         r = self._make_request(endpoint, timeout=30)
         r.raise_for_status()
-        authors = r.json()
-        return [User(author["handle"]) for author in authors]
+        authors = decode_json(r.content, fields=("handle",))
+        return [User(author["handle"], handle_cache=handle_cache, session=self.session) for author in authors]
@@ -0,0 +1,245 @@
+"""Podcast episodes from publication archives, and a streaming, resumable audio downloader."""
+
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterable
+from urllib.parse import urlparse
+
+import requests
+
+from .constants import DEFAULT_TIMEOUT
+from .utils import create_pooled_session
+
+logger = logging.getLogger(__name__)
+
+# Archive fields needed to build a PodcastEpisode; everything else is dropped when the page is decoded
+EPISODE_FIELDS = ("id", "canonical_url", "title", "post_date", "audience", "podcast_url", "podcast_duration")
+
+# Bytes read from the network and written to disk at a time
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class PodcastEpisode:
+    """A podcast episode, as listed in a publication archive."""
+
+    id: int
+    url: str  # Canonical URL of the post
+    title: str
+    audio_url: str | None
+    duration: float | None = None  # Seconds
+    post_date: str | None = None
+    audience: str | None = None
+
+    @classmethod
+    def from_archive(cls, item: dict[str, Any]) -> "PodcastEpisode":
+        """Build an episode from a raw archive item.
+
+        Args:
+            item: A post dictionary from the archive API
+
+        Returns:
+            PodcastEpisode: The episode; audio_url is None if the post has no audio
+
+        """
+        return cls(
+            id=item.get("id"),
+            url=item["canonical_url"],
+            title=item.get("title") or "",
+            audio_url=item.get("podcast_url"),
+            duration=item.get("podcast_duration"),
+            post_date=item.get("post_date"),
+            audience=item.get("audience"),
+        )
+
+    @property
+    def file_name(self) -> str:
+        """File name the episode's audio is stored under."""
+        slug = urlparse(self.url).path.rstrip("/").rsplit("/", 1)[-1] or "episode"
+        extension = os.path.splitext(urlparse(self.audio_url or "").path)[1] or ".mp3"
+        return f"{self.id}-{slug}{extension}"
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of downloading one episode."""
+
+    episode: PodcastEpisode
+    path: str
+    status: str  # "downloaded", "resumed", "skipped" or "failed"
+    bytes_written: int = 0
+    error: str | None = None
+
+
+class PodcastDownloader:
+    """Streams podcast audio to disk in fixed-size chunks, several episodes at a time.
+
+    Each file's size and ETag are kept in a ``<file>.json`` sidecar: complete files whose ETag and
+    size still match the server are skipped, and interrupted downloads (left as ``<file>.part``) are
+    resumed with an HTTP Range request when the server supports it and the audio hasn't changed.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_workers: int = 4,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        retries: int = 2,
+        session: requests.Session = None,
+    ) -> None:
+        """Create a PodcastDownloader object.
+
+        Args:
+            directory: Directory where audio files are stored
+            max_workers: Maximum number of episodes downloaded at the same time
+            chunk_size: Bytes read and written at a time, bounding memory per download
+            retries: Number of times an interrupted download is resumed within one call
+            session: Optional requests session to download with (default: a pooled session)
+
+        """
+        self.directory = directory
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.session = session or create_pooled_session(max_workers)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def download_all(self, episodes: Iterable[PodcastEpisode]) -> list[DownloadResult]:
+        """Download many episodes concurrently.
+
+        Args:
+            episodes: Episodes to download; those without audio are reported as failed
+
+        Returns:
+            list[DownloadResult]: One result per episode, in the order given
+
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.download, episodes))
+
+    def download(self, episode: PodcastEpisode) -> DownloadResult:
+        """Download one episode, skipping it if it is already on disk and resuming a partial download.
+
+        Args:
+            episode: Episode to download
+
+        Returns:
+            DownloadResult: The outcome; errors are reported in the result rather than raised
+
+        """
+        path = os.path.join(self.directory, episode.file_name)
+        if not episode.audio_url:
+            return DownloadResult(episode, path, "failed", error="Episode has no audio URL")
+
+        try:
+            remote = self._head(episode.audio_url)
+            if self._is_complete(path, remote):
+                return DownloadResult(episode, path, "skipped")
+
+            status = "downloaded"
+            written = 0
+            for attempt in range(self.retries + 1):
+                try:
+                    resumed, chunk_bytes = self._stream(episode.audio_url, path, remote)
+                    written += chunk_bytes
+                    if resumed:
+                        status = "resumed"
+                    break
+                except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                    if attempt == self.retries:
+                        raise
+                    logger.debug(f"Download of {episode.audio_url} interrupted ({e}), resuming")
+                    status = "resumed"
+
+            return DownloadResult(episode, path, status, bytes_written=written)
+
+        except Exception as e:
+            logger.debug(f"Failed to download {episode.audio_url}: {e}")
+            return DownloadResult(episode, path, "failed", error=str(e))
+
+    def _head(self, audio_url: str) -> dict[str, Any]:
+        """Get the size, ETag and Range support of the audio, as far as the server tells."""
+        try:
+            r = self.session.head(audio_url, allow_redirects=True, timeout=DEFAULT_TIMEOUT)
+            r.raise_for_status()
+        except requests.RequestException:
+            # Some hosts don't answer HEAD; the download response is used instead
+            return {"size": None, "etag": None, "ranges": False}
+
+        length = r.headers.get("Content-Length")
+        return {
+            "size": int(length) if length and length.isdigit() else None,
+            "etag": r.headers.get("ETag"),
+            "ranges": r.headers.get("Accept-Ranges", "").lower() == "bytes",
+        }
+
+    def _read_sidecar(self, path: str) -> dict[str, Any]:
+        """Read the size and ETag recorded for a file, if any."""
+        try:
+            with open(f"{path}.json", "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_sidecar(self, path: str, size: int | None, etag: str | None) -> None:
+        """Record the size and ETag of the audio a file holds."""
+        with open(f"{path}.json", "w") as f:
+            json.dump({"size": size, "etag": etag}, f)
+
+    def _is_complete(self, path: str, remote: dict[str, Any]) -> bool:
+        """Whether the complete file on disk still matches the server's size and ETag."""
+        if not os.path.exists(path):
+            return False
+        sidecar = self._read_sidecar(path)
+        if remote["etag"] and sidecar.get("etag") != remote["etag"]:
+            return False
+        size = remote["size"] if remote["size"] is not None else sidecar.get("size")
+        return size is not None and os.path.getsize(path) == size
+
+    def _stream(self, audio_url: str, path: str, remote: dict[str, Any]) -> tuple[bool, int]:
+        """Stream the audio into ``<path>.part``, resuming it if possible, then move it into place.
+
+        Returns:
+            Whether the download resumed a partial file, and the number of bytes written
+
+        """
+        part_path = f"{path}.part"
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+
+        # Only resume a partial file of the same audio
+        sidecar = self._read_sidecar(path)
+        if offset and not (remote["ranges"] and remote["etag"] and sidecar.get("etag") == remote["etag"]):
+            offset = 0
+
+        headers = {}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = remote["etag"]
+        self._write_sidecar(path, remote["size"], remote["etag"])
+
+        written = 0
+        with self.session.get(audio_url, headers=headers, stream=True, timeout=DEFAULT_TIMEOUT) as r:
+            if r.status_code == 416 and remote["size"] is not None and offset == remote["size"]:
+                # The partial file was already complete
+                os.replace(part_path, path)
+                return True, 0
+            r.raise_for_status()
+
+            etag = r.headers.get("ETag") or remote["etag"]
+            resumed = offset > 0 and r.status_code == 206
+            with open(part_path, "ab" if resumed else "wb") as f:
+                for chunk in r.iter_content(chunk_size=self.chunk_size):
+                    f.write(chunk)
+                    written += len(chunk)
+
+        size = os.path.getsize(part_path)
+        if remote["size"] is not None and size != remote["size"]:
+            raise requests.ConnectionError(f"Incomplete download: {size} of {remote['size']} bytes")
+
+        # Record what the complete file holds, so later runs can skip it even when HEAD isn't answered
+        self._write_sidecar(path, size, etag)
+        os.replace(part_path, path)
+        return resumed, written
@@ -1,14 +1,21 @@
+import hashlib
 from typing import Any
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
 
 from .auth import Auth
 from .constants import DEFAULT_HEADERS, DEFAULT_TIMEOUT
+from .metrics import count_request, timed_parse
+from .registry import Registered
+from .text_cache import get_text_cache
+from .utils import decode_json
 
+# Bump whenever Post._parse_html_content changes its output, to invalidate cached texts
+PARSER_VERSION = 1
 
-class Post:
+
+class Post(metaclass=Registered):
     """A Substack post."""
 
     def __init__(self, url: str, auth: Auth = None) -> None:
@@ -30,6 +37,11 @@ class Post:
         self.endpoint = f"{self.base_url}/api/v1/posts/{self.slug}"
         self._post_data = None  # Cache for post data
 
+    @classmethod
+    def _identity_key(cls, url: str, auth: Auth = None) -> tuple[str, Auth]:
+        """Return the identity of a post in the identity map."""
+        return (url, auth)
+
     def __str__(self) -> str:
         """Return a string representation of the post."""
         return f"Post: {self.url}"
@@ -52,13 +64,14 @@ class Post:
             return self._post_data
 
         # Use authenticated session if available
+        count_request()
         if self.auth and self.auth.authenticated:
             r = self.auth.get(self.endpoint, timeout=30)
         else:
             r = requests.get(self.endpoint, headers=DEFAULT_HEADERS, timeout=DEFAULT_TIMEOUT)
         r.raise_for_status()
 
-        self._post_data = r.json()
+        self._post_data = decode_json(r.content)
         return self._post_data
 
     def get_metadata(self, force_refresh: bool = False) -> dict[str, Any]:
@@ -98,8 +111,17 @@ class Post:
         if raw_html:
             return html_content
 
-        # Parse HTML and return clean text
-        return self._parse_html_content(html_content)
+        # Parse HTML and return clean text, reusing the result for an unchanged body
+        cache = get_text_cache()
+        if cache is None:
+            return self._parse_html_content(html_content)
+
+        key = f"v{PARSER_VERSION}-{content_fingerprint(html_content)}"
+        text = cache.get(key)
+        if text is None:
+            text = self._parse_html_content(html_content)
+            cache.set(key, text)
+        return text
 
     def _parse_html_content(self, html_content: str) -> str:
         """Parse HTML content into clean, readable text.
@@ -111,14 +133,18 @@ class Post:
             str: Clean, formatted text
 
         """
-        soup = BeautifulSoup(html_content, "html.parser")
+        # bs4 is only imported once HTML actually needs parsing
+        from bs4 import BeautifulSoup
+
+        with timed_parse():
+            soup = BeautifulSoup(html_content, "html.parser")
 
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+            # Remove script and style elements
+            for script in soup(["script", "style"]):
+                script.decompose()
 
-        # Get text and clean it up
-        text = soup.get_text()
+            # Get text and clean it up
+            text = soup.get_text()
 
         # Clean up whitespace
         lines = (line.strip() for line in text.splitlines())
@@ -136,3 +162,125 @@ class Post:
         """
         data = self._fetch_post_data()
         return data.get("audience") == "only_paid"
+
+
+# Archive fields that change when a post is edited or its paywall is flipped
+FINGERPRINT_FIELDS = ("title", "subtitle", "description", "audience", "wordcount", "truncated_body_text", "updated_at")
+
+# Archive fields needed to build a PostSummary; everything else is dropped when the page is decoded
+SUMMARY_FIELDS = ("id", "canonical_url", "post_date", "publication_id", *FINGERPRINT_FIELDS)
+
+
+def archive_fingerprint(item: dict[str, Any]) -> str:
+    """Compute a short fingerprint of an archive item's editable fields.
+
+    Args:
+        item: A post dictionary from the archive API
+
+    Returns:
+        str: Hex digest that changes whenever the archive summary of the post changes
+
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for field in FINGERPRINT_FIELDS:
+        digest.update(repr(item.get(field)).encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+def content_fingerprint(html_content: str) -> str:
+    """Compute a fingerprint of a post body.
+
+    Args:
+        html_content: Raw HTML content of the post
+
+    Returns:
+        str: SHA-256 hex digest of the content
+
+    """
+    return hashlib.sha256(html_content.encode("utf-8")).hexdigest()
+
+
+class PostSummary:
+    """A compact summary of a Substack post, as listed in a publication archive.
+
+    Holds only the fields needed to identify and triage a post, so large archive crawls don't
+    keep every raw archive dict (or a full Post object) alive. Use ``to_post`` to get the full post.
+    """
+
+    __slots__ = ("id", "url", "title", "post_date", "audience", "publication_id", "updated_at", "fingerprint")
+
+    def __init__(
+        self,
+        id: int,
+        url: str,
+        title: str,
+        post_date: str | None = None,
+        audience: str | None = None,
+        publication_id: int | None = None,
+        updated_at: str | None = None,
+        fingerprint: str | None = None,
+    ) -> None:
+        """Create a PostSummary object.
+
+        Args:
+            id: Substack's internal post ID
+            url: The canonical URL of the post
+            title: The title of the post
+            post_date: ISO 8601 publication timestamp, as returned by the API
+            audience: The post audience (e.g. "everyone", "only_paid")
+            publication_id: Substack's internal ID of the publication
+            updated_at: ISO 8601 timestamp of the last edit, if the archive reports one
+            fingerprint: Fingerprint of the archive summary, see ``archive_fingerprint``
+
+        """
+        self.id = id
+        self.url = url
+        self.title = title
+        self.post_date = post_date
+        self.audience = audience
+        self.publication_id = publication_id
+        self.updated_at = updated_at
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def from_archive(cls, item: dict[str, Any]) -> "PostSummary":
+        """Build a summary from a raw archive item.
+
+        Args:
+            item: A post dictionary from the archive API
+
+        Returns:
+            PostSummary: The compact summary
+
+        """
+        return cls(
+            id=item.get("id"),
+            url=item["canonical_url"],
+            title=item.get("title") or "",
+            post_date=item.get("post_date"),
+            audience=item.get("audience"),
+            publication_id=item.get("publication_id"),
+            updated_at=item.get("updated_at"),
+            fingerprint=archive_fingerprint(item),
+        )
+
+    def __str__(self) -> str:
+        """Return a string representation of the post summary."""
+        return f"PostSummary: {self.url}"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the post summary."""
+        return f"PostSummary(id={self.id}, url={self.url})"
+
+    def to_post(self, auth: Auth = None) -> Post:
+        """Upgrade the summary to a full Post object.
+
+        Args:
+            auth: Authentication handler for accessing paywalled content
+
+        Returns:
+            Post: The full post, fetched lazily on first access
+
+        """
+        return Post(self.url, auth=auth)
@@ -0,0 +1,118 @@
+"""Opt-in, process-wide identity map for client objects."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+# Default bounds for the identity map
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_TTL = 3600  # seconds
+
+
+class IdentityMap:
+    """Bounded LRU registry of shared client objects with a time-to-live."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl: float = DEFAULT_TTL) -> None:
+        """Create an IdentityMap object.
+
+        Args:
+            max_size: Maximum number of objects kept; the least recently used are evicted first
+            ttl: Number of seconds an object is shared before a fresh one is created
+
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of objects in the map."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the map."""
+        return f"IdentityMap(max_size={self.max_size}, ttl={self.ttl}, entries={len(self._entries)})"
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Get the shared object for a key, creating it if needed.
+
+        Args:
+            key: Identity of the object
+            factory: Callable building the object when no live one exists
+
+        Returns:
+            Any: The shared object
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] <= self.ttl:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+            instance = factory()
+            self._entries[key] = (now, instance)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            return instance
+
+    def clear(self) -> None:
+        """Remove all objects from the map."""
+        with self._lock:
+            self._entries.clear()
+
+
+_identity_map: IdentityMap | None = None
+
+
+def enable_identity_map(max_size: int = DEFAULT_MAX_SIZE, ttl: float = DEFAULT_TTL) -> IdentityMap:
+    """Share Post, User and Newsletter objects across the process.
+
+    While enabled, constructing ``Post(url)``, ``User(handle)`` or ``Newsletter(url)`` again returns the
+    existing instance (and its cached data) until it expires or is evicted.
+
+    Args:
+        max_size: Maximum number of objects kept
+        ttl: Number of seconds an object is shared before a fresh one is created
+
+    Returns:
+        IdentityMap: The active identity map
+
+    """
+    global _identity_map
+    _identity_map = IdentityMap(max_size=max_size, ttl=ttl)
+    return _identity_map
+
+
+def disable_identity_map() -> None:
+    """Stop sharing client objects and drop the identity map."""
+    global _identity_map
+    _identity_map = None
+
+
+def get_identity_map() -> IdentityMap | None:
+    """Get the active identity map.
+
+    Returns:
+        IdentityMap | None: The identity map, or None if it is not enabled
+
+    """
+    return _identity_map
+
+
+class Registered(type):
+    """Metaclass that returns shared instances from the identity map when it is enabled.
+
+    Classes using it implement an ``_identity_key`` classmethod with the same signature as ``__init__``.
+    """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        """Create an instance, or return the shared one for the same identity."""
+        identity_map = _identity_map
+        if identity_map is None:
+            return super().__call__(*args, **kwargs)
+        key = (cls, cls._identity_key(*args, **kwargs))
+        return identity_map.get_or_create(key, lambda: super(Registered, cls).__call__(*args, **kwargs))
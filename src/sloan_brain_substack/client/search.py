@@ -0,0 +1,140 @@
+"""Search across many Substack newsletters at once."""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+
+from .auth import Auth
+from .newsletter import Newsletter
+from .post import PostSummary
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SearchResults:
+    """Merged results of a search across many newsletters."""
+
+    posts: list[PostSummary] = field(default_factory=list)
+    completed: list[str] = field(default_factory=list)  # Newsletters that returned in time
+    timed_out: list[str] = field(default_factory=list)  # Newsletters still pending at the deadline
+    failed: dict[str, str] = field(default_factory=dict)  # Newsletter URL -> error message
+
+    @property
+    def partial(self) -> bool:
+        """Whether some newsletters are missing from the results."""
+        return bool(self.timed_out or self.failed)
+
+
+def iter_search(
+    newsletters: Iterable[str | Newsletter],
+    query: str,
+    per_newsletter_limit: int = 10,
+    max_workers: int = 8,
+    timeout: float = None,
+    auth: Auth = None,
+    sorting: str = "new",
+    results: SearchResults = None,
+) -> Iterator[tuple[str, list[PostSummary]]]:
+    """Search many newsletters concurrently, yielding each newsletter's results as they arrive.
+
+    Args:
+        newsletters: Newsletter URLs or Newsletter objects to search
+        query: Search query string
+        per_newsletter_limit: Maximum number of results taken from each newsletter
+        max_workers: Maximum number of newsletters searched at the same time
+        timeout: Global deadline in seconds; newsletters still pending when it passes are abandoned
+        auth: Authentication handler for newsletters given as URLs
+        sorting: Sorting order passed to each newsletter's search ("new" or "top")
+        results: Optional SearchResults that records completed, timed-out and failed newsletters
+
+    Yields:
+        tuple[str, list[PostSummary]]: Newsletter URL and its search results, in completion order
+
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    clients = [item if isinstance(item, Newsletter) else Newsletter(item, auth=auth) for item in newsletters]
+
+    # Not a context manager: on a deadline we return without waiting for slow hosts
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending: dict[Future, str] = {
+        executor.submit(client.search_posts, query, per_newsletter_limit, True, sorting): client.url
+        for client in clients
+    }
+    try:
+        while pending:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                url = pending.pop(future)
+                try:
+                    posts = future.result()
+                except Exception as e:
+                    logger.debug(f"Search failed for {url}: {e}")
+                    if results is not None:
+                        results.failed[url] = str(e)
+                    continue
+                if results is not None:
+                    results.completed.append(url)
+                yield url, posts
+    finally:
+        if results is not None:
+            results.timed_out.extend(pending.values())
+        # Requests already in flight can't be interrupted; they finish in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def search_newsletters(
+    newsletters: Iterable[str | Newsletter],
+    query: str,
+    per_newsletter_limit: int = 10,
+    max_workers: int = 8,
+    timeout: float = None,
+    auth: Auth = None,
+    sort_by: str = "date",
+    limit: int = None,
+) -> SearchResults:
+    """Search many newsletters concurrently and merge the results.
+
+    Args:
+        newsletters: Newsletter URLs or Newsletter objects to search
+        query: Search query string
+        per_newsletter_limit: Maximum number of results taken from each newsletter
+        max_workers: Maximum number of newsletters searched at the same time
+        timeout: Global deadline in seconds; partial results are returned when it passes
+        auth: Authentication handler for newsletters given as URLs
+        sort_by: "date" to merge newest first, or "relevance" to interleave each newsletter's
+            best-ranked results first
+        limit: Maximum number of merged results to return
+
+    Returns:
+        SearchResults: Merged posts plus the newsletters that completed, timed out or failed
+
+    Raises:
+        ValueError: If sort_by is not "date" or "relevance"
+
+    """
+    if sort_by not in ("date", "relevance"):
+        raise ValueError(f"sort_by must be 'date' or 'relevance', not {sort_by!r}")
+
+    results = SearchResults()
+    sorting = "top" if sort_by == "relevance" else "new"
+    ranked = []
+    for _, posts in iter_search(
+        newsletters, query, per_newsletter_limit, max_workers, timeout, auth, sorting, results=results
+    ):
+        ranked.extend(enumerate(posts))
+
+    if sort_by == "relevance":
+        # Round-robin by rank within each newsletter, newest first among equal ranks
+        ranked.sort(key=lambda item: item[1].post_date or "", reverse=True)
+        ranked.sort(key=lambda item: item[0])
+    else:
+        ranked.sort(key=lambda item: item[1].post_date or "", reverse=True)
+
+    results.posts = [post for _, post in ranked[:limit]]
+    return results
@@ -0,0 +1,185 @@
+"""Memoization of HTML to text conversion for post bodies."""
+
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+# Default number of parsed texts kept in memory
+DEFAULT_TEXT_CACHE_SIZE = 1024
+
+# Default number of parsed texts kept in a cache directory
+DEFAULT_TEXT_CACHE_FILES = 10_000
+
+# Share of max_files kept when a full directory is pruned, so pruning doesn't run on every write
+_PRUNE_TO = 0.9
+
+
+class TextCache:
+    """LRU cache of parsed post text, optionally persisted as files in a directory.
+
+    Keys are built by the caller from a hash of the HTML and the parser version, so an unchanged body is
+    never parsed twice and a parser change invalidates every entry. The directory is bounded too: once
+    it holds more than ``max_files`` texts, the least recently used ones (by file modification time,
+    which reads refresh) are deleted, which also clears out entries of older parser versions.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_TEXT_CACHE_SIZE,
+        directory: str | None = None,
+        max_files: int = DEFAULT_TEXT_CACHE_FILES,
+    ) -> None:
+        """Create a TextCache object.
+
+        Args:
+            maxsize: Maximum number of texts kept in memory
+            directory: Optional directory where texts are also stored, shared across processes
+            max_files: Maximum number of texts kept in the directory
+
+        """
+        self.maxsize = maxsize
+        self.directory = directory
+        self.max_files = max_files
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._file_count = 0
+
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            self._file_count = len(self._files())
+
+    def __len__(self) -> int:
+        """Return the number of texts in memory."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the cache."""
+        return f"TextCache(maxsize={self.maxsize}, directory={self.directory}, max_files={self.max_files})"
+
+    def _path(self, key: str) -> str:
+        """Get the file path of a key in the cache directory."""
+        return os.path.join(self.directory, f"{key}.txt")
+
+    def _files(self) -> list[os.DirEntry]:
+        """List the text files in the cache directory."""
+        with os.scandir(self.directory) as entries:
+            return [entry for entry in entries if entry.name.endswith(".txt") and entry.is_file()]
+
+    def get(self, key: str) -> str | None:
+        """Get a cached text.
+
+        Args:
+            key: Cache key of the text
+
+        Returns:
+            str | None: The text, or None if it is not cached
+
+        """
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                return text
+
+        if not self.directory:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            # Mark the file as recently used, so pruning keeps it
+            os.utime(path)
+        except OSError:
+            pass
+        self._remember(key, text)
+        return text
+
+    def set(self, key: str, text: str) -> None:
+        """Cache a text.
+
+        Args:
+            key: Cache key of the text
+            text: The parsed text
+
+        """
+        self._remember(key, text)
+        if not self.directory:
+            return
+
+        path = self._path(key)
+        is_new = not os.path.exists(path)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".text.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+
+        with self._lock:
+            if is_new:
+                self._file_count += 1
+            if self._file_count > self.max_files:
+                self._prune()
+
+    def clear(self) -> None:
+        """Remove all texts from memory (files in the directory are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def _prune(self) -> None:
+        """Delete the least recently used files until the directory is back under max_files."""
+        files = []
+        for entry in self._files():
+            try:
+                files.append((entry.stat().st_mtime_ns, entry.path))
+            except FileNotFoundError:
+                # Pruned by another process sharing the directory
+                continue
+        files.sort()
+
+        keep = int(self.max_files * _PRUNE_TO)
+        for _, path in files[: max(len(files) - keep, 0)]:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+        self._file_count = min(len(files), keep)
+
+    def _remember(self, key: str, text: str) -> None:
+        """Store a text in memory, evicting the least recently used ones."""
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+_text_cache: TextCache | None = TextCache()
+
+
+def get_text_cache() -> TextCache | None:
+    """Get the text cache used by ``Post.get_content``.
+
+    Returns:
+        TextCache | None: The active cache, or None if caching is disabled
+
+    """
+    return _text_cache
+
+
+def set_text_cache(cache: TextCache | None) -> None:
+    """Replace the text cache used by ``Post.get_content``, e.g. to persist it to a directory.
+
+    Args:
+        cache: The cache to use, or None to disable caching
+
+    """
+    global _text_cache
+    _text_cache = cache
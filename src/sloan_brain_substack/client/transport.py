@@ -0,0 +1,133 @@
+"""Optional HTTP/2 transport built on httpx, usable wherever the client accepts a requests session."""
+
+from typing import Any
+
+import requests
+
+from .constants import DEFAULT_HEADERS, DEFAULT_TIMEOUT
+
+
+class Http2Response:
+    """Wraps an httpx response in the subset of the requests.Response API the client uses."""
+
+    def __init__(self, response: Any) -> None:
+        """Create an Http2Response object.
+
+        Args:
+            response: The httpx.Response to wrap
+
+        """
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.url = str(response.url)
+        self.http_version = response.http_version  # "HTTP/2" or "HTTP/1.1"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the response."""
+        return f"<Http2Response [{self.status_code}] {self.http_version}>"
+
+    @property
+    def content(self) -> bytes:
+        """Response body as bytes."""
+        return self._response.content
+
+    @property
+    def text(self) -> str:
+        """Response body decoded as text."""
+        return self._response.text
+
+    def json(self, **kwargs: Any) -> Any:
+        """Decode the response body as JSON."""
+        return self._response.json(**kwargs)
+
+    def raise_for_status(self) -> None:
+        """Raise requests.HTTPError for 4xx and 5xx responses, like requests does.
+
+        Raises:
+            requests.HTTPError: If the response has an error status code
+        """
+        if 400 <= self.status_code < 600:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class Http2Session:
+    """Drop-in for requests.Session that multiplexes concurrent requests over one HTTP/2 connection per host.
+
+    Hosts that don't negotiate h2 (e.g. some custom-domain newsletters) are transparently served over
+    HTTP/1.1 by httpx. Transport errors are raised as the matching requests exceptions, so existing
+    error handling keeps working. Requires the ``h2`` package (``pip install "httpx[http2]"``).
+    """
+
+    def __init__(self, max_connections: int = 20, http2: bool = True) -> None:
+        """Create an Http2Session object.
+
+        Args:
+            max_connections: Maximum number of connections, across all hosts
+            http2: Whether to offer HTTP/2; False gives an HTTP/1.1 httpx session for comparison
+
+        Raises:
+            ImportError: If http2 is True and the h2 package is not installed
+
+        """
+        import httpx
+
+        self._httpx = httpx
+        self.headers = dict(DEFAULT_HEADERS)
+        self._client = httpx.Client(
+            http2=http2,
+            headers=self.headers,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=DEFAULT_TIMEOUT,
+        )
+
+    def __enter__(self) -> "Http2Session":
+        """Enter the session context."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Close the session on exit."""
+        self.close()
+
+    def get(
+        self,
+        url: str,
+        headers: dict[str, str] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        allow_redirects: bool = True,
+        params: dict[str, Any] = None,
+    ) -> Http2Response:
+        """Make a GET request.
+
+        Args:
+            url: URL to request
+            headers: Optional headers (merged with the session headers)
+            timeout: Request timeout in seconds
+            allow_redirects: Whether to follow redirects
+            params: Optional query parameters
+
+        Returns:
+            Http2Response: The response object
+
+        Raises:
+            requests.Timeout: If the request timed out
+            requests.ConnectionError: If the connection failed
+            requests.RequestException: For any other transport error
+
+        """
+        httpx = self._httpx
+        try:
+            response = self._client.get(
+                url, headers=headers, timeout=timeout, follow_redirects=allow_redirects, params=params
+            )
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.NetworkError as e:
+            raise requests.ConnectionError(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.RequestException(str(e)) from e
+        return Http2Response(response)
+
+    def close(self) -> None:
+        """Close all connections."""
+        self._client.close()
@@ -1,75 +1,135 @@
 import logging
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable
 from urllib.parse import urlparse
 
 import requests
 
 from .constants import DEFAULT_HEADERS, DEFAULT_TIMEOUT, SUBSTACK_BASE_URL, SUBSTACK_DOMAIN
+from .handle_cache import HandleCache
+from .registry import Registered
+from .utils import create_pooled_session, decode_json
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
 
-def resolve_handle_redirect(old_handle: str, timeout: int = DEFAULT_TIMEOUT) -> str | None:
+def _lookup_handle_redirect(
+    old_handle: str, timeout: int = DEFAULT_TIMEOUT, session: requests.Session = None
+) -> str | None:
+    """Follow the public profile page redirect of a handle.
+
+    Args:
+        old_handle: The original handle that may have been renamed
+        timeout: Request timeout in seconds
+        session: Optional session whose connection pool should be used
+
+    Returns:
+        The new handle if renamed, None if there is no redirect
+
+    Raises:
+        requests.RequestException: If the profile page could not be requested
+
+    """
+    # Make request to the public profile page with redirects enabled
+    response = (session or requests).get(
+        f"{SUBSTACK_BASE_URL}/@{old_handle}",
+        headers=DEFAULT_HEADERS,
+        timeout=timeout,
+        allow_redirects=True,
+    )
+
+    # If we got a successful response, check if we were redirected
+    if response.status_code == 200:
+        # Parse the final URL to extract the handle
+        parsed_url = urlparse(response.url)
+        path_parts = parsed_url.path.strip("/").split("/")
+
+        # Check if this is a profile URL (starts with @)
+        if path_parts and path_parts[0].startswith("@"):
+            new_handle = path_parts[0][1:]  # Remove the @ prefix
+
+            # Only return if it's actually different
+            if new_handle and new_handle != old_handle:
+                logger.info(f"Handle redirect detected: {old_handle} -> {new_handle}")
+                return new_handle
+    elif response.status_code >= 500:
+        # Server errors say nothing about whether the handle exists
+        response.raise_for_status()
+
+    return None
+
+
+def resolve_handle_redirect(
+    old_handle: str, timeout: int = DEFAULT_TIMEOUT, session: requests.Session = None
+) -> str | None:
     """Resolve a potentially renamed Substack handle by following redirects.
 
     Args:
         old_handle: The original handle that may have been renamed
         timeout: Request timeout in seconds
+        session: Optional session whose connection pool should be used
 
     Returns:
         The new handle if renamed, None if no redirect or on error
 
     """
     try:
-        # Make request to the public profile page with redirects enabled
-        response = requests.get(
-            f"{SUBSTACK_BASE_URL}/@{old_handle}",
-            headers=DEFAULT_HEADERS,
-            timeout=timeout,
-            allow_redirects=True,
-        )
-
-        # If we got a successful response, check if we were redirected
-        if response.status_code == 200:
-            # Parse the final URL to extract the handle
-            parsed_url = urlparse(response.url)
-            path_parts = parsed_url.path.strip("/").split("/")
-
-            # Check if this is a profile URL (starts with @)
-            if path_parts and path_parts[0].startswith("@"):
-                new_handle = path_parts[0][1:]  # Remove the @ prefix
-
-                # Only return if it's actually different
-                if new_handle and new_handle != old_handle:
-                    logger.info(f"Handle redirect detected: {old_handle} -> {new_handle}")
-                    return new_handle
-
-        return None
-
+        return _lookup_handle_redirect(old_handle, timeout=timeout, session=session)
     except requests.RequestException as e:
         logger.debug(f"Error resolving handle redirect for {old_handle}: {e}")
         return None
 
 
-class User:
+class User(metaclass=Registered):
     """User class for interacting with Substack user profiles."""
 
-    def __init__(self, username: str, follow_redirects: bool = True) -> None:
+    def __init__(
+        self,
+        username: str,
+        follow_redirects: bool = True,
+        handle_cache: HandleCache = None,
+        session: requests.Session = None,
+    ) -> None:
         """Create a User object.
 
         Args:
             username: The Substack username
             follow_redirects: Whether to follow redirects when a handle has been renamed (default: True)
+            handle_cache: Optional persistent cache of renamed and deleted handles (call its ``save`` when done)
+            session: Optional session whose connection pool is used for all requests (e.g. shared by many users)
 
         """
         self.username = username
         self.original_username = username  # Keep track of the original
         self.follow_redirects = follow_redirects
+        self.handle_cache = handle_cache
+        self.session = session
         self.endpoint = f"{SUBSTACK_BASE_URL}/api/v1/user/{username}/public_profile"
         self._user_data = None  # Cache for user data
         self._redirect_attempted = False  # Prevent infinite redirect loops
 
+        # Skip the 404 round trip for handles already known to be renamed
+        if self.follow_redirects and self.handle_cache is not None:
+            new_handle = self.handle_cache.get_renamed(username)
+            if new_handle:
+                self._update_handle(new_handle)
+
+    @classmethod
+    def _identity_key(
+        cls,
+        username: str,
+        follow_redirects: bool = True,
+        handle_cache: HandleCache = None,
+        session: requests.Session = None,
+    ) -> tuple[str, bool, HandleCache, requests.Session]:
+        """Return the identity of a user in the identity map.
+
+        The handle cache and session are part of it, so a shared user never records into another
+        caller's cache or sends requests through another caller's session.
+        """
+        return (username, follow_redirects, handle_cache, session)
+
     def __str__(self) -> str:
         """Return a string representation of the user."""
         return f"User: {self.username}"
@@ -78,6 +138,11 @@ class User:
         """Return a string representation of the user."""
         return f"User(username={self.username})"
 
+    @property
+    def _http(self) -> Any:
+        """Shared session if one was given, else the requests module."""
+        return self.session or requests
+
     def _update_handle(self, new_handle: str) -> None:
         """Update the user's handle and endpoint."""
         logger.info(f"Updating handle from {self.username} to {new_handle}")
@@ -102,40 +167,59 @@ class User:
             return self._user_data
 
         try:
-            r = requests.get(self.endpoint, headers=DEFAULT_HEADERS, timeout=DEFAULT_TIMEOUT)
+            r = self._http.get(self.endpoint, headers=DEFAULT_HEADERS, timeout=DEFAULT_TIMEOUT)
             r.raise_for_status()
-            self._user_data = r.json()
+            self._user_data = decode_json(r.content)
             return self._user_data
 
         except requests.HTTPError as e:
-            # Handle 404 errors if we should follow redirects
-            if e.response.status_code == 404 and self.follow_redirects and not self._redirect_attempted:
-                # Mark that we've attempted a redirect to prevent loops
-                self._redirect_attempted = True
-
-                # Try to resolve the redirect
-                new_handle = resolve_handle_redirect(self.username)
-
-                if new_handle:
-                    # Update our state with the new handle
-                    self._update_handle(new_handle)
-
-                    # Try the request again with the new handle
-                    try:
-                        r = requests.get(self.endpoint, headers=DEFAULT_HEADERS, timeout=DEFAULT_TIMEOUT)
-                        r.raise_for_status()
-                        self._user_data = r.json()
-                        return self._user_data
-                    except requests.HTTPError:
-                        # If it still fails, log and re-raise
-                        logger.error(f"Failed to fetch user data even after redirect to {new_handle}")
-                        raise
-                else:
-                    # No redirect found, this is a real 404
-                    logger.debug(f"No redirect found for {self.username}, user may be deleted")
-
-            # Re-raise the original error
-            raise
+            # Only 404s are followed, once, and only if we should follow redirects
+            if e.response.status_code != 404 or not self.follow_redirects or self._redirect_attempted:
+                raise
+
+            # Mark that we've attempted a redirect to prevent loops
+            self._redirect_attempted = True
+
+            # Don't download the profile page again for handles known to be deleted
+            if self.handle_cache is not None and self.handle_cache.is_deleted(self.username):
+                logger.debug(f"{self.username} is cached as deleted, skipping redirect lookup")
+                raise
+
+            new_handle = self._find_new_handle()
+            if not new_handle:
+                # No redirect found, this is a real 404
+                logger.debug(f"No redirect found for {self.username}, user may be deleted")
+                raise
+
+            # Update our state with the new handle and try the request again
+            self._update_handle(new_handle)
+            try:
+                r = self._http.get(self.endpoint, headers=DEFAULT_HEADERS, timeout=DEFAULT_TIMEOUT)
+                r.raise_for_status()
+                self._user_data = decode_json(r.content)
+                return self._user_data
+            except requests.HTTPError:
+                # If it still fails, log and re-raise
+                logger.error(f"Failed to fetch user data even after redirect to {new_handle}")
+                raise
+
+    def _find_new_handle(self) -> str | None:
+        """Look up the handle a missing username now redirects to, recording the answer in the handle cache."""
+        if self.handle_cache is None:
+            return resolve_handle_redirect(self.username, session=self.session)
+
+        # Only cache definitive answers, not network errors
+        try:
+            new_handle = _lookup_handle_redirect(self.username, session=self.session)
+        except requests.RequestException as lookup_error:
+            logger.debug(f"Error resolving handle redirect for {self.username}: {lookup_error}")
+            return None
+
+        if new_handle:
+            self.handle_cache.set_renamed(self.username, new_handle)
+        else:
+            self.handle_cache.set_deleted(self.username)
+        return new_handle
 
     def get_raw_data(self, force_refresh: bool = False) -> dict[str, Any]:
         """Get the complete raw user data.
@@ -211,3 +295,46 @@ class User:
             })
 
         return subscriptions
+
+
+def resolve_users(
+    handles: Iterable[str],
+    max_workers: int = 8,
+    follow_redirects: bool = True,
+    handle_cache: HandleCache = None,
+    session: requests.Session = None,
+) -> dict[str, User | None]:
+    """Fetch many user profiles concurrently.
+
+    Args:
+        handles: Substack handles to resolve (duplicates are fetched once)
+        max_workers: Maximum number of profiles fetched at the same time
+        follow_redirects: Whether to follow redirects when a handle has been renamed
+        handle_cache: Optional persistent cache of renamed and deleted handles, shared by all lookups
+            and saved once they are done
+        session: Optional session shared by all lookups; by default a pooled session sized to max_workers
+
+    Returns:
+        dict[str, User | None]: Mapping of each requested handle to a User with its profile loaded,
+        or None if the profile could not be fetched
+
+    """
+    unique_handles = list(dict.fromkeys(handles))
+    shared_session = session or create_pooled_session(max_workers)
+
+    def _resolve(handle: str) -> User | None:
+        user = User(handle, follow_redirects=follow_redirects, handle_cache=handle_cache, session=shared_session)
+        try:
+            user.get_raw_data()
+        except requests.RequestException as e:
+            logger.debug(f"Failed to resolve user {handle}: {e}")
+            return None
+        return user
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            users = list(executor.map(_resolve, unique_handles))
+    finally:
+        if handle_cache is not None:
+            handle_cache.save()
+    return dict(zip(unique_handles, users, strict=True))
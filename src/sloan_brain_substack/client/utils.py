@@ -1,10 +1,18 @@
 """Utility functions for the Substack API client."""
 
-from typing import Any
+import json
+from typing import Any, Iterable
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .constants import DEFAULT_HEADERS, DEFAULT_TIMEOUT
+from .metrics import timed_parse
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up, see the "fast-json" extra
+    orjson = None
 
 
 def make_request(
@@ -44,3 +52,59 @@ def extract_subdomain_url(subdomain: str, domain: str = "substack.com") -> str:
         Full URL string
     """
     return f"https://{subdomain}.{domain}"
+
+
+def create_pooled_session(pool_size: int = 10) -> requests.Session:
+    """Create a session that keeps up to pool_size connections per host alive for reuse across threads.
+
+    Args:
+        pool_size: Maximum number of connections kept per host
+
+    Returns:
+        requests.Session: Session with the default headers set
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def decode_json(content: bytes | str, fields: Iterable[str] = None) -> Any:
+    """Decode a JSON payload, using orjson when it is installed.
+
+    Args:
+        content: Raw JSON payload, e.g. ``response.content``
+        fields: Optional keys to keep; applied to the payload if it is an object, or to each object if
+            it is a list, so that large unused values (such as post bodies) are released right away
+
+    Returns:
+        Any: The decoded (and projected) payload
+
+    Raises:
+        ValueError: If the payload is not valid JSON
+    """
+    with timed_parse():
+        data = orjson.loads(content) if orjson is not None else json.loads(content)
+        if fields is None:
+            return data
+        return project(data, fields)
+
+
+def project(data: Any, fields: Iterable[str]) -> Any:
+    """Keep only the given keys of a JSON object, or of each object in a list.
+
+    Args:
+        data: Decoded JSON payload
+        fields: Keys to keep
+
+    Returns:
+        Any: The projected payload; values that are neither objects nor lists are returned unchanged
+    """
+    fields = tuple(fields)
+    if isinstance(data, dict):
+        return {key: data[key] for key in fields if key in data}
+    if isinstance(data, list):
+        return [project(item, fields) if isinstance(item, dict) else item for item in data]
+    return data
@@ -0,0 +1,160 @@
+"""Harvesting of the user -> publication subscription graph from Substack profiles."""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from .client import HandleCache, resolve_users
+from .client import Newsletter as NewsletterClient
+from .client import User as UserClient
+from .client.utils import create_pooled_session
+from .models import DatabaseManager, UserSubscription
+from .models import User as UserModel
+
+# How long a harvested profile is considered fresh
+DEFAULT_PROFILE_TTL = timedelta(days=7)
+
+
+class SubscriptionHarvester:
+    """Fetches user profiles in bulk and stores their subscriptions as user -> publication edges."""
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        max_workers: int = 8,
+        ttl: timedelta = DEFAULT_PROFILE_TTL,
+        handle_cache: Optional[HandleCache] = None,
+    ) -> None:
+        """Initialize the harvester.
+
+        Args:
+            db_manager: Database manager instance
+            max_workers: Maximum number of profiles fetched at the same time
+            ttl: Profiles fetched more recently than this are not fetched again
+            handle_cache: Optional persistent cache of renamed and deleted handles, saved after each batch
+        """
+        self.db_manager = db_manager
+        self.max_workers = max_workers
+        self.ttl = ttl
+        self.handle_cache = handle_cache
+        # One connection pool for every profile request of this harvester
+        self.session = create_pooled_session(max_workers)
+
+    def harvest(self, handles: Iterable[str], batch_size: int = 200) -> Dict[str, int]:
+        """Fetch stale profiles and store their subscription edges.
+
+        Args:
+            handles: Substack handles to harvest (duplicates are fetched once)
+            batch_size: Number of profiles fetched and written per transaction
+
+        Returns:
+            Dictionary with the number of profiles "fetched", "fresh" (skipped) and "failed", and
+            the number of subscription "edges" written
+        """
+        unique_handles = list(dict.fromkeys(handles))
+
+        with self.db_manager.get_session() as session:
+            fresh = self._fresh_handles(session, unique_handles)
+        stale = [handle for handle in unique_handles if handle not in fresh]
+
+        stats = {"fetched": 0, "fresh": len(fresh), "failed": 0, "edges": 0}
+        for start in range(0, len(stale), batch_size):
+            batch = stale[start : start + batch_size]
+            users = resolve_users(
+                batch, max_workers=self.max_workers, handle_cache=self.handle_cache, session=self.session
+            )
+            fetched = {handle: user for handle, user in users.items() if user is not None}
+
+            with self.db_manager.get_session() as session:
+                stats["edges"] += self._store_profiles(session, fetched)
+
+            stats["fetched"] += len(fetched)
+            stats["failed"] += len(batch) - len(fetched)
+
+        return stats
+
+    def harvest_newsletter_authors(self, newsletter_urls: Iterable[str], batch_size: int = 200) -> Dict[str, int]:
+        """Harvest the subscriptions of every author of the given newsletters.
+
+        Args:
+            newsletter_urls: URLs of the newsletters whose authors should be harvested
+            batch_size: Number of profiles fetched and written per transaction
+
+        Returns:
+            Dictionary with harvest statistics, as returned by ``harvest``
+        """
+        handles = []
+        for url in newsletter_urls:
+            try:
+                handles.extend(author.username for author in NewsletterClient(url).get_authors())
+            except Exception as e:
+                print(f"Error getting authors of {url}: {e}")
+        return self.harvest(handles, batch_size=batch_size)
+
+    def _fresh_handles(self, session: Session, handles: List[str]) -> set:
+        """Get the handles whose profiles were harvested within the TTL."""
+        cutoff = datetime.utcnow() - self.ttl
+        fresh = set()
+        for start in range(0, len(handles), 500):
+            fresh.update(
+                session.execute(
+                    select(UserModel.handle)
+                    .where(UserModel.handle.in_(handles[start : start + 500]))
+                    .where(UserModel.fetched_at >= cutoff)
+                ).scalars()
+            )
+        return fresh
+
+    def _store_profiles(self, session: Session, users: Dict[str, UserClient]) -> int:
+        """Upsert a batch of profiles and replace their subscription edges in one transaction.
+
+        Returns:
+            Number of subscription edges written
+        """
+        if not users:
+            return 0
+
+        now = datetime.utcnow()
+        existing = dict(
+            session.execute(select(UserModel.handle, UserModel.id).where(UserModel.handle.in_(list(users)))).all()
+        )
+
+        rows = []
+        for handle, user in users.items():
+            data = user.get_raw_data()
+            rows.append({
+                "handle": handle,
+                "current_handle": user.username,
+                "user_id": data.get("id"),
+                "name": data.get("name"),
+                "fetched_at": now,
+            })
+
+        inserts = [row for row in rows if row["handle"] not in existing]
+        updates = [{"id": existing[row["handle"]], **row} for row in rows if row["handle"] in existing]
+        if inserts:
+            session.execute(insert(UserModel), inserts)
+        if updates:
+            session.execute(update(UserModel), updates)
+
+        user_ids = dict(
+            session.execute(select(UserModel.handle, UserModel.id).where(UserModel.handle.in_(list(users)))).all()
+        )
+
+        # Replace each user's edges, so unsubscribed publications disappear
+        session.execute(delete(UserSubscription).where(UserSubscription.user_id.in_(list(user_ids.values()))))
+        edges = []
+        for handle, user in users.items():
+            seen = set()
+            for sub in user.get_subscriptions():
+                if sub["publication_id"] in seen:
+                    continue
+                seen.add(sub["publication_id"])
+                edges.append({"user_id": user_ids[handle], **sub, "updated_at": now})
+        if edges:
+            session.execute(insert(UserSubscription), edges)
+
+        session.commit()
+        return len(edges)
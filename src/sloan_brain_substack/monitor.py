@@ -1,18 +1,157 @@
 """Newsletter monitoring service with database persistence."""
 
-from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional
+import cProfile
+import io
+import json
+import pstats
+import queue
+import threading
+import time
+import tracemalloc
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
-from sqlalchemy import select
+from sqlalchemy import Row, case, func, insert, select, update
 from sqlalchemy.orm import Session
 
+from .client import Auth, Category, PostSummary
 from .client import Newsletter as NewsletterClient
-from .client import Auth
-from .models import DatabaseManager
+from .client.metrics import snapshot as client_counters
+from .client.post import content_fingerprint
+from .models import CategoryEvent, CategoryMembership, DatabaseManager, OutboxEvent, PostEvent
+from .models import MonitorRun as MonitorRunModel
 from .models import Newsletter as NewsletterModel
 from .models import Post as PostModel
 
+if TYPE_CHECKING:
+    from .models import AsyncDatabaseManager
+
+# Backoff applied to a newsletter after consecutive failed checks
+DEFAULT_BACKOFF_BASE = timedelta(minutes=15)
+DEFAULT_BACKOFF_MAX = timedelta(days=1)
+
+# Longest a newsletter goes without a full archive read when the feed probe keeps skipping it; the
+# probe only sees new posts, so edits and paywall changes to known posts wait for the next full read
+DEFAULT_FULL_CHECK_INTERVAL = timedelta(hours=24)
+
+# Audiences that put a post (at least partly) behind the paywall
+PAID_AUDIENCES = ("only_paid", "founding")
+
+# Orders in which check_all_newsletters can work through the due newsletters
+CHECK_PRIORITIES = ("stalest", "active")
+
+# Profilers that can be run over a whole check_all_newsletters run, and the number of entries kept
+PROFILE_KINDS = ("cprofile", "tracemalloc")
+PROFILE_TOP_N = 50
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an API timestamp into a naive UTC datetime, or None if missing or malformed."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _monotonic_deadline(deadline: Union[datetime, timedelta, None]) -> Optional[float]:
+    """Convert a deadline (absolute, or relative to now) to a ``time.monotonic()`` value.
+
+    Naive datetimes are taken to be UTC, like every timestamp the monitor stores.
+    """
+    if deadline is None:
+        return None
+    if isinstance(deadline, timedelta):
+        remaining = deadline.total_seconds()
+    else:
+        now = datetime.now(deadline.tzinfo) if deadline.tzinfo else datetime.utcnow()
+        remaining = (deadline - now).total_seconds()
+    return time.monotonic() + remaining
+
+
+def _package_version() -> Optional[str]:
+    """Get the installed version of this package, if it is installed."""
+    try:
+        return version("sloan-brain-substack")
+    except PackageNotFoundError:
+        return None
+
+
+def _parse_post_date(value: Optional[str]) -> datetime:
+    """Parse an archive post_date into a naive UTC datetime, defaulting to now."""
+    return _parse_timestamp(value) or datetime.utcnow()
+
+
+def _is_free(audience: Optional[str]) -> bool:
+    """Check whether an archive audience value means the post is free to read."""
+    return audience not in PAID_AUDIENCES
+
+
+def _normalize_url(url: str) -> str:
+    """Normalize a newsletter URL for storage and comparison."""
+    url = url.strip().rstrip("/")
+    if "//" not in url:
+        url = f"https://{url}"
+    return url
+
+
+def _stored_url_variants(url: str) -> Set[str]:
+    """Get the forms a normalized newsletter URL may have been stored in by earlier versions."""
+    variants = {url, f"{url}/"}
+    if url.startswith("https://"):
+        host = url[len("https://") :]
+        variants.update((host, f"{host}/"))
+    return variants
+
+
+def _name_from_url(url: str) -> str:
+    """Derive a fallback newsletter name from its URL."""
+    return url.split("//")[1].split(".")[0]
+
+
+def _stats_from_counters(newsletter: NewsletterModel) -> dict:
+    """Build a newsletter's statistics from its maintained counters."""
+    return {
+        "name": newsletter.name,
+        "url": newsletter.url,
+        "total_posts": newsletter.post_count or 0,
+        "free_posts": newsletter.free_count or 0,
+        "paid_posts": newsletter.paid_count or 0,
+        "last_updated": newsletter.updated_at,
+        "latest_published_date": newsletter.latest_published_date,
+        "last_new_post_at": newsletter.last_new_post_at,
+    }
+
+
+# Category listing fields read by _publication_metadata
+PUBLICATION_FIELDS = ("base_url", "id", "name", "hero_text", "description", "author_name", "copyright")
+
+
+# Category listing fields stored as category membership
+MEMBERSHIP_FIELDS = ("id", "base_url", "name")
+
+# Consecutive already-known publications after which an incremental membership sync stops paging
+DEFAULT_KNOWN_RUN = 25
+
+
+def _publication_metadata(publication: dict) -> dict:
+    """Map a publication dict from a category listing to newsletter columns."""
+    return {
+        "url": _normalize_url(publication["base_url"]),
+        "publication_id": publication.get("id"),
+        "name": publication.get("name"),
+        "description": publication.get("hero_text") or publication.get("description"),
+        "author": publication.get("author_name") or publication.get("copyright"),
+    }
+
 
 @dataclass
 class MonitoringResult:
@@ -23,161 +162,1404 @@ class MonitoringResult:
     new_posts: List[dict]
     total_posts_found: int
     check_time: datetime
+    changed_posts: List[dict] = field(default_factory=list)
+    unchanged: bool = False  # True if the probe found nothing new and the archive was not fetched
+    skipped: bool = False  # True if the newsletter was not checked (see skip_reason)
+    error: Optional[str] = None
+    skip_reason: Optional[str] = None  # "backoff", "deadline" (never started) or "cancelled" (stopped mid-check)
+    requests_made: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)  # Seconds spent in "fetch", "parse" and "db"
 
 
-class SubstackMonitor:
-    """Monitors Substack newsletters and stores data in database."""
+@dataclass
+class _CheckState:
+    """Stored state of a newsletter needed to check it without holding a database session."""
+
+    newsletter_id: int
+    name: str
+    url: str
+    feed_etag: Optional[str]
+    feed_last_modified: Optional[str]
+    last_full_check_at: Optional[datetime]
+    latest_url: Optional[str]
+    known_posts: Dict[str, Row]  # url -> (id, url, audience, is_free, summary_hash, content_hash)
+
+
+@dataclass
+class _FetchResult:
+    """Network results of a newsletter check, ready to be written to the database."""
+
+    posts: List[PostSummary] = field(default_factory=list)
+    bodies: Dict[str, Optional[str]] = field(default_factory=dict)  # Re-fetched body HTML of changed posts
+    failed_bodies: Set[str] = field(default_factory=set)
+    feed: Optional[dict] = None
+    unchanged: bool = False
+    error: Optional[Exception] = None
+    requests_made: int = 0
+    fetch_seconds: float = 0.0  # Excluding parse_seconds
+    parse_seconds: float = 0.0
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """Timings of the fetch phases, as stored on a MonitoringResult."""
+        return {"fetch": self.fetch_seconds, "parse": self.parse_seconds}
 
-    def __init__(self, db_manager: DatabaseManager, auth: Optional[Auth] = None):
+
+class _FetchError(RuntimeError):
+    """Raised for a check whose archive fetch failed, keeping the work the fetch did."""
+
+    def __init__(self, message: str, fetched: _FetchResult) -> None:
+        """Create a _FetchError for a failed fetch."""
+        super().__init__(message)
+        self.fetched = fetched
+
+
+@dataclass
+class _RunProfile:
+    """Profile captured over a monitor run."""
+
+    kind: Optional[str]
+    report: Optional[str] = None
+
+
+@contextmanager
+def _profiled(kind: Optional[str]) -> Iterator[_RunProfile]:
+    """Run the block under cProfile or tracemalloc, leaving a text report on the yielded profile.
+
+    cProfile only sees the calling thread, so callers run their checks inline when it is used (see
+    ``_InlineExecutor``); tracemalloc traces allocations in every thread.
+
+    Raises:
+        ValueError: If kind is not None, "cprofile" or "tracemalloc"
+    """
+    if kind is not None and kind not in PROFILE_KINDS:
+        raise ValueError(f"profile must be 'cprofile' or 'tracemalloc', not {kind!r}")
+
+    captured = _RunProfile(kind)
+    if kind == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield captured
+        finally:
+            profiler.disable()
+            report = io.StringIO()
+            pstats.Stats(profiler, stream=report).sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+            captured.report = report.getvalue()
+    elif kind == "tracemalloc":
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            yield captured
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            top = tracemalloc.take_snapshot().statistics("lineno")[:PROFILE_TOP_N]
+            if not was_tracing:
+                tracemalloc.stop()
+            captured.report = "\n".join([f"current={current} peak={peak}", *(str(stat) for stat in top)])
+    else:
+        yield captured
+
+
+class _InlineExecutor:
+    """Stands in for a ThreadPoolExecutor, running each task on the calling thread as it is submitted."""
+
+    def __enter__(self) -> "_InlineExecutor":
+        """Enter the executor context."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Leave the executor context; every task has already run."""
+
+    def submit(self, fn: Callable[..., object], *args: object) -> Future:
+        """Run a task now and return its outcome as a completed future."""
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+def _executor(max_workers: int, inline: bool) -> Union[ThreadPoolExecutor, _InlineExecutor]:
+    """Get the executor checks run on: a thread pool, or the calling thread for cProfile runs."""
+    return _InlineExecutor() if inline else ThreadPoolExecutor(max_workers=max_workers)
+
+
+class _BaseMonitor:
+    """Database-agnostic monitoring logic shared by the sync and async monitors.
+
+    Every check is split into three phases so that no database session is held during network I/O:
+    loading the stored state (``_load_check_state``), fetching from Substack (``_fetch_updates``) and
+    writing the results (``_apply_updates``). The session-bound phases take a plain synchronous Session.
+    """
+
+    def __init__(
+        self,
+        db_manager: "DatabaseManager | AsyncDatabaseManager",
+        auth: Optional[Auth] = None,
+        use_feed_probe: bool = True,
+        backoff_base: timedelta = DEFAULT_BACKOFF_BASE,
+        backoff_max: timedelta = DEFAULT_BACKOFF_MAX,
+        record_runs: bool = True,
+        full_check_interval: Optional[timedelta] = DEFAULT_FULL_CHECK_INTERVAL,
+    ) -> None:
         """Initialize the monitor.
 
         Args:
             db_manager: Database manager instance
             auth: Optional authentication for accessing paywalled content
+            use_feed_probe: Whether to probe each newsletter's RSS feed (or newest archive post) before
+                paginating its archive, skipping newsletters that have published nothing new. The probe
+                can't see edits or paywall changes to known posts; see full_check_interval
+            backoff_base: Delay before re-checking a newsletter after its first failure; doubles with
+                each consecutive failure
+            backoff_max: Upper bound on the delay between checks of a failing newsletter
+            record_runs: Whether to store each check_all_newsletters run in the monitor_runs table
+            full_check_interval: Longest a newsletter goes without a full archive read, however often
+                the probe finds it unchanged, so edits and paywall changes are detected within it.
+                None lets the probe skip newsletters indefinitely
         """
         self.db_manager = db_manager
         self.auth = auth
+        self.use_feed_probe = use_feed_probe
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.record_runs = record_runs
+        self.full_check_interval = full_check_interval
+        self._posts_partitioned: Optional[bool] = None  # Looked up before the first run
+
+    def _find_newsletter(self, session: Session, url: str) -> Optional[NewsletterModel]:
+        """Get a newsletter by URL within an open session.
+
+        The URL is normalized as on insert; a row stored unnormalized by an earlier version is still
+        found by the URL it was added with.
+        """
+        normalized = _normalize_url(url)
+        newsletters = (
+            session.execute(select(NewsletterModel).where(NewsletterModel.url.in_({normalized, url}))).scalars().all()
+        )
+        return next((n for n in newsletters if n.url == normalized), newsletters[0] if newsletters else None)
+
+    def _publication_info(self, url: str) -> dict:
+        """Look up a publication's name, description and author, falling back to a name from the URL."""
+        try:
+            info = NewsletterClient(url, auth=self.auth).get_publication_info()
+        except Exception:
+            info = {}
+        return {
+            "name": info.get("name") or _name_from_url(url),
+            "description": info.get("description"),
+            "author": info.get("author"),
+        }
+
+    def _insert_newsletter(self, session: Session, url: str, info: dict) -> NewsletterModel:
+        """Add a newsletter within an open session, unless it was added in the meantime."""
+        # Check if newsletter already exists
+        existing = self._find_newsletter(session, url)
+        if existing:
+            return existing
+
+        # Create new newsletter
+        newsletter = NewsletterModel(url=_normalize_url(url), created_at=datetime.utcnow(), **info)
+
+        session.add(newsletter)
+        session.commit()
+        session.refresh(newsletter)
+
+        return newsletter
+
+    def _candidate_newsletters(self, source: Union[Iterable[str], Category]) -> Dict[str, Optional[dict]]:
+        """Map each newsletter URL to its known metadata (from a category listing), or None."""
+        if not isinstance(source, Category):
+            return {_normalize_url(url): None for url in source}
+
+        candidates = {}
+        for publication in source.get_newsletter_metadata():
+            row = _publication_metadata(publication)
+            candidates.setdefault(row["url"], row)
+        return candidates
+
+    def _split_new_newsletters(
+        self, session: Session, candidates: Dict[str, Optional[dict]]
+    ) -> Tuple[List[dict], List[str]]:
+        """Deduplicate candidate newsletters against the database with a single query.
+
+        Returns:
+            Rows ready to insert for new newsletters whose metadata is already known, and URLs of
+            new newsletters whose metadata still has to be looked up
+        """
+        existing_urls = {_normalize_url(url) for url in session.execute(select(NewsletterModel.url)).scalars()}
+
+        rows = []
+        unresolved = []
+        for url, row in candidates.items():
+            if url in existing_urls:
+                continue
+            if row is not None and row["name"]:
+                rows.append(row)
+            else:
+                unresolved.append(url)
+        return rows, unresolved
+
+    def _resolve_publications(self, urls: List[str], max_workers: int) -> List[dict]:
+        """Look up the metadata of many publications concurrently."""
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            infos = executor.map(self._publication_info, urls)
+            return [{"url": url, **info} for url, info in zip(urls, infos, strict=True)]
+
+    def _upsert_newsletters(self, session: Session, rows: List[dict], insert_new: bool = True) -> Tuple[int, int]:
+        """Insert or update newsletter metadata rows in one transaction.
+
+        Existing newsletters are matched by normalized URL with a single query, so a row stored
+        unnormalized by an earlier version is updated (and its URL normalized) rather than duplicated;
+        only non-empty incoming values overwrite stored ones.
+
+        Returns:
+            Number of newsletters inserted and updated
+        """
+        rows_by_url = {row["url"]: row for row in rows}
+        candidates = set().union(*map(_stored_url_variants, rows_by_url))
+        existing = {}
+        for row in session.execute(
+            select(
+                NewsletterModel.id,
+                NewsletterModel.url,
+                NewsletterModel.publication_id,
+                NewsletterModel.name,
+                NewsletterModel.description,
+                NewsletterModel.author,
+            ).where(NewsletterModel.url.in_(candidates))
+        ):
+            # Prefer an already normalized row over an old unnormalized one
+            normalized = _normalize_url(row.url)
+            if normalized not in existing or row.url == normalized:
+                existing[normalized] = row
+
+        now = datetime.utcnow()
+        inserts = []
+        updates = []
+        for url, row in rows_by_url.items():
+            known = existing.get(url)
+            if known is None:
+                if insert_new and row.get("name"):
+                    inserts.append({**row, "created_at": now, "updated_at": now})
+                continue
+            changed = {key: value for key, value in row.items() if value and getattr(known, key) != value}
+            if changed:
+                updates.append({"id": known.id, **changed})
+
+        if inserts:
+            session.execute(insert(NewsletterModel), inserts)
+        if updates:
+            session.execute(update(NewsletterModel), updates)
+        session.commit()
+        return len(inserts), len(updates)
+
+    def _insert_newsletters(self, session: Session, rows: List[dict], batch_size: int) -> None:
+        """Insert new newsletter rows in batches, one transaction per batch."""
+        now = datetime.utcnow()
+        for start in range(0, len(rows), batch_size):
+            batch = [{**row, "created_at": now, "updated_at": now} for row in rows[start : start + batch_size]]
+            session.execute(insert(NewsletterModel), batch)
+            session.commit()
+
+    def _load_check_state(self, session: Session, newsletter_url: str) -> _CheckState:
+        """Load what a check needs to know about a newsletter and its stored posts.
+
+        Raises:
+            ValueError: If the newsletter is not in the database
+        """
+        # Get newsletter from database
+        newsletter = self._find_newsletter(session, newsletter_url)
+
+        if not newsletter:
+            raise ValueError(f"Newsletter {newsletter_url} not found in database. Add it first.")
+
+        # Get fingerprints of existing posts from database (without loading their content)
+        known_posts = {
+            row.url: row
+            for row in session.execute(
+                select(
+                    PostModel.id,
+                    PostModel.url,
+                    PostModel.audience,
+                    PostModel.is_free,
+                    PostModel.summary_hash,
+                    PostModel.content_hash,
+                ).where(PostModel.newsletter_id == newsletter.id)
+            )
+        }
+
+        latest_url = session.execute(
+            select(PostModel.url)
+            .where(PostModel.newsletter_id == newsletter.id)
+            .order_by(PostModel.published_date.desc())
+            .limit(1)
+        ).scalar_one_or_none()
+
+        return _CheckState(
+            newsletter_id=newsletter.id,
+            name=newsletter.name,
+            url=newsletter.url,
+            feed_etag=newsletter.feed_etag,
+            feed_last_modified=newsletter.feed_last_modified,
+            last_full_check_at=newsletter.last_full_check_at,
+            latest_url=latest_url,
+            known_posts=known_posts,
+        )
+
+    def _fetch_updates(self, state: _CheckState) -> _FetchResult:
+        """Fetch everything a check needs from Substack, without touching the database.
+
+        Errors fetching the archive are captured in the result rather than raised, so that
+        ``_apply_updates`` can record them. The requests made and the time spent are recorded on the
+        result; the whole fetch runs in the calling thread, whose client counters attribute them.
+        """
+        before = client_counters()
+        start = time.perf_counter()
+        fetched = self._fetch(state)
+        work = client_counters().since(before)
+
+        fetched.requests_made = work.requests
+        fetched.parse_seconds = work.parse_seconds
+        fetched.fetch_seconds = time.perf_counter() - start - work.parse_seconds
+        return fetched
+
+    def _fetch(self, state: _CheckState) -> _FetchResult:
+        """Fetch the feed probe, archive and changed bodies of a newsletter."""
+        client = NewsletterClient(state.url, auth=self.auth)
+        fetched = _FetchResult()
+
+        # Skip archive pagination for newsletters whose feed hasn't changed, unless a full read is due
+        if self.use_feed_probe and state.latest_url is not None and not self._full_check_due(state):
+            fetched.unchanged, fetched.feed = self._probe(client, state)
+            if fetched.unchanged:
+                return fetched
+
+        # Fetch current posts from Substack as compact archive summaries
+        try:
+            fetched.posts = client.get_posts(limit=50, summaries=True)  # Adjust limit as needed
+        except Exception as e:
+            fetched.error = e
+            return fetched
+
+        # Re-fetch full bodies only for known posts whose archive summary changed
+        for summary in fetched.posts:
+            known = state.known_posts.get(summary.url)
+            if known is None or known.summary_hash is None or known.summary_hash == summary.fingerprint:
+                continue
+            try:
+                # Force a refresh: with the identity map enabled, to_post can return a shared Post
+                # still holding the body from before the edit
+                post = summary.to_post(auth=self.auth)
+                fetched.bodies[summary.url] = post.get_metadata(force_refresh=True).get("body_html")
+            except Exception as e:
+                print(f"Error fetching {summary.url}: {e}")
+                fetched.failed_bodies.add(summary.url)
+
+        return fetched
+
+    def _full_check_due(self, state: _CheckState) -> bool:
+        """Whether a newsletter's archive must be read in full, whatever the feed probe would say."""
+        if self.full_check_interval is None:
+            return False
+        if state.last_full_check_at is None:
+            return True
+        return datetime.utcnow() - state.last_full_check_at >= self.full_check_interval
+
+    def _probe(self, client: NewsletterClient, state: _CheckState) -> Tuple[bool, Optional[dict]]:
+        """Check whether a newsletter has published nothing since its newest stored post.
+
+        Does a conditional GET on the RSS feed, or a size-1 archive request when there is no usable
+        feed, and compares the newest post against the database.
+
+        Args:
+            client: Client for the newsletter
+            state: Stored state of the newsletter
+
+        Returns:
+            Whether the newsletter is unchanged and the full archive check can be skipped, and the
+            feed probe result (with the validators to store), if any
+        """
+        feed = None
+        try:
+            feed = client.probe_feed(etag=state.feed_etag, last_modified=state.feed_last_modified)
+            if feed is not None:
+                if not feed["modified"]:
+                    return True, feed
+                if feed["latest_url"]:
+                    return feed["latest_url"] == state.latest_url, feed
+
+            # No usable feed, fall back to the newest archive post
+            newest = client.get_posts(limit=1, summaries=True)
+        except Exception:
+            # A failed probe never skips a newsletter; the full check reports the error
+            return False, feed
+
+        return bool(newest) and newest[0].url == state.latest_url, feed
+
+    def _apply_updates(
+        self, session: Session, state: _CheckState, fetched: _FetchResult, commit: bool = True
+    ) -> MonitoringResult:
+        """Write the results of a check to the database.
+
+        With ``commit=False`` the changes are only flushed, so that a caller can write many checks in
+        one transaction.
+
+        Raises:
+            RuntimeError: If the archive could not be fetched (after recording the failure)
+        """
+        newsletter = session.get(NewsletterModel, state.newsletter_id)
+
+        if fetched.error is not None:
+            self._record_failure(newsletter, fetched.error)
+            self._end_write(session, commit)
+            raise _FetchError(f"Failed to fetch posts from {state.url}: {fetched.error}", fetched)
+
+        # Only store the feed validators once the check succeeded: after a failed archive fetch they
+        # would make the next probe answer "not modified" and skip the posts that were never read
+        if fetched.feed is not None:
+            newsletter.feed_etag = fetched.feed["etag"]
+            newsletter.feed_last_modified = fetched.feed["last_modified"]
+
+        if fetched.unchanged:
+            self._record_success(newsletter)
+            newsletter.updated_at = newsletter.last_checked_at = datetime.utcnow()
+            self._end_write(session, commit)
+            return MonitoringResult(
+                newsletter_name=state.name,
+                newsletter_url=state.url,
+                new_posts=[],
+                total_posts_found=0,
+                check_time=datetime.utcnow(),
+                unchanged=True,
+                requests_made=fetched.requests_made,
+                timings=fetched.timings,
+            )
+
+        # Find new posts and changes to known ones; new posts share one creation time, which is also
+        # the newsletter's last_new_post_at, so rebuild_stats (max of created_at) agrees with it
+        now = datetime.utcnow()
+        new_posts = []
+        changed_posts = []
+        seen_urls = set()
+        for post_data in fetched.posts:
+            post_url = post_data.url
+            if not post_url or post_url in seen_urls:
+                continue
+            seen_urls.add(post_url)
+
+            known = state.known_posts.get(post_url)
+            if known is not None:
+                changed_posts.extend(self._apply_post_changes(session, state.newsletter_id, known, post_data, fetched))
+                continue
+
+            # This is a new post
+            new_post = PostModel(
+                url=post_url,
+                title=post_data.title,
+                subtitle=None,
+                published_date=_parse_post_date(post_data.post_date),
+                is_free=_is_free(post_data.audience),
+                post_id=str(post_data.id or ""),
+                audience=post_data.audience,
+                summary_hash=post_data.fingerprint,
+                source_updated_at=_parse_timestamp(post_data.updated_at),
+                newsletter_id=state.newsletter_id,
+                created_at=now,
+            )
+
+            session.add(new_post)
+            new_post_info = {
+                "title": new_post.title,
+                "url": new_post.url,
+                "published_date": new_post.published_date,
+                "is_free": new_post.is_free,
+            }
+            new_posts.append(new_post_info)
+
+            # Publish the new post to the outbox, committed atomically with the insert
+            session.add(
+                OutboxEvent(
+                    event_type="post_created",
+                    newsletter_id=state.newsletter_id,
+                    post_url=post_url,
+                    payload=json.dumps({**new_post_info, "post_id": new_post.post_id}, default=str),
+                    created_at=now,
+                )
+            )
+
+        # Keep the stats counters in step, in the same transaction as the posts
+        self._update_counters(newsletter, new_posts, changed_posts, now)
+
+        # Update newsletter's timestamps, close its circuit breaker and commit everything at once
+        self._record_success(newsletter)
+        newsletter.updated_at = newsletter.last_checked_at = newsletter.last_full_check_at = datetime.utcnow()
+        self._end_write(session, commit)
+
+        return MonitoringResult(
+            newsletter_name=state.name,
+            newsletter_url=state.url,
+            new_posts=new_posts,
+            total_posts_found=len(fetched.posts),
+            check_time=datetime.utcnow(),
+            changed_posts=changed_posts,
+            requests_made=fetched.requests_made,
+            timings=fetched.timings,
+        )
+
+    def _end_write(self, session: Session, commit: bool) -> None:
+        """Commit the session, or only flush it when the caller owns the transaction."""
+        if commit:
+            session.commit()
+        else:
+            session.flush()
+
+    def _update_counters(
+        self, newsletter: NewsletterModel, new_posts: List[dict], changed_posts: List[dict], created_at: datetime
+    ) -> None:
+        """Update a newsletter's denormalized post counters for new posts and paywall flips.
+
+        Counts are incremented in SQL (col = col + n) so concurrent writers don't lose updates.
+
+        Args:
+            newsletter: Newsletter model instance
+            new_posts: Summaries of the posts inserted
+            changed_posts: Changes detected on known posts
+            created_at: Creation time of the inserted posts
+        """
+        free_delta = sum(1 for post in new_posts if post["is_free"])
+        paid_delta = len(new_posts) - free_delta
+        for change in changed_posts:
+            if change["event_type"] != "audience_changed":
+                continue
+            was_free, is_free = _is_free(change["old_value"]), _is_free(change["new_value"])
+            if was_free != is_free:
+                free_delta += 1 if is_free else -1
+                paid_delta += -1 if is_free else 1
+
+        if new_posts:
+            newsletter.post_count = func.coalesce(NewsletterModel.post_count, 0) + len(new_posts)
+            newest = max(post["published_date"] for post in new_posts)
+            if newsletter.latest_published_date is None or newest > newsletter.latest_published_date:
+                newsletter.latest_published_date = newest
+            newsletter.last_new_post_at = created_at
+        if free_delta:
+            newsletter.free_count = func.coalesce(NewsletterModel.free_count, 0) + free_delta
+        if paid_delta:
+            newsletter.paid_count = func.coalesce(NewsletterModel.paid_count, 0) + paid_delta
+
+    def _record_failure(self, newsletter: NewsletterModel, error: Exception) -> None:
+        """Open the newsletter's circuit breaker with exponential backoff after a failed check.
+
+        Args:
+            newsletter: Newsletter model instance
+            error: The error that made the check fail
+        """
+        failures = (newsletter.consecutive_failures or 0) + 1
+        delay = min(self.backoff_base * 2 ** (failures - 1), self.backoff_max)
+        now = datetime.utcnow()
+
+        newsletter.consecutive_failures = failures
+        newsletter.last_error = f"{type(error).__name__}: {error}"[:200]
+        newsletter.last_failure_at = now
+        newsletter.next_check_at = now + delay
+
+    def _record_success(self, newsletter: NewsletterModel) -> None:
+        """Close the newsletter's circuit breaker after a successful check.
+
+        Args:
+            newsletter: Newsletter model instance
+        """
+        if newsletter.consecutive_failures or newsletter.next_check_at is not None:
+            newsletter.consecutive_failures = 0
+            newsletter.next_check_at = None
+
+    def _apply_post_changes(
+        self, session: Session, newsletter_id: int, known: Row, summary: PostSummary, fetched: _FetchResult
+    ) -> List[dict]:
+        """Compare a known post against its current archive summary and record any changes.
+
+        Args:
+            session: Open database session
+            newsletter_id: ID of the newsletter the post belongs to
+            known: Stored fingerprint row (id, url, audience, is_free, summary_hash, content_hash) of the post
+            summary: Current archive summary of the post
+            fetched: Network results of the check, holding re-fetched bodies of changed posts
+
+        Returns:
+            List of change dictionaries recorded as events
+        """
+        if known.summary_hash == summary.fingerprint:
+            return []
+
+        values = {"summary_hash": summary.fingerprint, "title": summary.title}
+        if summary.updated_at:
+            values["source_updated_at"] = _parse_timestamp(summary.updated_at)
+
+        # Posts stored before fingerprinting existed only get a baseline, not an event
+        if known.summary_hash is None:
+            self._baseline_post(session, newsletter_id, known, summary, values)
+            return []
+
+        changes = []
+        if known.audience != summary.audience:
+            values["audience"] = summary.audience
+            values["is_free"] = _is_free(summary.audience)
+            changes.append(("audience_changed", known.audience, summary.audience))
+
+        if summary.url in fetched.failed_bodies:
+            # Keep the old fingerprint so the post is re-checked on the next run
+            values.pop("summary_hash")
+        body = fetched.bodies.get(summary.url)
+        if body:
+            new_hash = content_fingerprint(body)
+            if new_hash != known.content_hash:
+                values["content"] = body
+                values["content_hash"] = new_hash
+                # Without a stored body, a changed summary with the same audience is the only evidence of an edit
+                if known.content_hash is not None or known.audience == summary.audience:
+                    changes.append(("revised", known.content_hash, new_hash))
+
+        session.execute(update(PostModel).where(PostModel.id == known.id).values(**values))
+
+        detected_at = datetime.utcnow()
+        for event_type, old_value, new_value in changes:
+            session.add(
+                PostEvent(
+                    post_id=known.id,
+                    newsletter_id=newsletter_id,
+                    event_type=event_type,
+                    old_value=old_value,
+                    new_value=new_value,
+                    detected_at=detected_at,
+                )
+            )
+
+        return [
+            {"url": summary.url, "event_type": event_type, "old_value": old_value, "new_value": new_value}
+            for event_type, old_value, new_value in changes
+        ]
+
+    def _baseline_post(
+        self, session: Session, newsletter_id: int, known: Row, summary: PostSummary, values: dict
+    ) -> None:
+        """Store the first fingerprint of a post saved by an earlier version.
+
+        Earlier versions stored every post as free, so is_free is corrected from the audience, along
+        with the newsletter's free and paid counters.
+        """
+        values["audience"] = summary.audience
+        values["is_free"] = _is_free(summary.audience)
+        session.execute(update(PostModel).where(PostModel.id == known.id).values(**values))
+        if known.is_free != values["is_free"]:
+            delta = 1 if values["is_free"] else -1
+            session.execute(
+                update(NewsletterModel)
+                .where(NewsletterModel.id == newsletter_id)
+                .values(
+                    free_count=func.coalesce(NewsletterModel.free_count, 0) + delta,
+                    paid_count=func.coalesce(NewsletterModel.paid_count, 0) - delta,
+                )
+            )
+
+    def _apply_membership(
+        self,
+        session: Session,
+        category_id: int,
+        seen: Dict[int, dict],
+        joined: Dict[int, dict],
+        left: Set[int],
+        record_joins: bool = True,
+    ) -> None:
+        """Write a category membership sync: new members, join and leave events, and last-seen times."""
+        now = datetime.utcnow()
+
+        if joined:
+            session.execute(
+                insert(CategoryMembership),
+                [
+                    {
+                        "category_id": category_id,
+                        "publication_id": publication_id,
+                        "base_url": publication.get("base_url"),
+                        "name": publication.get("name"),
+                        "first_seen_at": now,
+                        "last_seen_at": now,
+                    }
+                    for publication_id, publication in joined.items()
+                ],
+            )
+        if joined and record_joins:
+            session.execute(
+                insert(CategoryEvent),
+                [
+                    {
+                        "category_id": category_id,
+                        "publication_id": publication_id,
+                        "base_url": publication.get("base_url"),
+                        "event_type": "joined",
+                        "detected_at": now,
+                    }
+                    for publication_id, publication in joined.items()
+                ],
+            )
+
+        still_known = [publication_id for publication_id in seen if publication_id not in joined]
+        for start in range(0, len(still_known), 500):
+            session.execute(
+                update(CategoryMembership)
+                .where(CategoryMembership.category_id == category_id)
+                .where(CategoryMembership.publication_id.in_(still_known[start : start + 500]))
+                .values(last_seen_at=now)
+            )
+
+        if left:
+            members = (
+                session
+                .execute(
+                    select(CategoryMembership)
+                    .where(CategoryMembership.category_id == category_id)
+                    .where(CategoryMembership.publication_id.in_(list(left)))
+                )
+                .scalars()
+                .all()
+            )
+            for member in members:
+                session.add(
+                    CategoryEvent(
+                        category_id=category_id,
+                        publication_id=member.publication_id,
+                        base_url=member.base_url,
+                        event_type="left",
+                        detected_at=now,
+                    )
+                )
+                session.delete(member)
+
+        session.commit()
+
+    def _plan_checks(
+        self, session: Session, priority: str = "stalest"
+    ) -> Tuple[List[Tuple[str, str]], List[MonitoringResult]]:
+        """Split the monitored newsletters into those due for a check and those backing off.
+
+        Args:
+            session: Database session
+            priority: "stalest" to order the due newsletters by oldest successful check first, or
+                "active" to order them by most recent new post first
+
+        Returns:
+            (url, name) of the newsletters to check in priority order, and results for the skipped ones
+
+        Raises:
+            ValueError: If priority is not "stalest" or "active"
+        """
+        if priority not in CHECK_PRIORITIES:
+            raise ValueError(f"priority must be 'stalest' or 'active', not {priority!r}")
+
+        stalest = NewsletterModel.last_checked_at.asc().nulls_first()
+        most_active = NewsletterModel.last_new_post_at.desc().nulls_last()
+        order = (stalest, most_active) if priority == "stalest" else (most_active, stalest)
+
+        due = []
+        skipped = []
+        now = datetime.utcnow()
+        for newsletter in session.execute(select(NewsletterModel).order_by(*order)).scalars():
+            if newsletter.next_check_at is not None and newsletter.next_check_at > now:
+                skipped.append(
+                    MonitoringResult(
+                        newsletter_name=newsletter.name,
+                        newsletter_url=newsletter.url,
+                        new_posts=[],
+                        total_posts_found=0,
+                        check_time=now,
+                        skipped=True,
+                        error=newsletter.last_error,
+                        skip_reason="backoff",
+                    )
+                )
+            else:
+                due.append((newsletter.url, newsletter.name))
+        return due, skipped
+
+    def _deadline_result(self, url: str, name: str, reason: str = "deadline") -> MonitoringResult:
+        """Build the result of a check that was not started, or was cancelled, because the deadline passed."""
+        return MonitoringResult(
+            newsletter_name=name,
+            newsletter_url=url,
+            new_posts=[],
+            total_posts_found=0,
+            check_time=datetime.utcnow(),
+            skipped=True,
+            skip_reason=reason,
+        )
+
+    def _failed_result(
+        self, url: str, name: str, error: Exception, fetched: Optional[_FetchResult] = None
+    ) -> MonitoringResult:
+        """Build the result of a check that raised, with the requests and timings of its fetch if known."""
+        # Log error but continue with other newsletters
+        print(f"Error checking {name}: {error}")
+        if fetched is None and isinstance(error, _FetchError):
+            fetched = error.fetched
+        return MonitoringResult(
+            newsletter_name=name,
+            newsletter_url=url,
+            new_posts=[],
+            total_posts_found=0,
+            check_time=datetime.utcnow(),
+            error=str(error),
+            requests_made=fetched.requests_made if fetched else 0,
+            timings=fetched.timings if fetched else {},
+        )
+
+    def _build_run(
+        self, started_at: datetime, results: List[MonitoringResult], profile: Optional[_RunProfile] = None
+    ) -> MonitorRunModel:
+        """Summarize a run's results, with a per-newsletter breakdown of the checked newsletters."""
+        checked = [result for result in results if not result.skipped]
+        per_newsletter = [
+            {
+                "url": result.newsletter_url,
+                "new_posts": len(result.new_posts),
+                "changed_posts": len(result.changed_posts),
+                "unchanged": result.unchanged,
+                "requests": result.requests_made,
+                **{f"{phase}_seconds": round(seconds, 4) for phase, seconds in result.timings.items()},
+                "error": result.error,
+            }
+            for result in checked
+        ]
+
+        def _total(phase: str) -> float:
+            return sum(result.timings.get(phase, 0.0) for result in checked)
+
+        return MonitorRunModel(
+            started_at=started_at,
+            finished_at=datetime.utcnow(),
+            version=_package_version(),
+            newsletters_checked=len(checked),
+            newsletters_skipped=len(results) - len(checked),
+            requests_made=sum(result.requests_made for result in checked),
+            new_posts=sum(len(result.new_posts) for result in checked),
+            errors=sum(1 for result in checked if result.error),
+            fetch_seconds=_total("fetch"),
+            db_seconds=_total("db"),
+            parse_seconds=_total("parse"),
+            per_newsletter=json.dumps(per_newsletter),
+            profile_kind=profile.kind if profile else None,
+            profile=profile.report if profile else None,
+        )
+
+    def _store_run(self, session: Session, run: MonitorRunModel) -> None:
+        """Store a run record."""
+        session.add(run)
+        session.commit()
+
+    def _newsletter_stats(self, session: Session, newsletter_url: str) -> dict:
+        """Get statistics for a newsletter within an open session."""
+        newsletter = self._find_newsletter(session, newsletter_url)
+
+        if not newsletter:
+            return {}
+
+        latest_post = session.execute(
+            select(PostModel)
+            .where(PostModel.newsletter_id == newsletter.id)
+            .order_by(PostModel.published_date.desc())
+            .limit(1)
+        ).scalar_one_or_none()
+
+        return {**_stats_from_counters(newsletter), "latest_post": latest_post}
+
+    def _all_stats(self, session: Session) -> List[dict]:
+        """Get statistics for every newsletter from the maintained counters, in one query."""
+        newsletters = session.execute(select(NewsletterModel).order_by(NewsletterModel.id)).scalars()
+        return [_stats_from_counters(newsletter) for newsletter in newsletters]
+
+    def _rebuild_stats(self, session: Session) -> int:
+        """Recompute every newsletter's counters from the posts table.
+
+        Returns:
+            Number of newsletters whose counters were corrected
+        """
+        actual = {
+            row.newsletter_id: row
+            for row in session.execute(
+                select(
+                    PostModel.newsletter_id,
+                    func.count().label("post_count"),
+                    func.sum(case((PostModel.is_free, 1), else_=0)).label("free_count"),
+                    func.max(PostModel.published_date).label("latest_published_date"),
+                    func.max(PostModel.created_at).label("last_new_post_at"),
+                ).group_by(PostModel.newsletter_id)
+            )
+        }
+
+        updates = []
+        for newsletter in session.execute(select(NewsletterModel)).scalars():
+            row = actual.get(newsletter.id)
+            values = {
+                "post_count": row.post_count if row else 0,
+                "free_count": int(row.free_count or 0) if row else 0,
+                "paid_count": row.post_count - int(row.free_count or 0) if row else 0,
+                "latest_published_date": row.latest_published_date if row else None,
+                "last_new_post_at": row.last_new_post_at if row else None,
+            }
+            if any(getattr(newsletter, key) != value for key, value in values.items()):
+                updates.append({"id": newsletter.id, **values})
+
+        if updates:
+            session.execute(update(NewsletterModel), updates)
+        session.commit()
+        return len(updates)
+
+
+class SubstackMonitor(_BaseMonitor):
+    """Monitors Substack newsletters and stores data in database."""
+
+    db_manager: DatabaseManager
 
     def add_newsletter(self, url: str, name: Optional[str] = None) -> NewsletterModel:
         """Add a newsletter to monitor.
 
         Args:
-            url: Newsletter URL
+            url: Newsletter URL (stored normalized: with a scheme and without a trailing slash)
             name: Optional custom name (will fetch from newsletter if not provided)
 
         Returns:
             Newsletter model instance
         """
+        url = _normalize_url(url)
         with self.db_manager.get_session() as session:
-            # Check if newsletter already exists
-            existing = session.execute(select(NewsletterModel).where(NewsletterModel.url == url)).scalar_one_or_none()
-
+            existing = self._find_newsletter(session, url)
             if existing:
                 return existing
 
-            # Fetch newsletter info if name not provided
-            if not name:
-                try:
-                    client = NewsletterClient(url, auth=self.auth)
-                    # Try to get newsletter name from the client
-                    # This might need adjustment based on the actual client API
-                    name = getattr(client, "name", url.split("//")[1].split(".")[0])
-                except Exception:
-                    # Fallback to extracting from URL
-                    name = url.split("//")[1].split(".")[0]
-
-            # Create new newsletter
-            newsletter = NewsletterModel(url=url, name=name, created_at=datetime.utcnow())
-
-            session.add(newsletter)
-            session.commit()
-            session.refresh(newsletter)
+        # Fetch newsletter info (name, description, author) outside of the session
+        info = {"name": name} if name else self._publication_info(url)
+
+        with self.db_manager.get_session() as session:
+            return self._insert_newsletter(session, url, info)
+
+    def add_newsletters(
+        self, source: Union[Iterable[str], Category], batch_size: int = 500, max_workers: int = 8
+    ) -> List[str]:
+        """Add many newsletters to monitor at once.
+
+        Existing newsletters are skipped with a single query. When a Category is given, names,
+        descriptions and authors come from its listing; otherwise they are looked up concurrently.
+
+        Args:
+            source: Newsletter URLs, or a Category whose newsletters should all be monitored
+            batch_size: Number of newsletters inserted per transaction
+            max_workers: Maximum number of concurrent metadata lookups
+
+        Returns:
+            URLs of the newsletters that were added
+        """
+        candidates = self._candidate_newsletters(source)
+
+        with self.db_manager.get_session() as session:
+            rows, unresolved = self._split_new_newsletters(session, candidates)
+
+        rows.extend(self._resolve_publications(unresolved, max_workers))
+
+        with self.db_manager.get_session() as session:
+            self._insert_newsletters(session, rows, batch_size)
+
+        return [row["url"] for row in rows]
+
+    def sync_category_metadata(self, category: Category, batch_size: int = 500, insert_new: bool = True) -> dict:
+        """Upsert publication metadata from a category listing into the newsletters table.
+
+        Each page of the listing carries name, description, author and the Substack publication ID of
+        20+ newsletters, so enrichment costs one request per page rather than several per newsletter.
+
+        Args:
+            category: Category whose listing should be synced
+            batch_size: Number of publications written per transaction
+            insert_new: Whether to also start monitoring newsletters that are not in the database yet
+
+        Returns:
+            Dictionary with the number of newsletters "inserted" and "updated"
+        """
+        inserted = updated = 0
+        pending = []
+
+        def _flush() -> None:
+            nonlocal inserted, updated
+            with self.db_manager.get_session() as session:
+                batch_inserted, batch_updated = self._upsert_newsletters(session, pending, insert_new)
+            inserted += batch_inserted
+            updated += batch_updated
+            pending.clear()
+
+        for page in category.iter_newsletter_pages(fields=PUBLICATION_FIELDS):
+            pending.extend(_publication_metadata(publication) for publication in page)
+            if len(pending) >= batch_size:
+                _flush()
+        if pending:
+            _flush()
+
+        return {"inserted": inserted, "updated": updated}
+
+    def sync_category_membership(
+        self, category: Category, full: bool = False, known_run: int = DEFAULT_KNOWN_RUN
+    ) -> dict:
+        """Record which publications joined (or left) a category since the last sync.
+
+        An incremental sync pages through the listing only until it has seen ``known_run`` already-known
+        publications in a row, so a daily refresh costs a few requests instead of the whole listing.
+        As the listing is not ordered by join date, a newcomer ranked below that point is only found by
+        a later sync or a full one. Leaves can only be detected by a full sync, which reads every
+        page; run one periodically (e.g. weekly). The first sync of a category records the current
+        members without join events.
+
+        Args:
+            category: Category whose membership should be synced
+            full: Whether to read the whole listing and record leaves
+            known_run: Number of consecutive known publications after which an incremental sync stops
+
+        Returns:
+            Dictionary with the number of "pages" fetched, publications "seen", and publications that
+            "joined" and "left"
+        """
+        with self.db_manager.get_session() as session:
+            known = set(
+                session.execute(
+                    select(CategoryMembership.publication_id).where(CategoryMembership.category_id == category.id)
+                ).scalars()
+            )
+        initial = not known
+
+        pages = 0
+        seen: Dict[int, dict] = {}
+        joined: Dict[int, dict] = {}
+        run = 0
+        for page in category.iter_newsletter_pages(fields=MEMBERSHIP_FIELDS):
+            pages += 1
+            for publication in page:
+                publication_id = publication.get("id")
+                if publication_id is None or publication_id in seen:
+                    continue
+                seen[publication_id] = publication
+                if publication_id in known:
+                    run += 1
+                else:
+                    joined[publication_id] = publication
+                    run = 0
+            if not full and not initial and run >= known_run:
+                break
+
+        left = known - set(seen) if full else set()
+
+        with self.db_manager.get_session() as session:
+            self._apply_membership(session, category.id, seen, joined, left, record_joins=not initial)
 
-            return newsletter
+        return {"pages": pages, "seen": len(seen), "joined": len(joined), "left": len(left)}
 
     def check_newsletter_updates(self, newsletter_url: str) -> MonitoringResult:
-        """Check a specific newsletter for new posts.
+        """Check a specific newsletter for new posts and changes to known posts.
+
+        Known posts are compared by their archive summary fingerprint; only posts whose summary
+        changed have their full body re-fetched. Revisions and audience (paywall) changes are
+        stored as PostEvent rows. No database session is held while Substack is being fetched.
 
         Args:
             newsletter_url: URL of the newsletter to check
 
         Returns:
-            MonitoringResult with information about new posts found
+            MonitoringResult with information about new and changed posts found
         """
+        start = time.perf_counter()
         with self.db_manager.get_session() as session:
-            # Get newsletter from database
-            newsletter = session.execute(
-                select(NewsletterModel).where(NewsletterModel.url == newsletter_url)
-            ).scalar_one_or_none()
-
-            if not newsletter:
-                raise ValueError(f"Newsletter {newsletter_url} not found in database. Add it first.")
-
-            # Get existing post URLs from database
-            existing_urls = set()
-            existing_posts = (
-                session.execute(select(PostModel.url).where(PostModel.newsletter_id == newsletter.id)).scalars().all()
-            )
-            existing_urls.update(existing_posts)
+            state = self._load_check_state(session, newsletter_url)
+        db_seconds = time.perf_counter() - start
 
-            # Fetch current posts from Substack
-            try:
-                client = NewsletterClient(newsletter_url, auth=self.auth)
-                current_posts = client.get_posts(limit=50)  # Adjust limit as needed
-            except Exception as e:
-                raise RuntimeError(f"Failed to fetch posts from {newsletter_url}: {e}")
-
-            # Find new posts
-            new_posts = []
-            for post_data in current_posts:
-                post_url = getattr(post_data, "url", "")
-                if post_url and post_url not in existing_urls:
-                    # This is a new post
-                    new_post = PostModel(
-                        url=post_url,
-                        title=getattr(post_data, "title", ""),
-                        subtitle=getattr(post_data, "subtitle", None),
-                        published_date=getattr(post_data, "post_date", datetime.utcnow()),
-                        is_free=not getattr(post_data, "audience", "") == "paid",
-                        post_id=str(getattr(post_data, "id", "")),
-                        newsletter_id=newsletter.id,
-                        created_at=datetime.utcnow(),
-                    )
+        fetched = self._fetch_updates(state)
 
-                    session.add(new_post)
-                    new_posts.append({
-                        "title": new_post.title,
-                        "url": new_post.url,
-                        "published_date": new_post.published_date,
-                        "is_free": new_post.is_free,
-                    })
+        start = time.perf_counter()
+        with self.db_manager.get_session() as session:
+            result = self._apply_updates(session, state, fetched)
+        result.timings["db"] = db_seconds + time.perf_counter() - start
+        return result
 
-            # Commit new posts
-            if new_posts:
-                session.commit()
+    def check_all_newsletters(
+        self,
+        deadline: Union[datetime, timedelta, None] = None,
+        max_workers: int = 1,
+        priority: str = "stalest",
+        profile: Optional[str] = None,
+    ) -> List[MonitoringResult]:
+        """Check all newsletters in the database for updates, most urgent first.
 
-            # Update newsletter's updated_at timestamp
-            newsletter.updated_at = datetime.utcnow()
-            session.commit()
+        Newsletters whose recent checks failed are skipped until their backoff expires; the next
+        check after that acts as a half-open probe that either resets or extends the backoff.
 
-            return MonitoringResult(
-                newsletter_name=newsletter.name,
-                newsletter_url=newsletter.url,
-                new_posts=new_posts,
-                total_posts_found=len(current_posts),
-                check_time=datetime.utcnow(),
-            )
+        Once the deadline passes no new checks are started; checks already running are allowed to
+        finish (each commits on its own), and the newsletters never reached are returned as skipped
+        with ``skip_reason="deadline"``.
 
-    def check_all_newsletters(self) -> List[MonitoringResult]:
-        """Check all newsletters in the database for updates.
+        Unless the monitor was created with ``record_runs=False``, the run is stored in the
+        monitor_runs table with its requests, errors and fetch/parse/database timings.
+
+        If posts is partitioned (PostgreSQL), the partitions of the current and coming months are
+        created before the run starts.
+
+        Args:
+            deadline: Optional time after which no check is started, as a UTC datetime or a timedelta
+                from now
+            max_workers: Maximum number of newsletters checked at the same time
+            priority: "stalest" (oldest successful check first) or "active" (most recent new post first)
+            profile: Optional profiler to run over the whole run and store with it, "cprofile" or
+                "tracemalloc"; with "cprofile" the checks run one at a time on the calling thread, so
+                that the profile covers them
 
         Returns:
-            List of MonitoringResult objects
+            List of MonitoringResult objects: backoff skips, then checked newsletters in priority
+            order, then deadline skips
+
+        Raises:
+            ValueError: If priority or profile is not a known value
         """
-        results = []
+        started_at = datetime.utcnow()
+        self._maintain_post_partitions()
+        with _profiled(profile) as run_profile:
+            results = self._check_all(deadline, max_workers, priority, inline=profile == "cprofile")
+        self._save_run(started_at, results, run_profile)
+        return results
 
+    def _check_all(
+        self, deadline: Union[datetime, timedelta, None], max_workers: int, priority: str, inline: bool = False
+    ) -> List[MonitoringResult]:
+        """Run the checks of ``check_all_newsletters``, on the calling thread if ``inline``."""
         with self.db_manager.get_session() as session:
-            newsletters = session.execute(select(NewsletterModel)).scalars().all()
+            due, results = self._plan_checks(session, priority)
+
+        stop_at = _monotonic_deadline(deadline)
+        checked: Dict[int, MonitoringResult] = {}
+        next_index = 0
+        if inline:
+            max_workers = 1
+
+        with _executor(max_workers, inline) as executor:
+            pending = {}
+            while True:
+                # Keep every worker busy until the deadline, starting checks in priority order
+                while (
+                    next_index < len(due)
+                    and len(pending) < max_workers
+                    and (stop_at is None or time.monotonic() < stop_at)
+                ):
+                    pending[executor.submit(self.check_newsletter_updates, due[next_index][0])] = next_index
+                    next_index += 1
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    url, name = due[index]
+                    try:
+                        checked[index] = future.result()
+                    except Exception as e:
+                        checked[index] = self._failed_result(url, name, e)
 
-            for newsletter in newsletters:
+        results.extend(checked[index] for index in sorted(checked))
+        results.extend(self._deadline_result(url, name) for url, name in due[next_index:])
+        return results
+
+    def check_all_newsletters_pipelined(
+        self,
+        deadline: Union[datetime, timedelta, None] = None,
+        max_workers: int = 8,
+        priority: str = "stalest",
+        batch_size: int = 50,
+        queue_size: int = 100,
+        profile: Optional[str] = None,
+    ) -> List[MonitoringResult]:
+        """Check all newsletters with fetching and database writes decoupled by a bounded queue.
+
+        Fetch workers never hold a database connection: each pushes its fetched result onto the
+        queue, and a single writer thread drains it, applying up to ``batch_size`` checks per
+        transaction. When the writer falls behind the queue fills up and the fetch workers block, so
+        memory stays bounded and the fetch rate follows the database. Skips and deadlines behave as in
+        ``check_all_newsletters``, and so does run recording.
+
+        Args:
+            deadline: Optional time after which no check is started, as a UTC datetime or a timedelta
+                from now
+            max_workers: Maximum number of newsletters fetched at the same time
+            priority: "stalest" (oldest successful check first) or "active" (most recent new post first)
+            batch_size: Maximum number of checks written per transaction
+            queue_size: Maximum number of fetched checks waiting to be written
+            profile: Optional profiler to run over the whole run, "cprofile" or "tracemalloc"; with
+                "cprofile" fetches and writes run one at a time on the calling thread, so that the
+                profile covers them
+
+        Returns:
+            List of MonitoringResult objects: backoff skips and failed state loads, then checked
+            newsletters in the order they were written, then deadline skips
+
+        Raises:
+            ValueError: If priority or profile is not a known value
+        """
+        started_at = datetime.utcnow()
+        self._maintain_post_partitions()
+        with _profiled(profile) as run_profile:
+            results = self._check_all_pipelined(
+                deadline, max_workers, priority, batch_size, queue_size, inline=profile == "cprofile"
+            )
+        self._save_run(started_at, results, run_profile)
+        return results
+
+    def _check_all_pipelined(
+        self,
+        deadline: Union[datetime, timedelta, None],
+        max_workers: int,
+        priority: str,
+        batch_size: int,
+        queue_size: int,
+        inline: bool = False,
+    ) -> List[MonitoringResult]:
+        """Run the checks of ``check_all_newsletters_pipelined``, on the calling thread if ``inline``.
+
+        Inline, there is no writer thread: the queue is written out whenever it holds a full batch, and
+        once more after the last fetch.
+        """
+        with self.db_manager.get_session() as session:
+            due, results = self._plan_checks(session, priority)
+
+        stop_at = _monotonic_deadline(deadline)
+        updates: queue.Queue = queue.Queue(maxsize=0 if inline else queue_size)
+        written: List[MonitoringResult] = []
+        writer = threading.Thread(
+            target=self._write_behind, args=(updates, batch_size, written), name="monitor-writer", daemon=True
+        )
+        if inline:
+            max_workers = 1
+        else:
+            writer.start()
+
+        next_index = 0
+        try:
+            with _executor(max_workers, inline) as executor:
+                pending = set()
+                while next_index < len(due) and (stop_at is None or time.monotonic() < stop_at):
+                    # Load states only for free workers, so they are not read far ahead of the fetches
+                    if len(pending) >= max_workers:
+                        _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        continue
+
+                    chunk = due[next_index : next_index + max_workers - len(pending)]
+                    next_index += len(chunk)
+                    with self.db_manager.get_session() as session:
+                        for url, name in chunk:
+                            try:
+                                state = self._load_check_state(session, url)
+                            except Exception as e:
+                                results.append(self._failed_result(url, name, e))
+                                continue
+                            pending.add(executor.submit(self._fetch_into, state, updates))
+                    if inline and updates.qsize() >= batch_size:
+                        self._write_queued([updates.get_nowait() for _ in range(batch_size)], written)
+        finally:
+            # Fetches have all been queued once the executor exits; tell the writer to finish up
+            updates.put(None)
+            if inline:
+                self._write_behind(updates, batch_size, written)
+            else:
+                writer.join()
+
+        results.extend(written)
+        results.extend(self._deadline_result(url, name) for url, name in due[next_index:])
+        return results
+
+    def _fetch_into(self, state: _CheckState, updates: queue.Queue) -> None:
+        """Fetch a newsletter and queue the result for the writer, blocking while the queue is full."""
+        try:
+            fetched = self._fetch_updates(state)
+        except Exception as e:
+            fetched = _FetchResult(error=e)
+        updates.put((state, fetched))
+
+    def _write_behind(self, updates: queue.Queue, batch_size: int, written: List[MonitoringResult]) -> None:
+        """Drain the queue in batches until the end marker, writing each batch in one transaction."""
+        done = False
+        while not done:
+            batch = [updates.get()]
+            while len(batch) < batch_size:
                 try:
-                    result = self.check_newsletter_updates(newsletter.url)
-                    results.append(result)
-                except Exception as e:
-                    # Log error but continue with other newsletters
-                    print(f"Error checking {newsletter.name}: {e}")
-                    results.append(
-                        MonitoringResult(
-                            newsletter_name=newsletter.name,
-                            newsletter_url=newsletter.url,
-                            new_posts=[],
-                            total_posts_found=0,
-                            check_time=datetime.utcnow(),
-                        )
-                    )
+                    batch.append(updates.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is None:
+                batch.pop()
+                done = True
+            if batch:
+                self._write_queued(batch, written)
 
+    def _write_queued(self, batch: List[Tuple[_CheckState, _FetchResult]], written: List[MonitoringResult]) -> None:
+        """Write a batch taken off the queue, reporting every check in it as failed if the transaction fails."""
+        try:
+            with self.db_manager.get_session() as session:
+                written.extend(self._write_batch(session, batch))
+        except Exception as e:
+            # Keep draining, or the fetch workers would block on the full queue forever
+            written.extend(self._failed_result(state.url, state.name, e, fetched) for state, fetched in batch)
+
+    def _write_batch(self, session: Session, batch: List[Tuple[_CheckState, _FetchResult]]) -> List[MonitoringResult]:
+        """Apply a batch of fetched checks in one transaction, isolating each in a savepoint."""
+        results = []
+        for state, fetched in batch:
+            savepoint = session.begin_nested()
+            start = time.perf_counter()
+            try:
+                result = self._apply_updates(session, state, fetched, commit=False)
+                result.timings["db"] = time.perf_counter() - start
+                results.append(result)
+            except Exception as e:
+                # A fetch error has been recorded on the newsletter (backoff, feed validators left as they
+                # were); anything else is undone
+                if fetched.error is not None and savepoint.is_active:
+                    savepoint.commit()
+                else:
+                    savepoint.rollback()
+                results.append(self._failed_result(state.url, state.name, e, fetched))
+            else:
+                savepoint.commit()
+        session.commit()
         return results
 
+    def _maintain_post_partitions(self) -> None:
+        """Create the current and coming months' posts partitions before a run, if posts is partitioned."""
+        try:
+            if self._posts_partitioned is None:
+                self._posts_partitioned = self.db_manager.posts_partitioned()
+            if self._posts_partitioned:
+                self.db_manager.ensure_post_partitions()
+        except Exception as e:
+            # Posts still land in posts_default; the next run retries
+            print(f"Error maintaining posts partitions: {e}")
+
+    def _save_run(self, started_at: datetime, results: List[MonitoringResult], profile: _RunProfile) -> None:
+        """Store a finished run in the monitor_runs table, if runs are recorded."""
+        if not self.record_runs:
+            return
+        try:
+            with self.db_manager.get_session() as session:
+                self._store_run(session, self._build_run(started_at, results, profile))
+        except Exception as e:
+            # Losing the run record must not lose the run's results
+            print(f"Error recording monitor run: {e}")
+
     def get_newsletter_stats(self, newsletter_url: str) -> dict:
         """Get statistics for a newsletter.
 
@@ -188,26 +1570,24 @@ class SubstackMonitor:
             Dictionary with newsletter statistics
         """
         with self.db_manager.get_session() as session:
-            newsletter = session.execute(
-                select(NewsletterModel).where(NewsletterModel.url == newsletter_url)
-            ).scalar_one_or_none()
+            return self._newsletter_stats(session, newsletter_url)
 
-            if not newsletter:
-                return {}
+    def get_all_stats(self) -> List[dict]:
+        """Get statistics for every monitored newsletter with a single query.
 
-            total_posts = (
-                session.execute(select(PostModel).where(PostModel.newsletter_id == newsletter.id)).scalars().all()
-            )
+        Reads the counters maintained on the newsletters table; run ``rebuild_stats`` to correct drift.
 
-            free_posts = [p for p in total_posts if p.is_free]
-            paid_posts = [p for p in total_posts if not p.is_free]
-
-            return {
-                "name": newsletter.name,
-                "url": newsletter.url,
-                "total_posts": len(total_posts),
-                "free_posts": len(free_posts),
-                "paid_posts": len(paid_posts),
-                "last_updated": newsletter.updated_at,
-                "latest_post": max(total_posts, key=lambda p: p.published_date) if total_posts else None,
-            }
+        Returns:
+            List of dictionaries with newsletter statistics
+        """
+        with self.db_manager.get_session() as session:
+            return self._all_stats(session)
+
+    def rebuild_stats(self) -> int:
+        """Recompute all newsletters' post counters from the posts table.
+
+        Returns:
+            Number of newsletters whose counters were corrected
+        """
+        with self.db_manager.get_session() as session:
+            return self._rebuild_stats(session)
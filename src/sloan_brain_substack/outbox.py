@@ -0,0 +1,136 @@
+"""Batched consumer API for the change events the monitor writes to its outbox."""
+
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Optional
+
+from sqlalchemy import select
+
+from .models import DatabaseManager, OutboxCursor, OutboxEvent
+
+# How long a gap in the event ids is waited on, counted from the creation of the event after it: a
+# transaction that got a lower id but commits later must not be skipped by a cursor that moved past
+# it, while ids of rolled-back transactions never fill in. Must exceed the longest write transaction
+DEFAULT_SETTLE_TIME = timedelta(seconds=30)
+
+
+@dataclass
+class ChangeEvent:
+    """A change event read from the outbox."""
+
+    id: int
+    event_type: str
+    newsletter_id: int
+    post_url: str
+    payload: dict
+    created_at: datetime
+
+
+class OutboxConsumer:
+    """Streams outbox events to a named consumer, tracking its position with a cursor.
+
+    Delivery is at-least-once: events handed out by ``claim`` are returned again until they are
+    acknowledged with ``ack``. Events are handed out in id order up to the first gap in the ids,
+    which may still be filled by a transaction that hasn't committed; the gap is skipped once the
+    event after it is older than the settle time. Run one process per consumer name.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, name: str, settle_time: timedelta = DEFAULT_SETTLE_TIME) -> None:
+        """Initialize the consumer.
+
+        Args:
+            db_manager: Database manager instance
+            name: Consumer name; each name has its own cursor
+            settle_time: How long a gap in the event ids is waited on, counted from the creation of
+                the event after it; must exceed the longest monitor write transaction
+        """
+        self.db_manager = db_manager
+        self.name = name
+        self.settle_time = settle_time
+
+    @property
+    def position(self) -> int:
+        """Id of the last acknowledged event (0 if none)."""
+        with self.db_manager.get_session() as session:
+            cursor = session.get(OutboxCursor, self.name)
+            return cursor.last_event_id if cursor else 0
+
+    def claim(self, limit: int = 100) -> List[ChangeEvent]:
+        """Get the next batch of unacknowledged events, oldest first.
+
+        Args:
+            limit: Maximum number of events to return
+
+        Returns:
+            List of ChangeEvent objects
+        """
+        with self.db_manager.get_session() as session:
+            cursor = session.get(OutboxCursor, self.name)
+            last_event_id = cursor.last_event_id if cursor else 0
+
+            events = session.execute(
+                select(OutboxEvent).where(OutboxEvent.id > last_event_id).order_by(OutboxEvent.id).limit(limit)
+            ).scalars()
+
+            return [
+                ChangeEvent(
+                    id=event.id,
+                    event_type=event.event_type,
+                    newsletter_id=event.newsletter_id,
+                    post_url=event.post_url,
+                    payload=json.loads(event.payload) if event.payload else {},
+                    created_at=event.created_at,
+                )
+                for event in self._before_open_gap(last_event_id, events)
+            ]
+
+    def _before_open_gap(self, last_event_id: int, events: Iterable[OutboxEvent]) -> Iterator[OutboxEvent]:
+        """Yield events in id order, stopping at a gap an uncommitted transaction may still fill."""
+        settled = datetime.utcnow() - self.settle_time
+        expected_id = last_event_id + 1
+        for event in events:
+            if event.id != expected_id and event.created_at > settled:
+                return
+            yield event
+            expected_id = event.id + 1
+
+    def ack(self, events: List[ChangeEvent]) -> None:
+        """Acknowledge events, moving the cursor past them.
+
+        Args:
+            events: Events returned by ``claim`` that have been processed
+        """
+        if not events:
+            return
+
+        last_event_id = max(event.id for event in events)
+        with self.db_manager.get_session() as session:
+            cursor = session.get(OutboxCursor, self.name)
+            if cursor is None:
+                session.add(OutboxCursor(consumer=self.name, last_event_id=last_event_id))
+            elif last_event_id > cursor.last_event_id:
+                cursor.last_event_id = last_event_id
+            session.commit()
+
+    def stream(self, batch_size: int = 100, poll_interval: Optional[float] = None) -> Iterator[List[ChangeEvent]]:
+        """Yield batches of events, acknowledging each batch once the caller asks for the next one.
+
+        Args:
+            batch_size: Maximum number of events per batch
+            poll_interval: Seconds to wait for new events when caught up; if None, stop when caught up
+
+        Yields:
+            Lists of ChangeEvent objects
+        """
+        while True:
+            events = self.claim(batch_size)
+            if not events:
+                if poll_interval is None:
+                    return
+                time.sleep(poll_interval)
+                continue
+
+            yield events
+            self.ack(events)
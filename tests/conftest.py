@@ -0,0 +1,116 @@
+"""Shared fixtures: a throwaway SQLite database and an in-memory stand-in for Substack."""
+
+import hashlib
+import socket
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+
+from sloan_brain_substack.client import Newsletter, Post, PostSummary
+from sloan_brain_substack.client.metrics import count_request
+from sloan_brain_substack.models import DatabaseManager
+
+
+class FakeSubstack:
+    """Serves newsletter archives and feed probes from memory, in place of the network."""
+
+    def __init__(self) -> None:
+        """Create a FakeSubstack with no newsletters."""
+        self.archives: dict[str, list[dict[str, Any]]] = {}  # Newsletter URL -> archive items, newest first
+        self.failing: set[str] = set()  # Newsletter URLs whose archive requests fail (their feed still answers)
+        self.archive_reads: Counter[str] = Counter()  # Full archive reads per newsletter URL
+        self.probes: Counter[str] = Counter()  # Feed probes per newsletter URL
+        self._next_id = 1
+
+    def publish(self, newsletter_url: str, slug: str, **fields: Any) -> dict[str, Any]:
+        """Add a post at the top of a newsletter's archive."""
+        item = {
+            "id": self._next_id,
+            "canonical_url": f"{newsletter_url.rstrip('/')}/p/{slug}",
+            "title": slug.replace("-", " ").title(),
+            "post_date": f"2024-01-{self._next_id % 28 + 1:02d}T08:00:00.000Z",
+            "audience": "everyone",
+            "publication_id": 1,
+            "truncated_body_text": f"Body of {slug}",
+        }
+        item.update(fields)
+        self._next_id += 1
+        self.archives.setdefault(newsletter_url.rstrip("/"), []).insert(0, item)
+        return item
+
+    def edit(self, post_url: str, **fields: Any) -> None:
+        """Change fields of a published post, as an edit or a paywall flip would."""
+        for items in self.archives.values():
+            for item in items:
+                if item["canonical_url"] == post_url:
+                    item.update(fields)
+
+    def get_posts(
+        self, client: Newsletter, sorting: str = "new", limit: int | None = None, summaries: bool = False
+    ) -> list[PostSummary]:
+        """Serve Newsletter.get_posts(summaries=True) from the archive."""
+        url = client.url.rstrip("/")
+        count_request()
+        if url in self.failing:
+            raise requests.ConnectionError(f"{url} is unreachable")
+        if limit != 1:
+            self.archive_reads[url] += 1
+        return [PostSummary.from_archive(item) for item in self.archives.get(url, [])[:limit]]
+
+    def probe_feed(self, client: Newsletter, etag: str | None = None, last_modified: str | None = None) -> dict:
+        """Serve Newsletter.probe_feed, answering 304-style when the ETag still matches."""
+        url = client.url.rstrip("/")
+        count_request()
+        self.probes[url] += 1
+        items = self.archives.get(url, [])
+        latest_url = items[0]["canonical_url"] if items else None
+        current = hashlib.sha1(repr(latest_url).encode()).hexdigest()
+        if etag == current:
+            return {"modified": False, "etag": etag, "last_modified": last_modified, "latest_url": None}
+        return {"modified": True, "etag": current, "last_modified": None, "latest_url": latest_url}
+
+    def get_metadata(self, post: Post, force_refresh: bool = False) -> dict[str, Any]:
+        """Serve Post.get_metadata, with the body derived from the archive item."""
+        for items in self.archives.values():
+            for item in items:
+                if item["canonical_url"] == post.url:
+                    return {**item, "body_html": f"<p>{item['truncated_body_text']}</p>"}
+        raise requests.HTTPError(f"404 Error for url: {post.url}")
+
+    def get_publication_info(self, client: Newsletter) -> dict[str, str | None]:
+        """Serve Newsletter.get_publication_info."""
+        return {"name": client.url.rstrip("/").rsplit("/", 1)[-1], "description": None, "author": None}
+
+
+@pytest.fixture(autouse=True)
+def _no_network(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fail any test that tries to reach the network."""
+
+    def _connect(self: socket.socket, address: Any) -> None:
+        raise RuntimeError(f"Tests must not connect to {address}")
+
+    monkeypatch.setattr(socket.socket, "connect", _connect)
+
+
+@pytest.fixture
+def db_manager(tmp_path: Path) -> Iterator[DatabaseManager]:
+    """A DatabaseManager on a fresh SQLite database."""
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'substack.db'}")
+    manager.create_tables()
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def substack(monkeypatch: pytest.MonkeyPatch) -> FakeSubstack:
+    """Route the client's archive, feed, metadata and post requests to a FakeSubstack."""
+    fake = FakeSubstack()
+    monkeypatch.setattr(Newsletter, "get_posts", lambda self, *args, **kwargs: fake.get_posts(self, *args, **kwargs))
+    monkeypatch.setattr(Newsletter, "probe_feed", lambda self, *args, **kwargs: fake.probe_feed(self, *args, **kwargs))
+    monkeypatch.setattr(Newsletter, "get_publication_info", lambda self: fake.get_publication_info(self))
+    monkeypatch.setattr(Post, "get_metadata", lambda self, *args, **kwargs: fake.get_metadata(self, *args, **kwargs))
+    return fake
@@ -0,0 +1,113 @@
+"""Tests for moving post content to archive files and reading it back."""
+
+import os
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from sloan_brain_substack import ContentArchive
+from sloan_brain_substack.models import DatabaseManager, _partitioned_posts_table
+from sloan_brain_substack.models import Newsletter as NewsletterModel
+from sloan_brain_substack.models import Post as PostModel
+
+URL = "https://example.substack.com"
+
+
+def _add_posts(db_manager: DatabaseManager, count: int) -> None:
+    """Store old posts, all published in the same month."""
+    with db_manager.get_session() as session:
+        newsletter = NewsletterModel(url=URL, name="Example")
+        session.add(newsletter)
+        session.flush()
+        session.add_all(
+            PostModel(
+                url=f"{URL}/p/{i}",
+                title=f"Post {i}",
+                published_date=datetime(2020, 1, i + 1),
+                is_free=True,
+                content=f"<p>Content of post {i}</p>",
+                newsletter_id=newsletter.id,
+            )
+            for i in range(count)
+        )
+        session.commit()
+
+
+def _archived_content(db_manager: DatabaseManager, archive: ContentArchive) -> dict[str, str]:
+    """Read every post's content back through the archive."""
+    with db_manager.get_session() as session:
+        return {post.url: archive.get_content(post) for post in session.query(PostModel)}
+
+
+def test_archived_content_reads_back(db_manager: DatabaseManager, tmp_path: Path) -> None:
+    """Archived posts lose their inline content and read it back from the archive file."""
+    _add_posts(db_manager, 6)
+    archive = ContentArchive(str(tmp_path / "archive"))
+
+    assert archive.archive_older_than(db_manager, batch_size=2) == 6
+
+    with db_manager.get_session() as session:
+        assert session.query(PostModel).filter(PostModel.content.is_not(None)).count() == 0
+    assert _archived_content(db_manager, archive) == {f"{URL}/p/{i}": f"<p>Content of post {i}</p>" for i in range(6)}
+
+
+def test_read_decodes_only_the_member_holding_the_post(db_manager: DatabaseManager, tmp_path: Path) -> None:
+    """A read indexes the file and decodes one archived batch, not the whole month."""
+    _add_posts(db_manager, 6)
+    archive = ContentArchive(str(tmp_path / "archive"))
+    archive.archive_older_than(db_manager, batch_size=2)
+
+    with db_manager.get_session() as session:
+        post = session.query(PostModel).filter_by(url=f"{URL}/p/3").one()
+        assert archive.get_content(post) == "<p>Content of post 3</p>"
+
+    [index] = archive._indexes.values()
+    assert len(index) == 6
+    assert list(archive._members.values()) == [
+        {f"{URL}/p/2": "<p>Content of post 2</p>", f"{URL}/p/3": "<p>Content of post 3</p>"}
+    ]
+
+
+def test_rearchived_post_reads_latest_content(db_manager: DatabaseManager, tmp_path: Path) -> None:
+    """A post archived again (e.g. after an interrupted run) reads back its latest content."""
+    _add_posts(db_manager, 2)
+    archive = ContentArchive(str(tmp_path / "archive"))
+    archive.archive_older_than(db_manager)
+    _archived_content(db_manager, archive)  # Load the index before the next append
+
+    with db_manager.get_session() as session:
+        session.query(PostModel).filter_by(url=f"{URL}/p/0").update({"content": "<p>Edited</p>"})
+        session.commit()
+    archive.archive_older_than(db_manager)
+
+    for reader in (archive, ContentArchive(str(tmp_path / "archive"))):
+        assert _archived_content(db_manager, reader)[f"{URL}/p/0"] == "<p>Edited</p>"
+
+
+def test_truncated_last_member_keeps_earlier_posts(db_manager: DatabaseManager, tmp_path: Path) -> None:
+    """A batch cut short by an interrupted append doesn't make the rest of the file unreadable."""
+    _add_posts(db_manager, 4)
+    archive = ContentArchive(str(tmp_path / "archive"))
+    archive.archive_older_than(db_manager, batch_size=2)
+    [path] = (tmp_path / "archive").iterdir()
+    os.truncate(path, path.stat().st_size - 20)
+
+    contents = _archived_content(db_manager, ContentArchive(str(tmp_path / "archive")))
+
+    assert contents[f"{URL}/p/0"] == "<p>Content of post 0</p>"
+    assert contents[f"{URL}/p/1"] == "<p>Content of post 1</p>"
+
+
+def test_partitioned_posts_table_builds_without_warnings() -> None:
+    """The partitioned posts table declares (id, published_date) as its only primary key."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        posts = _partitioned_posts_table()
+        ddl = str(CreateTable(posts).compile(dialect=postgresql.dialect()))
+
+    assert list(posts.primary_key.columns.keys()) == ["id", "published_date"]
+    assert "PRIMARY KEY (id, published_date)" in ddl
+    assert "PARTITION BY RANGE (published_date)" in ddl
@@ -0,0 +1,114 @@
+"""Tests for the pool of authenticated sessions and cookie reloading."""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from sloan_brain_substack.client import Auth
+
+
+def _write_cookies(path: Path, value: str) -> None:
+    """Write a cookies file holding one substack.sid cookie, with a new modification time."""
+    path.write_text(json.dumps([{"name": "substack.sid", "value": value, "domain": ".substack.com"}]))
+    stamp = time.time_ns() + 1_000_000
+    os.utime(path, ns=(stamp, stamp))
+
+
+def _sid(auth: Auth) -> str | None:
+    """Get the session cookie a checked-out session sends."""
+    with auth.checkout() as session:
+        return session.cookies.get("substack.sid")
+
+
+def test_pool_is_capped_and_times_out(tmp_path: Path) -> None:
+    """No more than pool_size sessions are created; a checkout beyond that waits, then raises."""
+    path = tmp_path / "cookies.json"
+    _write_cookies(path, "first")
+    auth = Auth(str(path), pool_size=2, pool_timeout=0.05)
+
+    with auth.checkout() as first, auth.checkout() as second:
+        assert first is not second
+        with pytest.raises(TimeoutError):
+            with auth.checkout():
+                pass
+
+    with auth.checkout() as again:
+        assert again in (first, second)
+    assert len(auth._generations) == 2
+
+
+def test_concurrent_checkouts_never_share_a_session(tmp_path: Path) -> None:
+    """Sessions are handed to one thread at a time, and all threads get served."""
+    path = tmp_path / "cookies.json"
+    _write_cookies(path, "first")
+    auth = Auth(str(path), pool_size=3)
+    in_use: set[int] = set()
+    used: set[int] = set()
+    lock = threading.Lock()
+    overlaps = []
+
+    def _work() -> None:
+        for _ in range(20):
+            with auth.checkout() as session:
+                with lock:
+                    if id(session) in in_use:
+                        overlaps.append(session)
+                    in_use.add(id(session))
+                    used.add(id(session))
+                time.sleep(0.001)
+                with lock:
+                    in_use.discard(id(session))
+
+    threads = [threading.Thread(target=_work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert overlaps == []
+    assert len(used) <= 3
+
+
+def test_changed_cookies_file_is_reloaded(tmp_path: Path) -> None:
+    """Pooled sessions pick up cookies written after they were created."""
+    path = tmp_path / "cookies.json"
+    _write_cookies(path, "first")
+    auth = Auth(str(path), pool_size=1)
+    assert _sid(auth) == "first"
+
+    _write_cookies(path, "second")
+
+    assert _sid(auth) == "second"
+
+
+def test_unreadable_cookies_file_is_read_once(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """A broken file keeps the last good cookies and is not re-read until it changes again."""
+    path = tmp_path / "cookies.json"
+    _write_cookies(path, "first")
+    auth = Auth(str(path), pool_size=1)
+    capsys.readouterr()
+
+    path.write_text('[{"name": "substack.sid", "val')
+    for _ in range(3):
+        assert _sid(auth) == "first"
+        assert auth.authenticated
+    assert capsys.readouterr().out.count("Failed to load cookies") == 1
+
+    _write_cookies(path, "second")
+    assert _sid(auth) == "second"
+
+
+def test_missing_cookies_file_loads_once_created(tmp_path: Path) -> None:
+    """An Auth created before logging in picks up the cookies file once it exists."""
+    path = tmp_path / "cookies.json"
+    auth = Auth(str(path))
+    assert not auth.authenticated
+
+    _write_cookies(path, "first")
+
+    assert auth.authenticated
+    assert _sid(auth) == "first"
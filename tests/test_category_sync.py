@@ -0,0 +1,147 @@
+"""Tests for syncing newsletter metadata and membership from category listings."""
+
+from collections.abc import Iterator
+from typing import Any
+
+from sloan_brain_substack.models import CategoryEvent, CategoryMembership, DatabaseManager
+from sloan_brain_substack.models import Newsletter as NewsletterModel
+from sloan_brain_substack.monitor import SubstackMonitor
+
+
+class FakeCategory:
+    """Serves a category listing from memory, counting the pages read."""
+
+    def __init__(self, pages: list[list[dict[str, Any]]], category_id: int = 1) -> None:
+        """Create a FakeCategory listing the given pages of publications."""
+        self.id = category_id
+        self.pages = pages
+        self.pages_read = 0
+
+    def iter_newsletter_pages(self, fields: tuple[str, ...] | None = None) -> Iterator[list[dict[str, Any]]]:
+        """Yield the listing one page at a time, as Category.iter_newsletter_pages does."""
+        for page in self.pages:
+            self.pages_read += 1
+            yield [
+                {key: value for key, value in publication.items() if fields is None or key in fields}
+                for publication in page
+            ]
+
+
+def _publication(publication_id: int, subdomain: str, **fields: Any) -> dict[str, Any]:
+    """Build a publication as listed by a category page."""
+    return {
+        "id": publication_id,
+        "base_url": f"https://{subdomain}.substack.com",
+        "name": subdomain.title(),
+        "hero_text": f"About {subdomain}",
+        "author_name": "Author",
+        **fields,
+    }
+
+
+def _stored_newsletters(db_manager: DatabaseManager) -> dict[str, tuple]:
+    """Get the stored newsletters as url -> (publication_id, name, description)."""
+    with db_manager.get_session() as session:
+        return {
+            newsletter.url: (newsletter.publication_id, newsletter.name, newsletter.description)
+            for newsletter in session.query(NewsletterModel)
+        }
+
+
+def test_metadata_sync_inserts_and_updates(db_manager: DatabaseManager) -> None:
+    """New publications are inserted, and known ones only take the non-empty values that changed."""
+    monitor = SubstackMonitor(db_manager)
+    with db_manager.get_session() as session:
+        session.add(NewsletterModel(url="https://foo.substack.com", name="Foo", description="Kept"))
+        session.commit()
+    category = FakeCategory([[_publication(1, "foo", hero_text=None, description=None)], [_publication(2, "bar")]])
+
+    assert monitor.sync_category_metadata(category, batch_size=1) == {"inserted": 1, "updated": 1}
+    assert _stored_newsletters(db_manager) == {
+        "https://foo.substack.com": (1, "Foo", "Kept"),
+        "https://bar.substack.com": (2, "Bar", "About bar"),
+    }
+    assert monitor.sync_category_metadata(category) == {"inserted": 0, "updated": 0}
+
+
+def test_metadata_sync_matches_rows_stored_unnormalized(db_manager: DatabaseManager) -> None:
+    """A row stored with a trailing slash or without a scheme is updated and normalized, not duplicated."""
+    monitor = SubstackMonitor(db_manager)
+    with db_manager.get_session() as session:
+        session.add(NewsletterModel(url="https://foo.substack.com/", name="Foo"))
+        session.add(NewsletterModel(url="bar.substack.com", name="Bar"))
+        session.commit()
+
+    result = monitor.sync_category_metadata(FakeCategory([[_publication(1, "foo"), _publication(2, "bar")]]))
+
+    assert result == {"inserted": 0, "updated": 2}
+    assert set(_stored_newsletters(db_manager)) == {"https://foo.substack.com", "https://bar.substack.com"}
+
+
+def test_metadata_sync_can_leave_new_publications_out(db_manager: DatabaseManager) -> None:
+    """With insert_new=False only newsletters already monitored are enriched."""
+    monitor = SubstackMonitor(db_manager)
+
+    assert monitor.sync_category_metadata(FakeCategory([[_publication(1, "foo")]]), insert_new=False) == {
+        "inserted": 0,
+        "updated": 0,
+    }
+    assert _stored_newsletters(db_manager) == {}
+
+
+def _events(db_manager: DatabaseManager) -> list[tuple[str, int]]:
+    """Get the stored category events as (event_type, publication_id), oldest first."""
+    with db_manager.get_session() as session:
+        return [
+            (event.event_type, event.publication_id)
+            for event in session.query(CategoryEvent).order_by(CategoryEvent.id)
+        ]
+
+
+def test_first_membership_sync_records_members_without_join_events(db_manager: DatabaseManager) -> None:
+    """The first sync takes the listing as the baseline; only later newcomers are recorded as joining."""
+    monitor = SubstackMonitor(db_manager)
+    category = FakeCategory([[_publication(1, "foo"), _publication(2, "bar")], [_publication(3, "baz")]])
+
+    assert monitor.sync_category_membership(category, known_run=1) == {"pages": 2, "seen": 3, "joined": 3, "left": 0}
+    with db_manager.get_session() as session:
+        assert session.query(CategoryMembership).count() == 3
+    assert _events(db_manager) == []
+
+    category.pages.append([_publication(4, "qux")])
+    assert monitor.sync_category_membership(category, full=True)["joined"] == 1
+    assert _events(db_manager) == [("joined", 4)]
+
+
+def test_incremental_membership_sync_stops_after_a_run_of_known_members(db_manager: DatabaseManager) -> None:
+    """Paging stops once known_run known publications were seen in a row; newcomers after that wait."""
+    monitor = SubstackMonitor(db_manager)
+    monitor.sync_category_membership(FakeCategory([[_publication(i, f"pub{i}") for i in range(1, 5)]]))
+    category = FakeCategory([
+        [_publication(5, "new"), _publication(1, "pub1")],
+        [_publication(2, "pub2"), _publication(3, "pub3")],
+        [_publication(4, "pub4"), _publication(6, "later")],
+    ])
+
+    result = monitor.sync_category_membership(category, known_run=3)
+
+    assert result == {"pages": 2, "seen": 4, "joined": 1, "left": 0}
+    assert category.pages_read == 2
+    assert _events(db_manager) == [("joined", 5)]
+
+    assert monitor.sync_category_membership(category, full=True)["joined"] == 1
+    assert category.pages_read == 5
+    assert _events(db_manager) == [("joined", 5), ("joined", 6)]
+
+
+def test_membership_leaves_are_only_recorded_by_a_full_sync(db_manager: DatabaseManager) -> None:
+    """A publication missing from the listing is not taken as leaving unless every page was read."""
+    monitor = SubstackMonitor(db_manager)
+    monitor.sync_category_membership(FakeCategory([[_publication(1, "foo"), _publication(2, "bar")]]))
+    category = FakeCategory([[_publication(1, "foo")]])
+
+    assert monitor.sync_category_membership(category, known_run=5)["left"] == 0
+    assert _events(db_manager) == []
+
+    assert monitor.sync_category_membership(category, full=True)["left"] == 1
+    assert _events(db_manager) == [("left", 2)]
@@ -0,0 +1,69 @@
+"""Tests for JSON decoding and field projection of API payloads."""
+
+import json
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from sloan_brain_substack.client import utils
+from sloan_brain_substack.client.metrics import snapshot
+from sloan_brain_substack.client.post import SUMMARY_FIELDS
+
+
+def _payload(count: int) -> bytes:
+    """Build an archive page whose posts carry a large body_html."""
+    items = [
+        {
+            "id": i,
+            "canonical_url": f"https://example.substack.com/p/post-{i}",
+            "title": f"Post {i}",
+            "body_html": f"<p>{'Body of post %d. ' % i * 2000}</p>",
+        }
+        for i in range(count)
+    ]
+    return json.dumps(items).encode("utf-8")
+
+
+def _retained_bytes(payload: bytes, fields: Any) -> int:
+    """Measure the memory still held by the decoded payload."""
+    tracemalloc.start()
+    try:
+        kept = utils.decode_json(payload, fields)
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return current
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_projection_keeps_only_requested_fields(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    """Both parsers decode the same payload, and projection drops every other key."""
+    if use_orjson and utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+
+    items = utils.decode_json(_payload(3), fields=("id", "title"))
+
+    assert items == [{"id": i, "title": f"Post {i}"} for i in range(3)]
+    assert utils.decode_json(b'{"id": 1, "body_html": "x"}', fields=("id", "missing")) == {"id": 1}
+
+
+def test_projection_releases_unused_values() -> None:
+    """A projected page keeps a small fraction of the memory of the full decoded page."""
+    payload = _payload(50)
+
+    full = _retained_bytes(payload, None)
+    projected = _retained_bytes(payload, SUMMARY_FIELDS)
+
+    assert projected * 20 < full, f"{projected} bytes projected vs {full} bytes decoded"
+
+
+def test_decode_time_is_counted_as_parse_time() -> None:
+    """Decoding is attributed to the calling thread's parse time."""
+    before = snapshot()
+    utils.decode_json(_payload(20))
+
+    assert snapshot().since(before).parse_seconds > 0
@@ -0,0 +1,38 @@
+"""Tests for the per-backend engine profiles."""
+
+from pathlib import Path
+
+from sqlalchemy import text
+
+from sloan_brain_substack.models import POSTGRESQL_ENGINE_OPTIONS, DatabaseManager, _engine_options
+
+
+def _pragmas(db_manager: DatabaseManager) -> dict[str, object]:
+    """Read the PRAGMAs the profile sets from a new connection."""
+    with db_manager.engine.connect() as conn:
+        return {
+            name: conn.execute(text(f"PRAGMA {name}")).scalar()
+            for name in ("journal_mode", "synchronous", "busy_timeout")
+        }
+
+
+def test_sqlite_profile_sets_pragmas(tmp_path: Path) -> None:
+    """Tuned SQLite connections use WAL, synchronous=NORMAL and a busy timeout."""
+    db_manager = DatabaseManager(f"sqlite:///{tmp_path / 'tuned.db'}")
+
+    assert _pragmas(db_manager) == {"journal_mode": "wal", "synchronous": 1, "busy_timeout": 5000}
+
+
+def test_untuned_sqlite_keeps_driver_defaults(tmp_path: Path) -> None:
+    """With tune=False connections are left as the driver opens them."""
+    db_manager = DatabaseManager(f"sqlite:///{tmp_path / 'default.db'}", tune=False)
+
+    assert _pragmas(db_manager)["journal_mode"] == "delete"
+
+
+def test_explicit_options_override_the_profile() -> None:
+    """Engine options passed by the caller win over the PostgreSQL profile."""
+    options = _engine_options("postgresql://localhost/substack", True, {"pool_size": 3})
+
+    assert options == {**POSTGRESQL_ENGINE_OPTIONS, "pool_size": 3}
+    assert _engine_options("postgresql://localhost/substack", False, {}) == {}
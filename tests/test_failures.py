@@ -0,0 +1,44 @@
+"""Tests for how failed checks are recorded."""
+
+import pytest
+from conftest import FakeSubstack
+
+from sloan_brain_substack.models import DatabaseManager
+from sloan_brain_substack.models import Newsletter as NewsletterModel
+from sloan_brain_substack.monitor import SubstackMonitor
+
+URL = "https://example.substack.com"
+
+
+def _feed_etag(db_manager: DatabaseManager) -> str | None:
+    """Get the stored feed ETag of the only newsletter."""
+    with db_manager.get_session() as session:
+        return session.query(NewsletterModel).one().feed_etag
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_failed_archive_fetch_keeps_feed_validators(
+    db_manager: DatabaseManager, substack: FakeSubstack, pipelined: bool
+) -> None:
+    """A post missed because the archive failed is found once it recovers, not hidden by a 304."""
+    substack.publish(URL, "first")
+    monitor = SubstackMonitor(db_manager, full_check_interval=None)
+    monitor.add_newsletter(URL)
+    monitor.check_newsletter_updates(URL)
+    etag = _feed_etag(db_manager)
+
+    substack.publish(URL, "second")
+    substack.failing.add(URL)
+    if pipelined:
+        [result] = monitor.check_all_newsletters_pipelined(max_workers=1)
+        assert result.error is not None
+    else:
+        with pytest.raises(RuntimeError):
+            monitor.check_newsletter_updates(URL)
+    assert _feed_etag(db_manager) == etag
+
+    substack.failing.clear()
+    result = monitor.check_newsletter_updates(URL)
+
+    assert [post["url"] for post in result.new_posts] == [f"{URL}/p/second"]
+    assert _feed_etag(db_manager) != etag
@@ -0,0 +1,62 @@
+"""Tests for skipping unchanged newsletters with the feed probe."""
+
+from datetime import datetime, timedelta
+
+from conftest import FakeSubstack
+
+from sloan_brain_substack.models import DatabaseManager
+from sloan_brain_substack.models import Newsletter as NewsletterModel
+from sloan_brain_substack.monitor import SubstackMonitor
+
+URL = "https://example.substack.com"
+
+
+def _age_full_check(db_manager: DatabaseManager, age: timedelta) -> None:
+    """Pretend the newsletter's last full archive read happened some time ago."""
+    with db_manager.get_session() as session:
+        newsletter = session.query(NewsletterModel).one()
+        newsletter.last_full_check_at = datetime.utcnow() - age
+        session.commit()
+
+
+def test_probe_skips_archive_of_unchanged_newsletter(db_manager: DatabaseManager, substack: FakeSubstack) -> None:
+    """Once a full read is recorded, an unchanged feed skips the archive."""
+    substack.publish(URL, "first")
+    monitor = SubstackMonitor(db_manager)
+    monitor.add_newsletter(URL)
+
+    assert len(monitor.check_newsletter_updates(URL).new_posts) == 1
+    result = monitor.check_newsletter_updates(URL)
+
+    assert result.unchanged
+    assert substack.archive_reads[URL] == 1
+
+
+def test_full_read_is_forced_once_interval_elapsed(db_manager: DatabaseManager, substack: FakeSubstack) -> None:
+    """Edits hidden from the probe are found by the periodic full archive read."""
+    post = substack.publish(URL, "first")
+    monitor = SubstackMonitor(db_manager, full_check_interval=timedelta(hours=6))
+    monitor.add_newsletter(URL)
+    monitor.check_newsletter_updates(URL)
+
+    substack.edit(post["canonical_url"], audience="only_paid")
+    assert monitor.check_newsletter_updates(URL).unchanged
+
+    _age_full_check(db_manager, timedelta(hours=7))
+    result = monitor.check_newsletter_updates(URL)
+
+    assert not result.unchanged
+    assert [change["event_type"] for change in result.changed_posts] == ["audience_changed"]
+    assert substack.archive_reads[URL] == 2
+
+
+def test_probe_can_skip_indefinitely(db_manager: DatabaseManager, substack: FakeSubstack) -> None:
+    """Without a full check interval the probe alone decides."""
+    substack.publish(URL, "first")
+    monitor = SubstackMonitor(db_manager, full_check_interval=None)
+    monitor.add_newsletter(URL)
+    monitor.check_newsletter_updates(URL)
+
+    _age_full_check(db_manager, timedelta(days=30))
+
+    assert monitor.check_newsletter_updates(URL).unchanged
@@ -0,0 +1,55 @@
+"""Tests for the persistent handle cache."""
+
+import json
+import time
+from pathlib import Path
+
+from sloan_brain_substack.client.handle_cache import HandleCache
+
+
+def test_entries_are_written_on_save_only(tmp_path: Path) -> None:
+    """Setting entries doesn't touch the file until the cache is saved."""
+    path = tmp_path / "handles.json"
+    cache = HandleCache(str(path))
+
+    cache.set_renamed("old", "new")
+    cache.set_deleted("gone")
+    assert not path.exists()
+
+    cache.save()
+    reloaded = HandleCache(str(path))
+    assert reloaded.get_renamed("old") == "new"
+    assert reloaded.is_deleted("gone")
+
+
+def test_save_merges_entries_saved_by_other_processes(tmp_path: Path) -> None:
+    """Entries another cache saved since this one was loaded survive, and the newest check wins."""
+    path = tmp_path / "handles.json"
+    first = HandleCache(str(path))
+    second = HandleCache(str(path))
+
+    first.set_deleted("shared")
+    first.set_renamed("only-first", "renamed-first")
+    second.set_renamed("only-second", "renamed-second")
+    time.sleep(0.01)
+    second.set_renamed("shared", "came-back")
+
+    second.save()
+    first.save()
+
+    entries = json.loads(path.read_text())
+    assert set(entries) == {"shared", "only-first", "only-second"}
+    assert entries["shared"]["new_handle"] == "came-back"
+    assert first.get_renamed("only-second") == "renamed-second"
+
+
+def test_save_without_changes_does_not_write(tmp_path: Path) -> None:
+    """A cache with nothing new leaves the file alone, and the with block saves on exit."""
+    path = tmp_path / "handles.json"
+    with HandleCache(str(path)) as cache:
+        cache.set_deleted("gone")
+    assert "gone" in json.loads(path.read_text())
+
+    path.write_text("{}")
+    HandleCache(str(path)).save()
+    assert path.read_text() == "{}"
@@ -0,0 +1,42 @@
+"""Guards on what importing parts of the package pulls in, checked in a fresh interpreter."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def _loaded_after(statement: str, modules: list[str]) -> list[str]:
+    """Run an import statement in a new interpreter and return which of the modules it loaded."""
+    code = f"import sys\n{statement}\nprint(' '.join(name for name in {modules!r} if name in sys.modules))"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env).stdout
+    return output.split()
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import sloan_brain_substack.models",
+        "import sloan_brain_substack.monitor",
+        "from sloan_brain_substack import DatabaseManager, SubstackMonitor",
+    ],
+)
+def test_sync_api_does_not_load_asyncio_extension(statement: str) -> None:
+    """The sync database API works without the async extras (greenlet) installed."""
+    assert _loaded_after(statement, ["sqlalchemy.ext.asyncio", "greenlet"]) == []
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import sloan_brain_substack",
+        "import sloan_brain_substack.client",
+        "from sloan_brain_substack.client import Newsletter, Post, User",
+        "from sloan_brain_substack import Newsletter, Post",
+    ],
+)
+def test_client_does_not_load_database_or_parser_stacks(statement: str) -> None:
+    """Client-only jobs don't pay for SQLAlchemy, BeautifulSoup or httpx at import time."""
+    assert _loaded_after(statement, ["sqlalchemy", "bs4", "httpx"]) == []
@@ -0,0 +1,73 @@
+"""Tests for upgrading databases created by earlier versions."""
+
+from pathlib import Path
+
+from sqlalchemy import inspect
+
+from sloan_brain_substack.models import Base, DatabaseManager
+
+# Schema created by the first release, before the monitoring columns were added
+INITIAL_SCHEMA = (
+    """
+    CREATE TABLE newsletters (
+        id INTEGER NOT NULL PRIMARY KEY,
+        url VARCHAR(500) NOT NULL UNIQUE,
+        name VARCHAR(200) NOT NULL,
+        description TEXT,
+        author VARCHAR(200),
+        created_at DATETIME NOT NULL,
+        updated_at DATETIME NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE posts (
+        id INTEGER NOT NULL PRIMARY KEY,
+        url VARCHAR(500) NOT NULL UNIQUE,
+        title VARCHAR(500) NOT NULL,
+        subtitle TEXT,
+        published_date DATETIME NOT NULL,
+        is_free BOOLEAN NOT NULL,
+        post_id VARCHAR(200),
+        content TEXT,
+        created_at DATETIME NOT NULL,
+        newsletter_id INTEGER NOT NULL REFERENCES newsletters (id)
+    )
+    """,
+    "INSERT INTO newsletters (url, name, created_at, updated_at) "
+    "VALUES ('https://example.substack.com', 'Example', '2024-01-01', '2024-01-01')",
+)
+
+
+def _initial_database(path: Path) -> DatabaseManager:
+    """Create a database with the initial schema and one newsletter."""
+    db_manager = DatabaseManager(f"sqlite:///{path}")
+    with db_manager.engine.begin() as conn:
+        for statement in INITIAL_SCHEMA:
+            conn.exec_driver_sql(statement)
+    return db_manager
+
+
+def test_migrate_adds_missing_tables_columns_and_indexes(tmp_path: Path) -> None:
+    """Every table, column and index of the current models exists after migrating."""
+    db_manager = _initial_database(tmp_path / "substack.db")
+
+    applied = db_manager.migrate()
+
+    assert "ALTER TABLE newsletters ADD COLUMN publication_id INTEGER" in applied
+    inspector = inspect(db_manager.engine)
+    for table in Base.metadata.sorted_tables:
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        assert columns == set(table.columns.keys()), table.name
+        indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        assert {index.name for index in table.indexes} <= indexes, table.name
+
+
+def test_migrate_fills_defaults_and_is_idempotent(tmp_path: Path) -> None:
+    """Existing rows get the new columns' defaults, and a second run does nothing."""
+    db_manager = _initial_database(tmp_path / "substack.db")
+    db_manager.migrate()
+
+    with db_manager.engine.connect() as conn:
+        row = conn.exec_driver_sql("SELECT post_count, consecutive_failures, feed_etag FROM newsletters").one()
+    assert tuple(row) == (0, 0, None)
+    assert db_manager.migrate() == []
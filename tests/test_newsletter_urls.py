@@ -0,0 +1,36 @@
+"""Tests for matching newsletters by URL however the URL is written."""
+
+from datetime import datetime
+
+from conftest import FakeSubstack
+
+from sloan_brain_substack.models import DatabaseManager
+from sloan_brain_substack.models import Newsletter as NewsletterModel
+from sloan_brain_substack.monitor import SubstackMonitor
+
+URL = "https://example.substack.com"
+
+
+def test_urls_are_normalized_on_add_and_lookup(db_manager: DatabaseManager, substack: FakeSubstack) -> None:
+    """A newsletter added without scheme or with a trailing slash is found by any spelling of its URL."""
+    substack.publish(URL, "first")
+    monitor = SubstackMonitor(db_manager)
+
+    added = monitor.add_newsletter("example.substack.com/")
+
+    assert added.url == URL
+    assert monitor.add_newsletter(f"{URL}/").id == added.id
+    assert monitor.add_newsletters([URL, "example.substack.com"]) == []
+    assert len(monitor.check_newsletter_updates(f"{URL}/").new_posts) == 1
+    assert monitor.get_newsletter_stats("example.substack.com")["total_posts"] == 1
+
+
+def test_unnormalized_rows_are_found_as_added(db_manager: DatabaseManager, substack: FakeSubstack) -> None:
+    """Rows stored with a trailing slash by an earlier version are still found by that URL."""
+    with db_manager.get_session() as session:
+        session.add(NewsletterModel(url=f"{URL}/", name="Example", created_at=datetime.utcnow()))
+        session.commit()
+    monitor = SubstackMonitor(db_manager)
+
+    assert monitor.get_newsletter_stats(f"{URL}/")["total_posts"] == 0
+    assert monitor.add_newsletters([URL]) == []
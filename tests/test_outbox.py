@@ -0,0 +1,60 @@
+"""Tests for reading the outbox in id order without skipping late commits."""
+
+from datetime import datetime, timedelta
+
+from sloan_brain_substack.models import DatabaseManager, OutboxEvent
+from sloan_brain_substack.models import Newsletter as NewsletterModel
+from sloan_brain_substack.outbox import OutboxConsumer
+
+
+def _write_event(db_manager: DatabaseManager, event_id: int, age: timedelta = timedelta(0)) -> None:
+    """Commit an outbox event with a given id, created some time ago."""
+    with db_manager.get_session() as session:
+        if session.get(NewsletterModel, 1) is None:
+            session.add(NewsletterModel(id=1, url="https://example.substack.com", name="Example"))
+        session.add(
+            OutboxEvent(
+                id=event_id,
+                event_type="post_created",
+                newsletter_id=1,
+                post_url=f"https://example.substack.com/p/{event_id}",
+                created_at=datetime.utcnow() - age,
+            )
+        )
+        session.commit()
+
+
+def _claimed_ids(consumer: OutboxConsumer) -> list[int]:
+    """Claim and acknowledge a batch, returning its event ids."""
+    events = consumer.claim()
+    consumer.ack(events)
+    return [event.id for event in events]
+
+
+def test_contiguous_events_are_delivered_immediately(db_manager: DatabaseManager) -> None:
+    """Fresh events without gaps before them don't wait for the settle time."""
+    for event_id in (1, 2, 3):
+        _write_event(db_manager, event_id)
+
+    assert _claimed_ids(OutboxConsumer(db_manager, "indexer")) == [1, 2, 3]
+
+
+def test_cursor_does_not_pass_an_open_gap(db_manager: DatabaseManager) -> None:
+    """An id committed late behind a newer one is still delivered, before the newer one."""
+    consumer = OutboxConsumer(db_manager, "indexer")
+    _write_event(db_manager, 1)
+    _write_event(db_manager, 3)
+
+    assert _claimed_ids(consumer) == [1]
+    assert _claimed_ids(consumer) == []
+
+    _write_event(db_manager, 2)
+    assert _claimed_ids(consumer) == [2, 3]
+
+
+def test_gap_is_skipped_once_settled(db_manager: DatabaseManager) -> None:
+    """Ids of rolled-back transactions never fill in, so a settled gap is passed."""
+    _write_event(db_manager, 1)
+    _write_event(db_manager, 3, age=timedelta(minutes=1))
+
+    assert _claimed_ids(OutboxConsumer(db_manager, "indexer", settle_time=timedelta(seconds=30))) == [1, 3]
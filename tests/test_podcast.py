@@ -0,0 +1,77 @@
+"""Tests for resuming interrupted podcast downloads."""
+
+from pathlib import Path
+from typing import Any, Iterator
+
+import requests
+
+from sloan_brain_substack.client.podcast import PodcastDownloader, PodcastEpisode
+
+AUDIO = bytes(range(256)) * 64
+ETAG = '"audio-v1"'
+
+
+class _Response:
+    """Streams a slice of the audio, optionally breaking off partway like a dropped chunked transfer."""
+
+    def __init__(self, status_code: int, body: bytes, break_after: int | None = None) -> None:
+        """Create a response serving ``body``."""
+        self.status_code = status_code
+        self.headers = {"ETag": ETAG}
+        self._body = body
+        self._break_after = break_after
+
+    def __enter__(self) -> "_Response":
+        """Enter the response context."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Leave the response context."""
+
+    def raise_for_status(self) -> None:
+        """Accept every response served."""
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        """Yield the body, raising ChunkedEncodingError where the transfer breaks off."""
+        for start in range(0, len(self._body), chunk_size):
+            if self._break_after is not None and start >= self._break_after:
+                raise requests.exceptions.ChunkedEncodingError("Connection broken: IncompleteRead")
+            yield self._body[start : start + chunk_size]
+
+
+class _AudioHost:
+    """Serves the audio with Range support; the first download breaks off halfway."""
+
+    def __init__(self) -> None:
+        """Create an _AudioHost that has served nothing yet."""
+        self.ranges: list[str | None] = []
+
+    def head(self, url: str, **kwargs: Any) -> requests.Response:
+        """Answer HEAD with the size, ETag and Range support of the audio."""
+        response = requests.Response()
+        response.status_code = 200
+        response.headers.update({"Content-Length": str(len(AUDIO)), "ETag": ETAG, "Accept-Ranges": "bytes"})
+        return response
+
+    def get(self, url: str, headers: dict[str, str], **kwargs: Any) -> _Response:
+        """Stream the audio, from the requested offset if a Range is given."""
+        self.ranges.append(headers.get("Range"))
+        if "Range" in headers:
+            offset = int(headers["Range"].removeprefix("bytes=").rstrip("-"))
+            return _Response(206, AUDIO[offset:])
+        return _Response(200, AUDIO, break_after=len(AUDIO) // 2)
+
+
+def test_broken_chunked_transfer_is_resumed(tmp_path: Path) -> None:
+    """A download cut off mid-stream resumes from the partial file instead of failing."""
+    host = _AudioHost()
+    downloader = PodcastDownloader(str(tmp_path), chunk_size=1024, session=host)
+    episode = PodcastEpisode(
+        id=1, url="https://example.substack.com/p/episode", title="Episode", audio_url="https://cdn/a.mp3"
+    )
+
+    result = downloader.download(episode)
+
+    assert result.status == "resumed", result.error
+    assert Path(result.path).read_bytes() == AUDIO
+    assert host.ranges == [None, f"bytes={len(AUDIO) // 2}-"]
@@ -0,0 +1,72 @@
+"""Regression guards for the compact archive records."""
+
+import tracemalloc
+from typing import Any, Callable
+
+from sloan_brain_substack.client.post import PostSummary
+
+
+def _archive_item(i: int) -> dict[str, Any]:
+    """Build a synthetic archive item shaped like the archive API's."""
+    return {
+        "id": 100000 + i,
+        "canonical_url": f"https://example.substack.com/p/post-{i}",
+        "slug": f"post-{i}",
+        "title": f"Post number {i}",
+        "subtitle": f"Subtitle of post {i} " * 5,
+        "description": f"Description of post {i} " * 8,
+        "audience": "everyone",
+        "post_date": "2024-01-01T00:00:00.000Z",
+        "updated_at": "2024-01-02T00:00:00.000Z",
+        "publication_id": 42,
+        "wordcount": 1200,
+        "truncated_body_text": f"Body text of post {i} " * 40,
+        "cover_image": f"https://substackcdn.com/image/{i}.png",
+        "reactions": {"❤": i},
+        "publishedBylines": [{"id": 7, "name": "Author", "handle": "author", "bio": "Bio " * 20}],
+        "postTags": [{"id": "t", "name": "Tag", "slug": "tag"}],
+    }
+
+
+def _retained_bytes(build: Callable[[], Any]) -> int:
+    """Measure the memory still held by what ``build`` returns."""
+    tracemalloc.start()
+    try:
+        kept = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return current
+
+
+def test_summary_fields_match_archive_item() -> None:
+    """Summaries keep the identifying fields of the archive item, without a per-instance dict."""
+    item = _archive_item(1)
+    summary = PostSummary.from_archive(item)
+
+    assert summary.id == item["id"]
+    assert summary.url == item["canonical_url"]
+    assert summary.title == item["title"]
+    assert summary.publication_id == 42
+    assert summary.fingerprint == PostSummary.from_archive(dict(item)).fingerprint
+    assert not hasattr(summary, "__dict__")
+
+
+def test_fingerprint_changes_when_post_is_edited() -> None:
+    """Editing the body text changes the archive fingerprint."""
+    item = _archive_item(1)
+    edited = dict(item, truncated_body_text="Rewritten body")
+
+    assert PostSummary.from_archive(item).fingerprint != PostSummary.from_archive(edited).fingerprint
+
+
+def test_summaries_hold_far_less_memory_than_raw_items() -> None:
+    """A list of summaries retains a fraction of the memory of the raw archive items."""
+    count = 2000
+
+    raw = _retained_bytes(lambda: [_archive_item(i) for i in range(count)])
+    summaries = _retained_bytes(lambda: [PostSummary.from_archive(_archive_item(i)) for i in range(count)])
+
+    # Raw items keep every field (body text, bylines, ...) alive; summaries keep only what triage needs
+    assert summaries * 3 < raw, f"{summaries} bytes of summaries vs {raw} bytes of raw items"
@@ -0,0 +1,41 @@
+"""Tests for the order in which due newsletters are checked."""
+
+from datetime import datetime, timedelta
+
+from conftest import FakeSubstack
+
+from sloan_brain_substack.models import DatabaseManager
+from sloan_brain_substack.models import Newsletter as NewsletterModel
+from sloan_brain_substack.monitor import SubstackMonitor
+
+FIRST = "https://first.substack.com"
+SECOND = "https://second.substack.com"
+NEW = "https://new.substack.com"
+
+
+def _planned(monitor: SubstackMonitor, db_manager: DatabaseManager) -> list[str]:
+    """Get the URLs of the due newsletters, stalest first."""
+    with db_manager.get_session() as session:
+        due, _ = monitor._plan_checks(session, priority="stalest")
+    return [url for url, _ in due]
+
+
+def test_stalest_orders_by_last_successful_check(db_manager: DatabaseManager, substack: FakeSubstack) -> None:
+    """Row writes other than a successful check don't push a newsletter back in the queue."""
+    for url in (FIRST, SECOND):
+        substack.publish(url, "post")
+    monitor = SubstackMonitor(db_manager)
+    monitor.add_newsletter(FIRST)
+    monitor.add_newsletter(SECOND)
+    monitor.check_newsletter_updates(FIRST)
+    monitor.check_newsletter_updates(SECOND)
+
+    # A metadata refresh touches updated_at without checking for posts
+    with db_manager.get_session() as session:
+        session.query(NewsletterModel).filter_by(url=FIRST).update({
+            "updated_at": datetime.utcnow() + timedelta(hours=1)
+        })
+        session.commit()
+    monitor.add_newsletter(NEW)
+
+    assert _planned(monitor, db_manager) == [NEW, FIRST, SECOND]
@@ -0,0 +1,94 @@
+"""Tests for run profiles and the work recorded on failed checks."""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from conftest import FakeSubstack
+
+from sloan_brain_substack.async_monitor import AsyncSubstackMonitor
+from sloan_brain_substack.models import AsyncDatabaseManager, DatabaseManager
+from sloan_brain_substack.models import MonitorRun as MonitorRunModel
+from sloan_brain_substack.monitor import SubstackMonitor
+
+URLS = [f"https://n{i}.substack.com" for i in range(3)]
+
+
+def _slow_fetches(substack: FakeSubstack) -> None:
+    """Make archive reads take long enough to rank among the profile's top functions."""
+    get_posts = substack.get_posts
+
+    def _get_posts(*args: Any, **kwargs: Any) -> list:
+        time.sleep(0.05)
+        return get_posts(*args, **kwargs)
+
+    substack.get_posts = _get_posts
+
+
+def _stored_profile(db_manager: DatabaseManager) -> str:
+    """Get the profile report stored with the only run."""
+    with db_manager.get_session() as session:
+        return session.query(MonitorRunModel).one().profile
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_cprofile_covers_checks_run_by_workers(
+    db_manager: DatabaseManager, substack: FakeSubstack, pipelined: bool
+) -> None:
+    """A cProfile run profiles the fetches and writes, even when several workers were asked for."""
+    _slow_fetches(substack)
+    monitor = SubstackMonitor(db_manager)
+    for url in URLS:
+        substack.publish(url, "post")
+        monitor.add_newsletter(url)
+
+    if pipelined:
+        results = monitor.check_all_newsletters_pipelined(max_workers=4, profile="cprofile")
+    else:
+        results = monitor.check_all_newsletters(max_workers=4, profile="cprofile")
+
+    assert [len(result.new_posts) for result in results] == [1, 1, 1]
+    report = _stored_profile(db_manager)
+    assert "_fetch_updates" in report
+    assert ("_write_batch" if pipelined else "check_newsletter_updates") in report
+
+
+def test_async_cprofile_covers_fetches(tmp_path: Path, substack: FakeSubstack) -> None:
+    """The asyncio monitor accepts a profile, and a cProfile run sees the fetches."""
+    substack.publish(URLS[0], "post")
+    _slow_fetches(substack)
+    db_manager = AsyncDatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'substack.db'}")
+
+    async def _run() -> list:
+        await db_manager.create_tables()
+        monitor = AsyncSubstackMonitor(db_manager)
+        await monitor.add_newsletter(URLS[0])
+        results = await monitor.check_all_newsletters(profile="cprofile")
+        await db_manager.close()
+        return results
+
+    [result] = asyncio.run(_run())
+
+    assert len(result.new_posts) == 1
+    sync_manager = DatabaseManager(f"sqlite:///{tmp_path / 'substack.db'}")
+    assert "_fetch_updates" in _stored_profile(sync_manager)
+    sync_manager.close()
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_failed_result_keeps_fetch_work(db_manager: DatabaseManager, substack: FakeSubstack, pipelined: bool) -> None:
+    """A check whose fetch failed still reports the requests and time its fetch spent."""
+    monitor = SubstackMonitor(db_manager, use_feed_probe=False)
+    monitor.add_newsletter(URLS[0])
+    substack.failing.add(URLS[0])
+
+    if pipelined:
+        [result] = monitor.check_all_newsletters_pipelined(max_workers=1)
+    else:
+        [result] = monitor.check_all_newsletters()
+
+    assert result.error is not None
+    assert result.requests_made == 1
+    assert set(result.timings) >= {"fetch", "parse"}
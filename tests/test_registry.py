@@ -0,0 +1,43 @@
+"""Tests for the opt-in identity map of client objects."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+import requests
+
+from sloan_brain_substack.client import Newsletter, Post, User
+from sloan_brain_substack.client.handle_cache import HandleCache
+from sloan_brain_substack.client.registry import disable_identity_map, enable_identity_map
+
+
+@pytest.fixture
+def identity_map() -> Iterator[None]:
+    """Enable the identity map for one test."""
+    enable_identity_map()
+    yield
+    disable_identity_map()
+
+
+@pytest.mark.usefixtures("identity_map")
+def test_same_arguments_share_an_instance() -> None:
+    """Constructing a client object again returns the shared instance."""
+    assert Post("https://example.substack.com/p/a") is Post("https://example.substack.com/p/a")
+    assert Newsletter("https://example.substack.com/") is Newsletter("https://example.substack.com")
+    assert User("someone") is User("someone")
+
+
+@pytest.mark.usefixtures("identity_map")
+def test_users_with_other_session_or_cache_are_not_shared(tmp_path: Path) -> None:
+    """A user is only shared between callers using the same session and handle cache."""
+    session = requests.Session()
+    cache = HandleCache(f"{tmp_path}/handles.json")
+
+    assert User("someone", session=session) is not User("someone")
+    assert User("someone", handle_cache=cache) is not User("someone")
+    assert User("someone", handle_cache=cache, session=session) is User("someone", handle_cache=cache, session=session)
+
+
+def test_instances_are_not_shared_when_disabled() -> None:
+    """Without the identity map every construction builds a new object."""
+    assert User("someone") is not User("someone")
@@ -0,0 +1,111 @@
+"""Tests for searching many newsletters at once."""
+
+import threading
+
+import pytest
+
+from sloan_brain_substack.client import Newsletter
+from sloan_brain_substack.client.post import PostSummary
+from sloan_brain_substack.client.search import search_newsletters
+
+
+class FakeNewsletter(Newsletter):
+    """A Newsletter whose search is answered from memory, optionally waiting for an event first."""
+
+    def __init__(
+        self, url: str, posts: list[PostSummary], release: threading.Event | None = None, error: str | None = None
+    ) -> None:
+        """Create a FakeNewsletter returning the given posts, best-ranked first."""
+        super().__init__(url)
+        self.posts = posts
+        self.release = release
+        self.error = error
+        self.sortings: list[str] = []
+
+    def search_posts(
+        self, query: str, limit: int = None, summaries: bool = False, sorting: str = "new"
+    ) -> list[PostSummary]:
+        """Return the canned posts, once released."""
+        self.sortings.append(sorting)
+        if self.release is not None:
+            self.release.wait(5)
+        if self.error:
+            raise RuntimeError(self.error)
+        return self.posts[:limit]
+
+
+def _post(url: str, slug: str, post_date: str) -> PostSummary:
+    """Build a search result."""
+    return PostSummary(id=hash(slug), url=f"{url}/p/{slug}", title=slug, post_date=post_date)
+
+
+def _slugs(posts: list[PostSummary]) -> list[str]:
+    """Get the titles of the given posts, in order."""
+    return [post.title for post in posts]
+
+
+def test_deadline_returns_partial_results() -> None:
+    """Newsletters still searching at the deadline are reported as timed out; the others are returned."""
+    release = threading.Event()
+    fast = FakeNewsletter("https://fast.substack.com", [_post("https://fast.substack.com", "quick", "2024-01-01")])
+    slow = FakeNewsletter(
+        "https://slow.substack.com", [_post("https://slow.substack.com", "late", "2024-02-01")], release
+    )
+    broken = FakeNewsletter("https://broken.substack.com", [], error="HTTP 500")
+
+    try:
+        results = search_newsletters([slow, fast, broken], "query", timeout=0.2)
+    finally:
+        release.set()
+
+    assert _slugs(results.posts) == ["quick"]
+    assert results.completed == ["https://fast.substack.com"]
+    assert results.timed_out == ["https://slow.substack.com"]
+    assert results.failed == {"https://broken.substack.com": "HTTP 500"}
+    assert results.partial
+
+
+def test_relevance_interleaves_newsletters_by_rank() -> None:
+    """Each newsletter's best result comes first, then each one's second best, newest first within a rank."""
+    first = FakeNewsletter(
+        "https://first.substack.com",
+        [
+            _post("https://first.substack.com", slug, date)
+            for slug, date in [("a1", "2024-01-01"), ("a2", "2024-06-01"), ("a3", "2024-07-01")]
+        ],
+    )
+    second = FakeNewsletter(
+        "https://second.substack.com",
+        [
+            _post("https://second.substack.com", slug, date)
+            for slug, date in [("b1", "2024-03-01"), ("b2", "2024-02-01")]
+        ],
+    )
+
+    results = search_newsletters([first, second], "query", sort_by="relevance")
+
+    assert _slugs(results.posts) == ["b1", "a1", "a2", "b2", "a3"]
+    assert first.sortings == second.sortings == ["top"]
+    assert not results.partial
+    assert _slugs(search_newsletters([first, second], "query", sort_by="relevance", limit=3).posts) == [
+        "b1",
+        "a1",
+        "a2",
+    ]
+
+
+def test_date_sort_merges_newest_first() -> None:
+    """By default the merged results are ordered by date across newsletters."""
+    first = FakeNewsletter("https://first.substack.com", [_post("https://first.substack.com", "a1", "2024-01-01")])
+    second = FakeNewsletter("https://second.substack.com", [_post("https://second.substack.com", "b1", "2024-03-01")])
+
+    results = search_newsletters([first, second], "query")
+
+    assert _slugs(results.posts) == ["b1", "a1"]
+    assert first.sortings == ["new"]
+
+
+def test_unknown_sort_is_rejected() -> None:
+    """Only date and relevance ordering are supported."""
+    with pytest.raises(ValueError, match="sort_by"):
+        search_newsletters([], "query", sort_by="popularity")
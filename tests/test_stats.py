@@ -0,0 +1,73 @@
+"""Tests for the per-newsletter counters maintained with each insert."""
+
+from datetime import datetime
+
+from conftest import FakeSubstack
+
+from sloan_brain_substack.models import DatabaseManager
+from sloan_brain_substack.models import Newsletter as NewsletterModel
+from sloan_brain_substack.models import Post as PostModel
+from sloan_brain_substack.monitor import SubstackMonitor
+
+URL = "https://example.substack.com"
+
+
+def test_maintained_counters_match_a_rebuild(db_manager: DatabaseManager, substack: FakeSubstack) -> None:
+    """Counters kept in step with inserts and paywall flips need no correction."""
+    substack.publish(URL, "free")
+    first_paid = substack.publish(URL, "paid", audience="only_paid")
+    monitor = SubstackMonitor(db_manager, use_feed_probe=False)
+    monitor.add_newsletter(URL)
+    monitor.check_newsletter_updates(URL)
+
+    substack.publish(URL, "later")
+    substack.edit(first_paid["canonical_url"], audience="everyone")
+    monitor.check_newsletter_updates(URL)
+
+    stats = monitor.get_newsletter_stats(URL)
+    assert (stats["total_posts"], stats["free_posts"], stats["paid_posts"]) == (3, 3, 0)
+    assert monitor.rebuild_stats() == 0
+
+
+def test_rebuild_corrects_drift(db_manager: DatabaseManager, substack: FakeSubstack) -> None:
+    """Counters that drifted from the posts table are recomputed."""
+    substack.publish(URL, "first")
+    monitor = SubstackMonitor(db_manager)
+    monitor.add_newsletter(URL)
+    monitor.check_newsletter_updates(URL)
+    with db_manager.get_session() as session:
+        session.query(NewsletterModel).update({"post_count": 7})
+        session.commit()
+
+    assert monitor.rebuild_stats() == 1
+    assert monitor.get_newsletter_stats(URL)["total_posts"] == 1
+
+
+def test_first_fingerprint_corrects_is_free_of_old_posts(db_manager: DatabaseManager, substack: FakeSubstack) -> None:
+    """A paid post stored as free by an earlier version is corrected, counters included, without an event."""
+    item = substack.publish(URL, "old-paid", audience="only_paid")
+    monitor = SubstackMonitor(db_manager, use_feed_probe=False)
+    monitor.add_newsletter(URL)
+    with db_manager.get_session() as session:
+        newsletter = session.query(NewsletterModel).one()
+        session.add(
+            PostModel(
+                url=item["canonical_url"],
+                title=item["title"],
+                published_date=datetime(2024, 1, 1),
+                is_free=True,
+                newsletter_id=newsletter.id,
+            )
+        )
+        session.commit()
+    monitor.rebuild_stats()
+
+    result = monitor.check_newsletter_updates(URL)
+
+    assert (result.new_posts, result.changed_posts) == ([], [])
+    with db_manager.get_session() as session:
+        post = session.query(PostModel).one()
+        assert (post.audience, post.is_free) == ("only_paid", False)
+    stats = monitor.get_newsletter_stats(URL)
+    assert (stats["free_posts"], stats["paid_posts"]) == (0, 1)
+    assert monitor.rebuild_stats() == 0
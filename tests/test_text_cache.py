@@ -0,0 +1,117 @@
+"""Tests for memoizing the HTML to text conversion of post bodies."""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from sloan_brain_substack.client import Post, TextCache, set_text_cache
+from sloan_brain_substack.client import post as post_module
+from sloan_brain_substack.client.text_cache import get_text_cache
+
+BODY = "<p>Hello <b>world</b></p><script>track()</script>"
+
+
+@pytest.fixture
+def parses(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[str]]:
+    """Record every body Post actually parses, restoring the default text cache afterwards."""
+    calls: list[str] = []
+    parse = Post._parse_html_content
+
+    def _parse(self: Post, html_content: str) -> str:
+        calls.append(html_content)
+        return parse(self, html_content)
+
+    monkeypatch.setattr(Post, "_parse_html_content", _parse)
+    cache = get_text_cache()
+    yield calls
+    set_text_cache(cache)
+
+
+def _post(body: str, slug: str = "hello") -> Post:
+    """Create a Post whose data is already fetched, holding the given body."""
+    post = Post(f"https://example.substack.com/p/{slug}")
+    post._post_data = {"body_html": body, "audience": "everyone"}
+    return post
+
+
+def test_unchanged_body_is_parsed_once(parses: list[str]) -> None:
+    """The same body is parsed once, across calls and posts; a changed body is parsed again."""
+    set_text_cache(TextCache())
+
+    assert _post(BODY).get_content() == "Hello world"
+    assert _post(BODY, "copy").get_content() == "Hello world"
+    assert _post("<p>Changed</p>").get_content() == "Changed"
+
+    assert parses == [BODY, "<p>Changed</p>"]
+
+
+def test_persisted_texts_are_reused_across_caches(parses: list[str], tmp_path: Path) -> None:
+    """A cache on the same directory, as in a later run, doesn't parse the body again."""
+    set_text_cache(TextCache(directory=str(tmp_path)))
+    _post(BODY).get_content()
+
+    set_text_cache(TextCache(directory=str(tmp_path)))
+
+    assert _post(BODY).get_content() == "Hello world"
+    assert len(parses) == 1
+
+
+def test_parser_version_change_invalidates_cached_texts(
+    parses: list[str], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Texts cached by an older parser version are not reused."""
+    set_text_cache(TextCache(directory=str(tmp_path)))
+    _post(BODY).get_content()
+
+    monkeypatch.setattr(post_module, "PARSER_VERSION", post_module.PARSER_VERSION + 1)
+    _post(BODY).get_content()
+    _post(BODY).get_content()
+
+    assert len(parses) == 2
+
+
+def test_disabled_cache_parses_every_time(parses: list[str]) -> None:
+    """With caching disabled every call parses the body."""
+    set_text_cache(None)
+
+    _post(BODY).get_content()
+    _post(BODY).get_content()
+
+    assert len(parses) == 2
+
+
+def _age(path: Path, seconds: int) -> None:
+    """Set a file's modification time to the given number of seconds ago."""
+    stamp = os.stat(path).st_mtime - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def test_directory_keeps_the_most_recently_used_texts(tmp_path: Path) -> None:
+    """Past max_files the least recently used files are deleted; reading a file counts as using it."""
+    cache = TextCache(maxsize=1, directory=str(tmp_path), max_files=3)
+    for age, key in enumerate(["a", "b", "c"]):
+        cache.set(key, key.upper())
+        _age(tmp_path / f"{key}.txt", 100 - age)
+    assert cache.get("a") == "A"
+
+    cache.set("d", "D")
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["a.txt", "d.txt"]
+    assert TextCache(directory=str(tmp_path)).get("b") is None
+    assert TextCache(directory=str(tmp_path)).get("a") == "A"
+
+
+def test_directory_bound_counts_existing_files(tmp_path: Path) -> None:
+    """Files left by earlier runs count towards max_files; rewriting a key doesn't add a file."""
+    for key in ["a", "b", "c"]:
+        (tmp_path / f"{key}.txt").write_text(key)
+    cache = TextCache(directory=str(tmp_path), max_files=4)
+
+    cache.set("c", "C")
+    cache.set("d", "D")
+    assert len(list(tmp_path.iterdir())) == 4
+
+    cache.set("e", "E")
+    assert len(list(tmp_path.iterdir())) == 3
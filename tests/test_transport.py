@@ -0,0 +1,73 @@
+"""Tests for the httpx transport's requests-compatible responses and errors."""
+
+from typing import Callable
+
+import pytest
+import requests
+
+from sloan_brain_substack.client.transport import Http2Response, Http2Session
+
+httpx = pytest.importorskip("httpx")
+
+URL = "https://example.substack.com/api/v1/archive"
+
+
+def _session(handler: Callable[["httpx.Request"], "httpx.Response"]) -> Http2Session:
+    """Create an Http2Session whose requests are answered by ``handler`` instead of the network."""
+    session = Http2Session(http2=False)
+    session._client.close()
+    session._client = httpx.Client(transport=httpx.MockTransport(handler), headers=session.headers)
+    return session
+
+
+@pytest.mark.parametrize("status_code", [200, 204, 301, 399])
+def test_raise_for_status_accepts_non_error_codes(status_code: int) -> None:
+    """Responses below 400 don't raise."""
+    Http2Response(httpx.Response(status_code, request=httpx.Request("GET", URL))).raise_for_status()
+
+
+@pytest.mark.parametrize("status_code", [400, 404, 429, 500, 503])
+def test_raise_for_status_raises_requests_http_error(status_code: int) -> None:
+    """4xx and 5xx responses raise requests.HTTPError carrying the response, as requests does."""
+    response = Http2Response(httpx.Response(status_code, request=httpx.Request("GET", URL)))
+
+    with pytest.raises(requests.HTTPError, match=f"{status_code} Error for url: {URL}") as raised:
+        response.raise_for_status()
+    assert raised.value.response is response
+
+
+def test_response_exposes_requests_api() -> None:
+    """Body, headers, JSON and HTTP version are available under the requests names."""
+    with _session(lambda request: httpx.Response(200, json={"ok": True})) as session:
+        response = session.get(URL, params={"limit": 1})
+
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
+    assert response.content == b'{"ok":true}'
+    assert response.url == f"{URL}?limit=1"
+    assert response.http_version == "HTTP/1.1"
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (httpx.ConnectTimeout("connect timed out"), requests.Timeout),
+        (httpx.ReadTimeout("read timed out"), requests.Timeout),
+        (httpx.ConnectError("connection refused"), requests.ConnectionError),
+        (httpx.ReadError("connection reset"), requests.ConnectionError),
+        (httpx.RemoteProtocolError("server disconnected"), requests.RequestException),
+        (httpx.TooManyRedirects("redirect loop"), requests.RequestException),
+    ],
+)
+def test_transport_errors_map_to_requests_exceptions(error: Exception, expected: type[Exception]) -> None:
+    """Transport errors from httpx surface as the matching requests exception, chained to the original."""
+
+    def _fail(request: "httpx.Request") -> "httpx.Response":
+        raise error
+
+    with _session(_fail) as session, pytest.raises(expected) as raised:
+        session.get(URL)
+
+    assert raised.value.__cause__ is error
+    if expected is requests.RequestException:
+        assert not isinstance(raised.value, (requests.Timeout, requests.ConnectionError))